@@ -0,0 +1,132 @@
+from pygame.image import load as pygame_image_load
+from pygame.mixer import Sound as pygame_mixer_Sound
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from os import listdir as os_listdir
+from time import perf_counter
+
+# The path of the sounds folder (relative to the folder that the game is run from)
+SOUNDS_FOLDER = "sounds"
+
+class AssetLoader:
+
+    def __init__(self, asset_manager, start_time, sounds_folder = SOUNDS_FOLDER, maximum_number_of_workers = 4):
+
+        # Decodes every image / atlas file and sound used by the game on a pool of worker threads, so that the menu can be shown while the game's assets are loading
+        """ Notes:
+        - The worker threads only decode the files (i.e. pygame_image_load / pygame_mixer_Sound), converting images (convert / convert_alpha) still happens on the main thread when the asset manager first returns them, as converting needs the display
+        - Decoded images are handed to the asset manager as soon as they are decoded, so any image requested afterwards is only converted
+        - Loading the level waits for the loading to be completed, which only blocks if the player clicks "Play" before the loading has completed
+        - start_time = The time that the game was started (perf_counter), which the loading times are measured from
+        """
+
+        # The asset manager that the decoded images are handed to
+        self.asset_manager = asset_manager
+
+        # Pool of worker threads that decode the files
+        self.executor = ThreadPoolExecutor(max_workers = maximum_number_of_workers, thread_name_prefix = "AssetLoader")
+
+        # Dictionaries containing the future of every file being decoded
+        """ Format:
+        self.image_futures_dict[path] = future (result = decoded image)
+        self.sound_futures_dict[sound name] = future (result = sound)
+        """
+        self.image_futures_dict = {path: self.executor.submit(pygame_image_load, path) for path in asset_manager.find_files_to_load()}
+        self.sound_futures_dict = {file_name[:-len(".wav")]: self.executor.submit(pygame_mixer_Sound, f"{sounds_folder}/{file_name}") for file_name in sorted(os_listdir(sounds_folder)) if file_name.endswith(".wav")}
+
+        # Future that is completed once every file has been decoded (whether or not decoding the file succeeded)
+        self.completion_future = Future()
+
+        # The number of files decoded so far (updated from the worker threads, so a lock is used)
+        self.number_of_files = len(self.image_futures_dict) + len(self.sound_futures_dict)
+        self.number_of_files_loaded = 0
+        self.number_of_files_loaded_lock = Lock()
+
+        # Dictionary containing the loading times (in seconds, measured from the start time)
+        """ Format:
+        - TimeToFirstFrame = The time until the first frame (of the menu) was shown
+        - LoadingTime = The time until every file was decoded
+        - TimeToInteractive = The time until the first frame that was shown after every file was decoded (i.e. the first frame where clicking "Play" does not wait for the loading)
+        """
+        self.start_time = start_time
+        self.loading_times_dict = {"TimeToFirstFrame": None, "LoadingTime": None, "TimeToInteractive": None}
+
+        # Hand each decoded image to the asset manager, and count each decoded file
+        # Note: add_done_callback calls the function straight away if the file has already been decoded
+        for path, image_future in self.image_futures_dict.items():
+            image_future.add_done_callback(lambda image_future, path = path: self.on_image_decoded(path = path, image_future = image_future))
+        for sound_future in self.sound_futures_dict.values():
+            sound_future.add_done_callback(self.on_file_decoded)
+
+        # If there were no files to decode
+        if self.number_of_files == 0:
+            self.completion_future.set_result(None)
+            self.loading_times_dict["LoadingTime"] = perf_counter() - self.start_time
+
+    def on_image_decoded(self, path, image_future):
+
+        # Hands the decoded image to the asset manager (called from the worker thread that decoded the image)
+        # Note: If decoding the image failed, the asset manager will load the image itself when it is requested, raising the error on the main thread
+        if image_future.exception() == None:
+            self.asset_manager.add_decoded_file(path = path, decoded_image = image_future.result())
+
+        self.on_file_decoded(future = image_future)
+
+    def on_file_decoded(self, future):
+
+        # Counts the decoded file, completing the completion future once every file has been decoded (called from the worker thread that decoded the file)
+
+        with self.number_of_files_loaded_lock:
+            self.number_of_files_loaded += 1
+            loading_completed = self.number_of_files_loaded == self.number_of_files
+
+        if loading_completed == True:
+            self.loading_times_dict["LoadingTime"] = perf_counter() - self.start_time
+            self.completion_future.set_result(None)
+
+    def find_progress(self):
+
+        # Returns the fraction of the files that have been decoded (between 0 and 1)
+        return (self.number_of_files_loaded / self.number_of_files) if self.number_of_files > 0 else 1
+
+    def wait(self):
+
+        # Waits until every file has been decoded (returns immediately if the loading has already completed)
+        self.completion_future.result()
+
+    def get_sounds(self):
+
+        # Returns a dictionary of the sounds, waiting for them to be decoded if they have not been decoded yet (raising the error if decoding a sound failed)
+        """ Format:
+        sounds_dict[sound name] = sound
+        """
+        return {sound_name: sound_future.result() for sound_name, sound_future in self.sound_futures_dict.items()}
+
+    def update(self):
+
+        # Records the loading times, called after every frame has been shown
+        # Note: Returns True on the frame that the game became interactive (so that the loading report is only shown once)
+
+        # If this is the first frame
+        if self.loading_times_dict["TimeToFirstFrame"] == None:
+            self.loading_times_dict["TimeToFirstFrame"] = perf_counter() - self.start_time
+
+        # If this is the first frame after every file was decoded
+        if self.loading_times_dict["TimeToInteractive"] == None and self.completion_future.done() == True:
+            self.loading_times_dict["TimeToInteractive"] = perf_counter() - self.start_time
+
+            # The worker threads are no longer needed
+            self.executor.shutdown(wait = False)
+            return True
+
+        return False
+
+    def create_report(self):
+
+        # Returns the loading times and the number of files decoded
+        return "\n".join([
+                        f"Decoded {self.number_of_files_loaded} / {self.number_of_files} file(s) ({len(self.image_futures_dict)} image / atlas file(s), {len(self.sound_futures_dict)} sound(s))",
+                        f"Time to first frame: {self.loading_times_dict['TimeToFirstFrame'] * 1000:.2f} ms",
+                        f"Loading time: {self.loading_times_dict['LoadingTime'] * 1000:.2f} ms",
+                        f"Time to interactive: {self.loading_times_dict['TimeToInteractive'] * 1000:.2f} ms"
+                        ])
@@ -0,0 +1,363 @@
+from pygame.image import load as pygame_image_load
+from pygame.image import save as pygame_image_save
+from pygame.image import tobytes as pygame_image_tobytes
+from pygame.transform import flip as pygame_transform_flip
+from pygame.transform import scale as pygame_transform_scale
+from pygame import Surface as pygame_Surface
+from pygame import SRCALPHA as pygame_SRCALPHA
+from pygame import BLEND_RGBA_MAX as pygame_BLEND_RGBA_MAX
+from os import walk as os_walk
+from os import makedirs as os_makedirs
+from os.path import getsize as os_path_getsize
+from os.path import exists as os_path_exists
+from time import perf_counter
+
+# The paths of the graphics folder, the folder holding the atlases packed from it and the manifest generated from it (relative to the folder that the game is run from)
+GRAPHICS_FOLDER = "graphics"
+ATLAS_FOLDER = "graphics/Atlases"
+GRAPHICS_MANIFEST_PATH = "Files/Global/graphics_manifest.txt"
+
+# The maximum width of an atlas, and the maximum width / height of an image for it to be packed into an atlas (larger images, e.g. the controls display, are loaded from their own file)
+MAXIMUM_ATLAS_WIDTH = 1024
+MAXIMUM_ATLAS_FRAME_SIZE = 256
+
+def find_asset_group(path):
+
+    # Returns the asset group that an image belongs to (the folders inside the graphics folder, up to two folders deep)
+    # e.g. "graphics/Bosses/SikaDeer/Chase/0.png" > "Bosses/SikaDeer"
+    return "/".join(path.split("/")[1:-1][0:2])
+
+def pack_atlas(images_dict):
+
+    # Packs the images into rows (tallest images first), returning the atlas surface and the rect of each image inside the atlas
+    """ Format:
+    images_dict[path] = image
+    frame_rects_dict[path] = (x, y, width, height)
+    """
+
+    frame_rects_dict = {}
+    x = 0
+    y = 0
+    row_height = 0
+    atlas_width = 0
+
+    for path in sorted(images_dict.keys(), key = lambda path: (-images_dict[path].get_height(), path)):
+        width, height = images_dict[path].get_size()
+
+        # Start a new row if the image does not fit inside the current row
+        if x + width > MAXIMUM_ATLAS_WIDTH:
+            x = 0
+            y += row_height
+            row_height = 0
+
+        frame_rects_dict[path] = (x, y, width, height)
+        x += width
+        row_height = max(row_height, height)
+        atlas_width = max(atlas_width, x)
+
+    # Copy the images onto the atlas
+    # Note: BLEND_RGBA_MAX onto the fully transparent atlas copies the pixels exactly (a normal blit would blend the colours of partially transparent pixels)
+    atlas = pygame_Surface((atlas_width, y + row_height), pygame_SRCALPHA)
+    for path, frame_rect in frame_rects_dict.items():
+        atlas.blit(images_dict[path], frame_rect[0:2], special_flags = pygame_BLEND_RGBA_MAX)
+
+    return atlas, frame_rects_dict
+
+def generate_manifest(graphics_folder = GRAPHICS_FOLDER, atlas_folder = ATLAS_FOLDER, manifest_path = GRAPHICS_MANIFEST_PATH):
+
+    # Packs the images inside the graphics folder into one atlas per asset group, and generates the manifest of every image, returning the number of images and atlases
+    """ Format:
+    Each line holds the path of an image (with "/" separators) and the size of the file in bytes, followed by the path of its atlas and its (x, y, width, height) inside the atlas if it was packed into an atlas, all separated by tabs
+    e.g. graphics/Bosses/SikaDeer/Chase/0.png	1234	graphics/Atlases/Bosses_SikaDeer.png	0	0	60	66
+    e.g. graphics/Misc/ControlsDisplay.png	56789
+    """
+
+    image_paths_list = []
+
+    for folder, folder_names, file_names in os_walk(graphics_folder):
+        for file_name in file_names:
+            if file_name.lower().endswith(".png"):
+                image_path = f"{folder}/{file_name}".replace("\\", "/")
+
+                # Skip the atlases themselves
+                if image_path.startswith(atlas_folder + "/") == False:
+                    image_paths_list.append(image_path)
+
+    # Group the images that are small enough to be packed into atlases
+    """ Format:
+    atlas_images_dict[asset group] = {path: image, ...}
+    """
+    atlas_images_dict = {}
+    for image_path in image_paths_list:
+        image = pygame_image_load(image_path)
+        if max(image.get_size()) <= MAXIMUM_ATLAS_FRAME_SIZE:
+            atlas_images_dict.setdefault(find_asset_group(path = image_path), {})[image_path] = image
+
+    # Pack and save the atlas of each asset group
+    """ Format:
+    atlas_frames_dict[path] = (atlas path, (x, y, width, height))
+    """
+    atlas_frames_dict = {}
+    os_makedirs(atlas_folder, exist_ok = True)
+
+    for asset_group, images_dict in atlas_images_dict.items():
+        atlas, frame_rects_dict = pack_atlas(images_dict = images_dict)
+        atlas_path = f"{atlas_folder}/{asset_group.replace('/', '_')}.png"
+        pygame_image_save(atlas, atlas_path)
+
+        for image_path, frame_rect in frame_rects_dict.items():
+            atlas_frames_dict[image_path] = (atlas_path, frame_rect)
+
+    with open(manifest_path, "w") as manifest_file:
+        for image_path in sorted(image_paths_list):
+            if image_path in atlas_frames_dict:
+                atlas_path, frame_rect = atlas_frames_dict[image_path]
+                manifest_file.write(f"{image_path}\t{os_path_getsize(image_path)}\t{atlas_path}\t{frame_rect[0]}\t{frame_rect[1]}\t{frame_rect[2]}\t{frame_rect[3]}\n")
+            else:
+                manifest_file.write(f"{image_path}\t{os_path_getsize(image_path)}\n")
+
+    return len(image_paths_list), len(atlas_images_dict)
+
+def check_atlases(manifest_path = GRAPHICS_MANIFEST_PATH):
+
+    # Checks that every image packed into an atlas is identical to its own file, returning the paths of the images that are not
+
+    mismatched_paths_list = []
+    atlases_dict = {}
+
+    with open(manifest_path, "r") as manifest_file:
+        for line in manifest_file.readlines():
+            fields = line.rstrip("\n").split("\t")
+
+            # If the image was packed into an atlas
+            if len(fields) == 7:
+                if fields[2] not in atlases_dict:
+                    atlases_dict[fields[2]] = pygame_image_load(fields[2])
+                frame = atlases_dict[fields[2]].subsurface(tuple(int(field) for field in fields[3:7]))
+
+                if pygame_image_tobytes(frame, "RGBA") != pygame_image_tobytes(pygame_image_load(fields[0]), "RGBA"):
+                    mismatched_paths_list.append(fields[0])
+
+    return mismatched_paths_list
+
+class AssetManager:
+
+    def __init__(self, manifest_path = GRAPHICS_MANIFEST_PATH):
+
+        # Loads every image used by the game, loading each file only once (from the manifest of the graphics folder)
+        """ Notes:
+        - The manifest lists every image inside the graphics folder, so animations are found without listing the folder, and paths are found regardless of their capitalisation (e.g. "DownRight" and "Downright")
+        - Images are loaded (and converted) the first time they are requested, and every request afterwards returns the same surface, so images shared between objects (e.g. the death animation) are only held in memory once
+        - Images packed into an atlas are subsurfaces of the atlas (which is loaded once for the entire asset group), so they share the atlas' pixels instead of holding a copy
+        - Flipped and scaled variants are created from the loaded image, and are also only created once
+        - Images are never modified after being loaded, so they must not be drawn onto / changed by the objects that use them
+        """
+
+        # Dictionary containing the path, file size and atlas frame of every image inside the manifest
+        """ Format:
+        self.files_dict[lower-case path] = (path, file size in bytes, atlas path, (x, y, width, height))
+        - The atlas path and frame are None for images that were not packed into an atlas
+        """
+        self.files_dict = {}
+
+        # Dictionary containing the paths of the images inside each folder
+        """ Format:
+        self.folders_dict[lower-case folder] = [path, ...]
+        """
+        self.folders_dict = {}
+
+        # Generate the manifest if it has not been generated yet
+        if os_path_exists(manifest_path) == False:
+            generate_manifest(manifest_path = manifest_path)
+
+        with open(manifest_path, "r") as manifest_file:
+            for line in manifest_file.readlines():
+                fields = line.rstrip("\n").split("\t")
+                path = fields[0]
+
+                # If the image was packed into an atlas
+                if len(fields) == 7:
+                    self.files_dict[path.lower()] = (path, int(fields[1]), fields[2], tuple(int(field) for field in fields[3:7]))
+                else:
+                    self.files_dict[path.lower()] = (path, int(fields[1]), None, None)
+
+                self.folders_dict.setdefault(path.rsplit("/", 1)[0].lower(), []).append(path)
+
+        # Dictionary containing every image (and variant of an image) that has been loaded
+        """ Format:
+        self.images_dict[(path, alpha, flip_x, flip_y, scale, size)] = image
+        """
+        self.images_dict = {}
+
+        # Dictionary containing every atlas that has been loaded
+        """ Format:
+        self.atlases_dict[(atlas path, alpha)] = atlas
+        """
+        self.atlases_dict = {}
+
+        # Dictionary containing the image / atlas files that have been decoded ahead of time (by the asset loader), which have not been converted yet
+        """ Format:
+        self.decoded_files_dict[path] = decoded image
+        """
+        self.decoded_files_dict = {}
+
+        # Dictionary containing the load time and bytes of each asset group (the folders inside the graphics folder, up to two folders deep, e.g. "Bosses/SikaDeer" or "Misc")
+        """ Format:
+        self.asset_groups_dict[group] = {"NumberOfImages": 0, "SharedReferences": 0, "LoadTime": 0, "FileBytes": 0, "SurfaceBytes": 0}
+        - NumberOfImages = The number of surfaces created (including variants)
+        - SharedReferences = The number of requests that returned an image which had already been created
+        - LoadTime = The time spent loading, converting, flipping and scaling images (in seconds)
+        - FileBytes = The size of the image / atlas files loaded
+        - SurfaceBytes = The memory used by the surfaces created (subsurfaces of an atlas use the atlas' memory, so only the atlas itself is counted)
+        """
+        self.asset_groups_dict = {}
+
+    def find_path(self, path):
+
+        # Returns the path of the image with the same capitalisation as the manifest
+
+        # If the image is not inside the manifest
+        if path.lower() not in self.files_dict:
+            raise FileNotFoundError(f"{path} is not inside the graphics manifest (re-generate the manifest by running Files/Global/asset_manager.py)")
+
+        return self.files_dict[path.lower()][0]
+
+    def count_images(self, folder):
+
+        # Returns the number of images inside the folder (i.e. the number of frames of an animation)
+        return len(self.folders_dict.get(folder.lower(), ()))
+
+    def find_paths(self, folder):
+
+        # Returns a tuple of the paths of the images inside the folder
+        return tuple(self.folders_dict.get(folder.lower(), ()))
+
+    def find_asset_group(self, path):
+
+        # Returns the statistics of the asset group that the image belongs to
+
+        group = find_asset_group(path = path)
+
+        if group not in self.asset_groups_dict:
+            self.asset_groups_dict[group] = {"NumberOfImages": 0, "SharedReferences": 0, "LoadTime": 0, "FileBytes": 0, "SurfaceBytes": 0}
+
+        return self.asset_groups_dict[group]
+
+    def get_image(self, path, alpha = True, flip_x = False, flip_y = False, scale = 1, size = None):
+
+        # Returns the image at the path, loading / creating it if it has not been requested before
+        """ Notes:
+        - alpha = Whether the image is converted with convert_alpha (for images with transparency) or convert (for opaque images, e.g. tiles)
+        - flip_x / flip_y = Whether the image is flipped horizontally / vertically
+        - scale = The number that the width and height of the image are multiplied by
+        - size = The (width, height) that the image is scaled to (instead of the scale)
+        """
+
+        path = self.find_path(path = path)
+        image_key = (path, alpha, flip_x, flip_y, scale, size)
+        asset_group = self.find_asset_group(path = path)
+
+        # If the image has already been created, return the same image
+        if image_key in self.images_dict:
+            asset_group["SharedReferences"] += 1
+            return self.images_dict[image_key]
+
+        # If this is a variant of the image, create it from the loaded image
+        if flip_x == True or flip_y == True or scale != 1 or size != None:
+            loaded_image = self.get_image(path = path, alpha = alpha)
+            start_time = perf_counter()
+
+            image = loaded_image
+            if flip_x == True or flip_y == True:
+                image = pygame_transform_flip(image, flip_x, flip_y)
+            if scale != 1 or size != None:
+                image = pygame_transform_scale(image, size if size != None else (image.get_width() * scale, image.get_height() * scale))
+
+        # If this is the image itself
+        else:
+            file_size, atlas_path, frame_rect = self.files_dict[path.lower()][1:4]
+
+            # If the image was packed into an atlas, use the frame of the atlas
+            if atlas_path != None:
+                atlas = self.get_atlas(atlas_path = atlas_path, alpha = alpha, asset_group = asset_group)
+                start_time = perf_counter()
+                image = atlas.subsurface(frame_rect)
+
+            # Otherwise, load it from its own file
+            else:
+                start_time = perf_counter()
+                image = self.load_file(path = path).convert_alpha() if alpha == True else self.load_file(path = path).convert()
+                asset_group["FileBytes"] += file_size
+
+        # Update the statistics of the asset group
+        asset_group["LoadTime"] += perf_counter() - start_time
+        asset_group["NumberOfImages"] += 1
+        if image.get_parent() == None:
+            asset_group["SurfaceBytes"] += image.get_pitch() * image.get_height()
+
+        self.images_dict[image_key] = image
+        return image
+
+    def find_files_to_load(self):
+
+        # Returns a tuple of the files that need to be loaded for every image inside the manifest (i.e. each atlas once, and the images that were not packed into an atlas)
+        return tuple(sorted(set(atlas_path if atlas_path != None else path for path, file_size, atlas_path, frame_rect in self.files_dict.values())))
+
+    def add_decoded_file(self, path, decoded_image):
+
+        # Adds an image / atlas file that has been decoded ahead of time, so that it is only converted when it is first requested
+        # Note: This is called from the asset loader's worker threads, so it only sets a single dictionary item
+        self.decoded_files_dict[path] = decoded_image
+
+    def load_file(self, path):
+
+        # Returns the decoded image / atlas file at the path, using the file decoded ahead of time if there is one (which is then removed, as it is only converted once)
+        decoded_image = self.decoded_files_dict.pop(path, None)
+        return decoded_image if decoded_image != None else pygame_image_load(path)
+
+    def get_atlas(self, atlas_path, alpha, asset_group):
+
+        # Returns the atlas at the path, loading it if it has not been requested before
+
+        if (atlas_path, alpha) not in self.atlases_dict:
+            start_time = perf_counter()
+            atlas = self.load_file(path = atlas_path).convert_alpha() if alpha == True else self.load_file(path = atlas_path).convert()
+
+            # Update the statistics of the asset group
+            asset_group["LoadTime"] += perf_counter() - start_time
+            asset_group["FileBytes"] += os_path_getsize(atlas_path)
+            asset_group["SurfaceBytes"] += atlas.get_pitch() * atlas.get_height()
+
+            self.atlases_dict[(atlas_path, alpha)] = atlas
+
+        return self.atlases_dict[(atlas_path, alpha)]
+
+    def get_animation(self, folder, alpha = True, flip_x = False, flip_y = False, scale = 1, size = None):
+
+        # Returns a tuple of the frames of the animation inside the folder (the frames are named "0.png", "1.png", and so on)
+        return tuple(self.get_image(path = f"{folder}/{i}.png", alpha = alpha, flip_x = flip_x, flip_y = flip_y, scale = scale, size = size) for i in range(0, self.count_images(folder = folder)))
+
+    def create_report(self):
+
+        # Returns a table of the load time and bytes of each asset group
+
+        report_lines_list = [f"{'Asset group':<28}{'Images':>8}{'Shared':>8}{'Load time (ms)':>16}{'File bytes':>12}{'Surface bytes':>15}"]
+
+        for group, statistics in sorted(self.asset_groups_dict.items()):
+            report_lines_list.append(f"{group:<28}{statistics['NumberOfImages']:>8}{statistics['SharedReferences']:>8}{statistics['LoadTime'] * 1000:>16.2f}{statistics['FileBytes']:>12}{statistics['SurfaceBytes']:>15}")
+
+        return "\n".join(report_lines_list)
+
+# The asset manager used by the entire game
+asset_manager = AssetManager()
+
+if __name__ == "__main__":
+
+    # Re-packs the atlases and re-generates the manifest of the graphics folder, then checks the atlases against the images (run from the folder that the game is run from)
+    number_of_images, number_of_atlases = generate_manifest()
+
+    mismatched_paths_list = check_atlases()
+    if len(mismatched_paths_list) > 0:
+        raise SystemExit(f"The atlas frames of {', '.join(mismatched_paths_list)} do not match their images")
+
+    print(f"Added {number_of_images} image(s) to {GRAPHICS_MANIFEST_PATH}, packed into {number_of_atlases} atlas(es) inside {ATLAS_FOLDER}")
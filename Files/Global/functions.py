@@ -1,61 +1,319 @@
 from pygame.transform import smoothscale
+from pygame.transform import rotozoom as pygame_transform_rotozoom
 from pygame import Surface as pygame_Surface
 from pygame import BLEND_RGB_ADD as pygame_BLEND_RGB_ADD
-from math import sin, radians
+from pygame.mask import from_surface as pygame_mask_from_surface
+from math import sin, radians, degrees
+from collections import OrderedDict
+from pygame import Color as pygame_Color
+from Global.glyph_atlas import GlyphAtlas
+
+# Dictionary containing the cache of text images rendered by draw_text
+""" Format:
+text_images_cache_dict["Images"][(text, id(font), text colour, anti-aliased, scale multiplier)] = (font, text image)
+
+Notes:
+- The font is kept inside of each entry so that the id of the font cannot be re-used by a different font whilst the entry is inside the cache
+- The least recently used entry is removed once there are more than "MaximumNumberOfImages" entries
+"""
+text_images_cache_dict = {
+                        "Images": OrderedDict(),
+                        "MaximumNumberOfImages": 256,
+                        "Hits": 0,
+                        "Misses": 0
+                        }
 
 def draw_text(text, text_colour, font, x, y, surface, scale_multiplier = None):
 
+    # Draws the text onto the surface, only rendering the text image if the same text has not been rendered recently
+    # Note: Anti-aliasing is only used if a scale multiplier has been passed in (the text is smoothscaled)
+
+    # The key of the text image inside the cache (colours passed in as lists are converted to tuples)
+    cache_key = (text, id(font), text_colour if type(text_colour) == str else tuple(text_colour), scale_multiplier != None, scale_multiplier)
+
+    # If this text has already been rendered
+    if cache_key in text_images_cache_dict["Images"]:
+        # Mark the entry as the most recently used entry
+        text_images_cache_dict["Images"].move_to_end(cache_key)
+        text_images_cache_dict["Hits"] += 1
+
+        # Blit the image onto the surface
+        surface.blit(text_images_cache_dict["Images"][cache_key][1], (x, y))
+        return
+
+    text_images_cache_dict["Misses"] += 1
+
     # If a scale multiplier has not been passed in
     if scale_multiplier == None:
         # Render the text as an image without anti-aliasing
         text_image = font.render(text, False, text_colour)
-        # Blit the image onto the surface
-        surface.blit(text_image, (x, y))
 
     # If a scale multiplier has been passed in
     elif scale_multiplier != None:
-        # Render the text as an image with anti-aliasing
+        # Render the text as an image with anti-aliasing and smoothscale it
         text_image = font.render(text, True, text_colour)
-        # Smoothscale and blit the image onto the surface
-        surface.blit(smoothscale(text_image, (text_image.get_width() / scale_multiplier, text_image.get_height() / scale_multiplier)), (x, y))
+        text_image = smoothscale(text_image, (text_image.get_width() / scale_multiplier, text_image.get_height() / scale_multiplier))
+
+    # Add the text image to the cache
+    text_images_cache_dict["Images"][cache_key] = (font, text_image)
+
+    # If there are too many entries inside the cache, remove the least recently used entry
+    if len(text_images_cache_dict["Images"]) > text_images_cache_dict["MaximumNumberOfImages"]:
+        text_images_cache_dict["Images"].popitem(last = False)
+
+    # Blit the image onto the surface
+    surface.blit(text_image, (x, y))
+
+# Dictionary containing the glyph atlases used by draw_atlas_text
+""" Format:
+glyph_atlases_dict["Atlases"][(id(font), text colour, scale multiplier)] = GlyphAtlas
+
+Notes:
+- Each atlas keeps a reference to its font, so that the id of the font cannot be re-used by a different font whilst the atlas is inside the dictionary
+- The least recently used atlas is removed once there are more than "MaximumNumberOfAtlases" atlases (e.g. after the fonts have been re-created when restarting the game)
+"""
+glyph_atlases_dict = {
+                    "Atlases": OrderedDict(),
+                    "MaximumNumberOfAtlases": 32
+                    }
+
+def draw_atlas_text(text, text_colour, font, x, y, surface, scale_multiplier = None):
+
+    # Draws text that changes often (e.g. numbers, stats) onto the surface using the glyph atlas of the font, so that the text is never rendered by the font at runtime
+    # Note: Takes the same arguments as draw_text, and falls back to draw_text if the text contains a character that is not inside the atlas
+
+    # The key of the atlas (colours passed in as names or lists are converted to tuples)
+    atlas_key = (id(font), tuple(pygame_Color(text_colour)), scale_multiplier)
+
+    # If the atlas for this font, colour and scale multiplier has not been built yet
+    if atlas_key not in glyph_atlases_dict["Atlases"]:
+
+        # Build the atlas
+        glyph_atlases_dict["Atlases"][atlas_key] = GlyphAtlas(font = font, text_colour = text_colour, scale_multiplier = scale_multiplier)
+
+        # If there are too many atlases inside the dictionary, remove the least recently used atlas
+        if len(glyph_atlases_dict["Atlases"]) > glyph_atlases_dict["MaximumNumberOfAtlases"]:
+            glyph_atlases_dict["Atlases"].popitem(last = False)
+
+    # Mark the atlas as the most recently used atlas
+    glyph_atlases_dict["Atlases"].move_to_end(atlas_key)
+    glyph_atlas = glyph_atlases_dict["Atlases"][atlas_key]
+
+    # If every character of the text is inside the atlas
+    if all(character in glyph_atlas.glyph_rects_dict for character in text):
+        # Draw the text using the atlas
+        glyph_atlas.draw(text = text, x = x, y = y, surface = surface)
+
+    # If the text contains characters that are not inside the atlas
+    else:
+        # Render the text normally
+        draw_text(text = text, text_colour = text_colour, font = font, x = x, y = y, surface = surface, scale_multiplier = scale_multiplier)
+
+# Dictionary containing the masks of images, so that each mask is only built once for each distinct image (e.g. animation frames, tile images)
+""" Format:
+mask_registry_dict["Masks"][id(image)] = (image, mask)
+
+Notes:
+- The image is kept inside of each entry so that the id of the image cannot be re-used by a different surface whilst the entry is inside the registry
+- The least recently used entry is removed once there are more than "MaximumNumberOfMasks" entries
+- "MasksBuiltThisFrame" is reset at the start of every frame (after being saved as "MasksBuiltLastFrame"), so that the number of masks built per frame can be checked (it should be 0 most of the time)
+"""
+mask_registry_dict = {
+                    "Masks": OrderedDict(),
+                    "MaximumNumberOfMasks": 2048,
+                    "MasksBuiltThisFrame": 0,
+                    "MasksBuiltLastFrame": 0,
+                    "TotalMasksBuilt": 0
+                    }
+
+def get_mask(image):
+
+    # Returns the mask of an image, only building the mask if it has not already been built
+
+    # If the mask for this image has already been built
+    if id(image) in mask_registry_dict["Masks"]:
+        # Mark the entry as the most recently used entry
+        mask_registry_dict["Masks"].move_to_end(id(image))
+
+        # Return the mask
+        return mask_registry_dict["Masks"][id(image)][1]
+
+    # Build the mask and add it to the registry
+    mask = pygame_mask_from_surface(image)
+    register_mask(image = image, mask = mask)
+    mask_registry_dict["MasksBuiltThisFrame"] += 1
+    mask_registry_dict["TotalMasksBuilt"] += 1
+
+    return mask
+
+def register_mask(image, mask):
+
+    # Adds the mask of an image to the registry as the most recently used entry (e.g. for images whose masks are the same as another image's mask)
+
+    mask_registry_dict["Masks"][id(image)] = (image, mask)
+    mask_registry_dict["Masks"].move_to_end(id(image))
+
+    # If there are too many entries inside the registry, remove the least recently used entries
+    while len(mask_registry_dict["Masks"]) > mask_registry_dict["MaximumNumberOfMasks"]:
+        mask_registry_dict["Masks"].popitem(last = False)
+
+def reset_mask_registry_frame_count():
+
+    # Saves the number of masks built during the last frame and resets the count for the new frame
+    mask_registry_dict["MasksBuiltLastFrame"] = mask_registry_dict["MasksBuiltThisFrame"]
+    mask_registry_dict["MasksBuiltThisFrame"] = 0
+
+# Dictionary containing the cache of tinted images created by change_image_colour
+""" Format:
+change_image_colour_cache_dict["Images"][(id(source image), quantized colour)] = (source image, tinted image)
+
+Notes:
+- The source image is kept inside of each entry so that the id of the source image cannot be re-used by a different surface whilst the entry is inside the cache
+- The least recently used entry is removed once there are more than "MaximumNumberOfImages" entries
+- Colours are rounded to the nearest multiple of "ColourQuantizationStep", so that colours that change continuously (e.g. the frenzy mode colour) can still re-use the tinted images
+"""
+change_image_colour_cache_dict = {
+                                "Images": OrderedDict(),
+                                "MaximumNumberOfImages": 1024,
+                                "ColourQuantizationStep": 8,
+                                "Hits": 0,
+                                "Misses": 0
+                                }
 
 def change_image_colour(current_animation_image, desired_colour = (255, 255, 255)): # Default colour is white
 
+        # Note: The returned image is shared with other calls, so it should not be drawn onto / modified
+
+        # Round the desired colour to the nearest multiple of the colour quantization step (limited to 255)
+        desired_colour = tuple(min(int(round(desired_colour[i] / change_image_colour_cache_dict["ColourQuantizationStep"]) * change_image_colour_cache_dict["ColourQuantizationStep"]), 255) for i in range(0, 3))
+
+        # The key of the tinted image inside the cache
+        cache_key = (id(current_animation_image), desired_colour)
+
+        # If this image has already been tinted with this colour
+        if cache_key in change_image_colour_cache_dict["Images"]:
+            # Mark the entry as the most recently used entry
+            change_image_colour_cache_dict["Images"].move_to_end(cache_key)
+            change_image_colour_cache_dict["Hits"] += 1
+
+            # Return the tinted image
+            return change_image_colour_cache_dict["Images"][cache_key][1]
+
+        change_image_colour_cache_dict["Misses"] += 1
+
         # Create a new surface which will be blended with the current (animation) image to make an image change colour
         colour_layer = pygame_Surface(current_animation_image.get_size()).convert_alpha()
 
         # Fill the colour layer with the desired colour
         colour_layer.fill(desired_colour)
         
-        # Set the current (animation) image to be a copy of the current (animation) image (so that the original image is not overwritten)
-        current_animation_image = current_animation_image.copy()
+        # Set the tinted image to be a copy of the current (animation) image (so that the original image is not overwritten)
+        tinted_image = current_animation_image.copy()
         
-        # Blit the colour layer onto the current (animation) image, with the special flag pygame_BLEND_RGB_ADD to add the RGB values
-        current_animation_image.blit(colour_layer, (0, 0), special_flags = pygame_BLEND_RGB_ADD)
+        # Blit the colour layer onto the tinted image, with the special flag pygame_BLEND_RGB_ADD to add the RGB values
+        tinted_image.blit(colour_layer, (0, 0), special_flags = pygame_BLEND_RGB_ADD)
+
+        # Add the tinted image to the cache
+        change_image_colour_cache_dict["Images"][cache_key] = (current_animation_image, tinted_image)
+
+        # Register the mask of the tinted image as the mask of the current (animation) image (the alpha values are not changed, so the masks are the same)
+        register_mask(image = tinted_image, mask = get_mask(image = current_animation_image))
+
+        # If there are too many entries inside the cache, remove the least recently used entry
+        if len(change_image_colour_cache_dict["Images"]) > change_image_colour_cache_dict["MaximumNumberOfImages"]:
+            evicted_source_image, evicted_tinted_image = change_image_colour_cache_dict["Images"].popitem(last = False)[1]
+
+            # Remove the mask of the evicted tinted image from the mask registry, so that the tinted image is not kept alive by the registry
+            # Note: The tinted image is still alive here, so its id cannot belong to a different surface
+            mask_registry_dict["Masks"].pop(id(evicted_tinted_image), None)
 
         # Return the coloured animation image (The result should be an image that has a different colour on top)
-        return current_animation_image
+        return tinted_image
 
-def change_image_colour_v2(current_animation_image, desired_colour):
+# Dictionary containing the pre-rendered rotated versions of images (and their masks)
+""" Format:
+rotated_images_cache_dict["Images"][(id(source image), scale)] = {"SourceImage": source image, "RotatedImages": [rotated image at each angle], "Masks": [mask of the rotated image at each angle]}
 
-    # Changes the image colour completely, without flags
+Notes:
+- Angles are rounded to the nearest of "NumberOfAngles" evenly spaced angles (e.g. 360 = every 1 degree)
+- The source image is kept inside of each entry so that the id of the source image cannot be re-used by a different surface
+"""
+rotated_images_cache_dict = {
+                            "NumberOfAngles": 360,
+                            "Images": {}
+                            }
 
-    # Create a copy of the image (So that you don't overwrite the original)
-    changed_image = current_animation_image.copy().convert_alpha()
+def get_rotated_image(image, angle, scale = 1):
 
-      # For each row
-    for i in range(0, changed_image.get_width()):
-        # For each column
-        for j in range(0, changed_image.get_height()):
-            
-            # If the pixel is not fully transparent
-            if changed_image.get_at((i, j)).a != 0:
-                # Set the pixel as the desired colour
-                changed_image.set_at((i, j), (desired_colour[0], desired_colour[1], desired_colour[2], 255))
+    # Returns the rotated image and its mask, for the image rotated at the angle (in radians)
+    # Note: All of the angles are pre-rendered the first time an image is rotated, so that every rotation afterwards is only a look-up
+
+    # The key of the image inside the cache
+    cache_key = (id(image), scale)
+
+    # If the rotated images of this image have not been created yet
+    if cache_key not in rotated_images_cache_dict["Images"]:
+
+        # The converted source image
+        converted_image = image.convert_alpha()
+
+        # Create the rotated images at each angle
+        rotated_images_list = [pygame_transform_rotozoom(converted_image, (360 / rotated_images_cache_dict["NumberOfAngles"]) * i, scale) for i in range(0, rotated_images_cache_dict["NumberOfAngles"])]
+
+        # Add the rotated images and their masks to the cache
+        rotated_images_cache_dict["Images"][cache_key] = {
+                                                        "SourceImage": image,
+                                                        "RotatedImages": rotated_images_list,
+                                                        "Masks": [pygame_mask_from_surface(rotated_image) for rotated_image in rotated_images_list]
+                                                        }
+
+    # Find the index of the closest pre-rendered angle
+    angle_index = round(degrees(angle) / (360 / rotated_images_cache_dict["NumberOfAngles"])) % rotated_images_cache_dict["NumberOfAngles"]
+
+    # Return the rotated image and its mask
+    return rotated_images_cache_dict["Images"][cache_key]["RotatedImages"][angle_index], rotated_images_cache_dict["Images"][cache_key]["Masks"][angle_index]
+
+def change_image_colour_v2(current_animation_image, desired_colour):
+
+    # Changes the image colour completely, without flags (i.e. creates a solid silhouette of the image)
+    """ Note: A mask of all the pixels that are not fully transparent (alpha greater than 0) is turned into a surface in one go, rather than changing each pixel one at a time"""
+
+    # Create the silhouette, setting all of the pixels that are not fully transparent as the desired colour (the other pixels are fully transparent)
+    changed_image = pygame_mask_from_surface(current_animation_image, 0).to_surface(setcolor = (desired_colour[0], desired_colour[1], desired_colour[2], 255), unsetcolor = (0, 0, 0, 0)).convert_alpha()
 
     # Return the changed image
     return changed_image
 
+def create_silhouette_images_dict(images, desired_colour, silhouette_images_dict = None):
+
+    # Creates the silhouettes of all the images inside of a (nested) dictionary / tuple of images, so that they do not need to be created whilst playing
+    """ Format:
+    silhouette_images_dict[image] = silhouette image
+    """
+
+    # If this is the first call (i.e. not a nested dictionary / tuple)
+    if silhouette_images_dict == None:
+        silhouette_images_dict = {}
+
+    # Identify the type of images
+    match images:
+
+        # Dictionaries
+        case dict():
+            for nested_images in images.values():
+                create_silhouette_images_dict(images = nested_images, desired_colour = desired_colour, silhouette_images_dict = silhouette_images_dict)
+
+        # Tuples or lists
+        case tuple() | list():
+            for nested_images in images:
+                create_silhouette_images_dict(images = nested_images, desired_colour = desired_colour, silhouette_images_dict = silhouette_images_dict)
+
+        # Images
+        case _:
+            silhouette_images_dict[images] = change_image_colour_v2(current_animation_image = images, desired_colour = desired_colour)
+
+    return silhouette_images_dict
+
 def sin_change_object_colour(current_sin_angle, angle_time_gradient, colour_to_change, original_colour, delta_time, plus_or_minus_list, min_max_colours):
 
         """ Explanations of parameters:
@@ -0,0 +1,125 @@
+from pygame import Surface as pygame_Surface
+from pygame import SRCALPHA as pygame_SRCALPHA
+from pygame import Rect as pygame_Rect
+from pygame.transform import smoothscale
+from math import ceil
+
+class GlyphAtlas:
+
+    # The characters that are pre-rendered onto each atlas (all of the printable ASCII characters)
+    characters = "".join(chr(character_code) for character_code in range(32, 127))
+
+    # The maximum width of an atlas surface in pixels (glyphs are placed onto the next row once a row is full)
+    maximum_atlas_width = 1024
+
+    def __init__(self, font, text_colour, scale_multiplier = None):
+
+        # Pre-renders every character of the font in the text colour onto a single atlas surface
+        """ Notes:
+        - Text is drawn by blitting the area of each glyph from the atlas surface, so that strings that change constantly (e.g. numbers) are never rendered by the font at runtime
+        - Anti-aliasing is only used if a scale multiplier has been passed in (the glyphs are smoothscaled), the same as draw_text
+        """
+
+        # The font of the atlas (also keeps the font alive, so that the id of the font cannot be re-used by a different font whilst the atlas exists)
+        self.font = font
+
+        # The scale multiplier that the glyphs were scaled down by
+        self.scale_multiplier = 1 if scale_multiplier == None else scale_multiplier
+
+        # The number of sub-pixel positions that each glyph is pre-rendered at
+        # Note: When the glyphs are scaled down, a glyph can start part of the way through a pixel (e.g. an advance of 15 with a scale multiplier of 2), so each glyph is pre-rendered at every position a glyph can start at within a pixel
+        self.number_of_phases = int(self.scale_multiplier) if self.scale_multiplier == int(self.scale_multiplier) else 1
+
+        # The metrics of each character (None if the font does not have a glyph for the character)
+        character_metrics_list = font.metrics(GlyphAtlas.characters)
+
+        # Dictionary containing the distance that the pen moves along after drawing each character (at the font's original size)
+        self.advances_dict = {}
+
+        # List containing the (character, phase, glyph image) of each glyph
+        glyph_images_list = []
+
+        for character, character_metrics in zip(GlyphAtlas.characters, character_metrics_list):
+
+            # If a scale multiplier has not been passed in
+            if scale_multiplier == None:
+                # Render the glyph without anti-aliasing
+                glyph_images_list.append((character, 0, font.render(character, False, text_colour)))
+
+            # If a scale multiplier has been passed in
+            elif scale_multiplier != None:
+
+                # Render the glyph with anti-aliasing
+                glyph_image = font.render(character, True, text_colour)
+
+                for phase in range(0, self.number_of_phases):
+
+                    # Draw the glyph "phase" pixels from the left of a transparent surface (with a width that is a multiple of the scale multiplier, so that no column is lost when scaling)
+                    phase_glyph_image = pygame_Surface((ceil((glyph_image.get_width() + phase) / self.number_of_phases) * self.number_of_phases, glyph_image.get_height()), pygame_SRCALPHA)
+                    phase_glyph_image.blit(glyph_image, (phase, 0))
+
+                    # Smoothscale the glyph
+                    glyph_images_list.append((character, phase, smoothscale(phase_glyph_image, (phase_glyph_image.get_width() / scale_multiplier, phase_glyph_image.get_height() / scale_multiplier))))
+
+            # Save the advance of the character (using the width of the rendered glyph if the font has no metrics for the character)
+            self.advances_dict[character] = character_metrics[4] if character_metrics != None else font.size(character)[0]
+
+        # --------------------------------------------------------------------------------------------------------
+        # Packing the glyphs into rows
+
+        # Dictionary containing the area of each glyph on the atlas surface
+        """ Format:
+        self.glyph_rects_dict[character] = [glyph rect at phase 0, glyph rect at phase 1, ...]
+        """
+        self.glyph_rects_dict = {character: [] for character in GlyphAtlas.characters}
+
+        # The position of the next glyph on the atlas surface
+        glyph_x = 0
+        glyph_y = 0
+        row_height = max(glyph_image.get_height() for character, phase, glyph_image in glyph_images_list)
+        atlas_width = 0
+
+        for character, phase, glyph_image in glyph_images_list:
+
+            # If the glyph does not fit onto the current row, move onto the next row
+            if glyph_x + glyph_image.get_width() > GlyphAtlas.maximum_atlas_width:
+                glyph_x = 0
+                glyph_y += row_height
+
+            self.glyph_rects_dict[character].append(pygame_Rect(glyph_x, glyph_y, glyph_image.get_width(), glyph_image.get_height()))
+            glyph_x += glyph_image.get_width()
+            atlas_width = max(atlas_width, glyph_x)
+
+        # --------------------------------------------------------------------------------------------------------
+        # Creating the atlas surface
+
+        # Create a transparent surface large enough to hold every glyph
+        self.atlas_surface = pygame_Surface((atlas_width, glyph_y + row_height), pygame_SRCALPHA)
+
+        # Draw each glyph onto the atlas surface
+        for character, phase, glyph_image in glyph_images_list:
+            self.atlas_surface.blit(glyph_image, self.glyph_rects_dict[character][phase])
+
+    def draw(self, text, x, y, surface):
+
+        # Draws the text onto the surface with a single batch of blits (one for each glyph)
+
+        # List containing the (atlas surface, position, glyph area) of each glyph in the text
+        glyph_blits_list = []
+
+        # The position of the pen along the text (at the font's original size)
+        pen_x = 0
+
+        for character in text:
+
+            # Find the pixel that the glyph starts in and the phase of the glyph within that pixel
+            if self.number_of_phases > 1:
+                glyph_x, phase = divmod(pen_x, self.number_of_phases)
+            else:
+                glyph_x, phase = round(pen_x / self.scale_multiplier), 0
+
+            glyph_blits_list.append((self.atlas_surface, (x + glyph_x, y), self.glyph_rects_dict[character][phase]))
+            pen_x += self.advances_dict[character]
+
+        # Blit all of the glyphs onto the surface
+        surface.blits(glyph_blits_list, doreturn = False)
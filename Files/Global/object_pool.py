@@ -0,0 +1,80 @@
+class ObjectPool:
+
+    # List of every object pool that has been created (so that all of the pools can recycle their released instances at the start of each frame)
+    pools_list = []
+
+    def __init__(self, object_class):
+
+        # Recycles the instances of a class that are no longer in use, instead of creating new instances
+        """ Notes:
+        - The class must have a "reset" method that takes the same arguments as its __init__ method, which sets up a recycled instance as if it had just been created
+        - Instances released during a frame are only re-used after recycle_released_instances has been called (at the start of the next frame), so that an instance can still be used safely for the rest of the frame it was released in
+        """
+
+        # The class of the instances inside the pool
+        self.object_class = object_class
+
+        # List of instances that can be re-used
+        self.free_instances_list = []
+
+        # List of instances that were released during the current frame
+        self.released_instances_list = []
+
+        # Dictionary containing the statistics of the pool
+        """
+        - InUse = The number of instances that have been acquired and not released
+        - HighWaterMark = The largest number of instances that have been in use at the same time
+        - Allocations = The number of new instances that have been created
+        - Reuses = The number of times an instance has been re-used instead of creating a new instance
+        - Releases = The number of times an instance has been released
+        """
+        self.statistics_dict = {"InUse": 0, "HighWaterMark": 0, "Allocations": 0, "Reuses": 0, "Releases": 0}
+
+        # Add the pool to the list of pools
+        ObjectPool.pools_list.append(self)
+
+    def acquire(self, **arguments):
+
+        # Returns an instance set up with the arguments, re-using a free instance if there is one
+
+        # If there is a free instance
+        if len(self.free_instances_list) > 0:
+            # Re-use the instance
+            instance = self.free_instances_list.pop()
+            instance.reset(**arguments)
+            self.statistics_dict["Reuses"] += 1
+
+        # If there are no free instances
+        else:
+            # Create a new instance
+            instance = self.object_class(**arguments)
+            self.statistics_dict["Allocations"] += 1
+
+        # The instance is now in use
+        instance.released_to_pool = False
+        self.statistics_dict["InUse"] += 1
+        self.statistics_dict["HighWaterMark"] = max(self.statistics_dict["HighWaterMark"], self.statistics_dict["InUse"])
+
+        return instance
+
+    def release(self, instance):
+
+        # Returns an instance that is no longer in use to the pool (releasing an instance that has already been released does nothing)
+
+        if getattr(instance, "released_to_pool", True) == False:
+            instance.released_to_pool = True
+            self.released_instances_list.append(instance)
+            self.statistics_dict["InUse"] -= 1
+            self.statistics_dict["Releases"] += 1
+
+    def recycle_released_instances(self):
+
+        # Allows the instances released during the last frame to be re-used
+        self.free_instances_list.extend(self.released_instances_list)
+        self.released_instances_list = []
+
+def recycle_released_pool_instances():
+
+    # Allows the instances released during the last frame to be re-used, for every object pool (called at the start of every frame)
+    for object_pool in ObjectPool.pools_list:
+        object_pool.recycle_released_instances()
@@ -1,6 +1,5 @@
 from math import atan2, pi, cos, dist, sin, degrees
 from Global.functions import update_generic_timer
-from pygame import Rect as pygame_Rect
 
 
 class AI:
@@ -22,7 +21,6 @@ class AI:
                                         "NewPositionCenterY": self.rect.centery,
                                         "Dx": 0,
                                         "Dy": 0,
-                                        "CollisionTolerance": 12,
 
                                         # Small floating point numbers storage    
                                         # Note: This is used for values that are less than 1, so the boss will actually continue to move 
@@ -68,9 +66,6 @@ class AI:
         # Update the extra movement information dict with SUVAT variables, which will determine how fast this AI is
         self.movement_information_dict.update(suvat_dict)
 
-        # Dictionary used to hold the neighbouring tiles near the AI(i.e. within 1 tile of the AI, movemently and vertically)
-        self.neighbouring_tiles_dict = {}
-
         # Dict used to store collision results when a collision has been detected between a world tile and the AI (For the SikaDeer boss, used for cancelling charge attack)
         self.world_tiles_collision_results_dict = {}
 
@@ -213,9 +208,31 @@ class AI:
         self.movement_information_dict["Angle"] = atan2(-dy, dx) % (2 * pi)
 
         # print(degrees(self.movement_information_dict["Angle"]))
+
+        # Find the angle that the AI should move along to reach the player
+        self.movement_information_dict["MovementAngle"] = self.find_movement_angle(player_position = player_position, current_position = current_position)
     
         self.update_movement_information_dict(player_position, current_position, delta_time)
 
+    def find_movement_angle(self, player_position, current_position):
+
+        # Returns the angle that the AI should move along to reach the player
+        """ Notes:
+        - If there are no world / building tiles between the AI and the player, the AI moves straight towards the player
+        - Otherwise, the AI follows the flow field (shared by all AI) around the tiles, falling back to moving straight towards the player if the flow field cannot reach the player from the AI's cell
+        """
+
+        # If there is a tile between the AI and the player
+        if self.tile_grid.cast_ray(start = current_position, angle = self.movement_information_dict["Angle"], maximum_distance = dist(current_position, player_position))[1] != None:
+
+            # Find the angle to move along using the flow field
+            flow_field_angle = self.flow_field.find_angle(position = current_position)
+
+            if flow_field_angle != None:
+                return flow_field_angle
+
+        return self.movement_information_dict["Angle"]
+
     def update_movement_information_dict(self, player_position, current_position, delta_time):
 
         # Updates the dictionary with the necessary information
@@ -231,8 +248,8 @@ class AI:
         # ----------------------------------------
         # Horizontal
 
-        # Set the horizontal distance travelled based on the current angle that the player is to the AI
-        horizontal_distance_travelled_at_final_velocity = (self.movement_information_dict["DefaultDistanceTravelled"] * cos(self.movement_information_dict["Angle"]))
+        # Set the horizontal distance travelled based on the angle that the AI is moving along to reach the player
+        horizontal_distance_travelled_at_final_velocity = (self.movement_information_dict["DefaultDistanceTravelled"] * cos(self.movement_information_dict["MovementAngle"]))
 
         # Equation = (2s - at^2) / 2t
         self.movement_information_dict["HorizontalSuvatV"] = (2 * horizontal_distance_travelled_at_final_velocity) / (2 * self.movement_information_dict["DefaultHorizontalTimeToTravelDistanceAtFinalVelocity"])
@@ -243,8 +260,8 @@ class AI:
         # ----------------------------------------
         # Vertical
 
-        # Set the vertical distance travelled based on the current angle that the player is to the AI
-        vertical_distance_travelled_at_final_velocity = (self.movement_information_dict["DefaultDistanceTravelled"] * sin(self.movement_information_dict["Angle"]))
+        # Set the vertical distance travelled based on the angle that the AI is moving along to reach the player
+        vertical_distance_travelled_at_final_velocity = (self.movement_information_dict["DefaultDistanceTravelled"] * sin(self.movement_information_dict["MovementAngle"]))
 
         # Equation = (2s - at^2) / 2t
         self.movement_information_dict["VerticalSuvatV"] = (2 * vertical_distance_travelled_at_final_velocity) / (2 * self.movement_information_dict["DefaultVerticalTimeToTravelDistanceAtFinalVelocity"])
@@ -296,8 +313,8 @@ class AI:
         
         # Handles collisions between tiles and the AI
         """ Notes: 
-        - abs() calls because the distances to travel depend on the angle that the player is from the boss
-        - A collision is only triggered when one rect is overlapping another rect by less than self.movement_information_dict["CollisionTolerance"].
+        - The AI's rect is swept through the tile grid by the number of pixels that the AI will actually move, stopping at the first world tile (building tiles are destroyed by the AI instead)
+        - This means that the AI can never move into a tile, however large the distance to travel is (e.g. during the SikaDeer's charge attack or at low frame rates)
 
         - check_x so that we only check x collisions with the specified horizontal distance travelled
         - check_y so that we only check y collisions with the specified vertical distance travelled
@@ -312,57 +329,27 @@ class AI:
             
             if check_x == True:
 
-                # Find the x collisions to the left and right of the AI
-                x_collisions_left = pygame_Rect(self.rect.x - abs(distance_to_travel) , self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)
-                x_collisions_right = pygame_Rect(self.rect.x + abs(distance_to_travel) , self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)
+                # Find the number of pixels the AI will move horizontally (positive when moving right)
+                pixels_to_travel = round(self.movement_information_dict["NewPositionCenterX"] + distance_to_travel) - self.rect.centerx
 
+                # Find how far the AI can move before reaching a world tile
+                swept_distance = self.tile_grid.find_swept_distance(rect = self.rect, axis = "X", distance = pixels_to_travel, include_building_tiles = False)
 
-                # If there is an x collision to the right of the AI
-                if x_collisions_right != None:
+                # If there is a world tile in the way of the AI
+                if swept_distance != pixels_to_travel:
 
                     # Set the world tiles collision results x to True
                     self.movement_information_dict["WorldTileCollisionResultsX"] = True
 
-                    # If the difference between the AI's right and the tile's left is less than the collision tolerance (there is a collision) and the AI is trying to move right
-                    if abs(self.rect.right - x_collisions_right[0].rect.left) < self.movement_information_dict["CollisionTolerance"] and self.movement_information_dict["HorizontalSuvatU"] > 0:
-                        # Set the AI's right to the tile's left
-                        self.rect.right = x_collisions_right[0].rect.left
-                        # Don't allow the AI to move
-                        self.movement_information_dict["Dx"] = 0
-                        # Reset the horizontal acceleration only
-                        self.reset_movement_acceleration(vertical_reset = False, horizontal_reset = True)
-
-                    # If the difference between the AI's right and the tile's left is less than the collision tolerance (there is a collision) and the AI is trying to move in any direction but right
-                    elif abs(self.rect.right - x_collisions_right[0].rect.left) < self.movement_information_dict["CollisionTolerance"] and self.movement_information_dict["HorizontalSuvatU"] < 0:
-                        # Allow the AI to move
-                        self.movement_information_dict["Dx"] = distance_to_travel
-                        # Reset floating point correction X
-                        self.movement_information_dict["FloatingPointCorrectionX"] = 0
-
-                # If there is an x collision to the left of the AI
-                if x_collisions_left != None:
+                    # Move the AI up to the world tile
+                    self.rect.x += swept_distance
+                    self.movement_information_dict["NewPositionCenterX"] = self.rect.centerx
 
-                    # Set the world tiles collision results x to True
-                    self.movement_information_dict["WorldTileCollisionResultsX"] = True
+                    # Don't allow the AI to move, resetting the horizontal acceleration only
+                    self.reset_movement_acceleration(vertical_reset = False, horizontal_reset = True)
 
-                    # If the difference between the AI's left and the tile's right is less than the collision tolerance (there is a collision) and the AI is trying to move left
-                    if abs(self.rect.left - x_collisions_left[0].rect.right) < self.movement_information_dict["CollisionTolerance"] and self.movement_information_dict["HorizontalSuvatU"] < 0:
-                        # Set the AI's left to the tile's right
-                        self.rect.left = x_collisions_left[0].rect.right
-                        # Don't allow the AI to move
-                        self.movement_information_dict["Dx"] = 0
-                        # Reset the horizontal acceleration only
-                        self.reset_movement_acceleration(vertical_reset = False, horizontal_reset = True)
-                        
-                    # If the difference between the AI's left and the tile's right is less than the collision tolerance (there is a collision) and the AI is trying to move in any direction but left
-                    elif abs(self.rect.left - x_collisions_left[0].rect.right) < self.movement_information_dict["CollisionTolerance"] and self.movement_information_dict["HorizontalSuvatU"] > 0:
-                        # Allow the AI to move
-                        self.movement_information_dict["Dx"] = distance_to_travel
-                        # Reset floating point correction X
-                        self.movement_information_dict["FloatingPointCorrectionX"] = 0
-                    
-                # If there is no x collision to the left of the AI and there is no x collision to the right of the AI
-                elif x_collisions_left == None and x_collisions_right == None:
+                # If there is nothing in the way of the AI
+                else:
                     # Allow the AI to move
                     self.movement_information_dict["Dx"] = distance_to_travel
 
@@ -377,56 +364,27 @@ class AI:
 
             elif check_y == True:
 
-                # Find the collisions above and below the AI
-                y_collisions_up = pygame_Rect(self.rect.x, self.rect.y - abs(distance_to_travel), self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)     
-                y_collisions_down = pygame_Rect(self.rect.x, self.rect.y + abs(distance_to_travel), self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)  
+                # Find the number of pixels the AI will move vertically (positive when moving down, as the vertical distance to travel is positive when moving up)
+                pixels_to_travel = round(self.movement_information_dict["NewPositionCenterY"] - distance_to_travel) - self.rect.centery
 
-                # If there is an y collision above the AI
-                if y_collisions_up != None:
+                # Find how far the AI can move before reaching a world tile
+                swept_distance = self.tile_grid.find_swept_distance(rect = self.rect, axis = "Y", distance = pixels_to_travel, include_building_tiles = False)
 
-                    # Set the world tiles collision results y to True
-                    self.movement_information_dict["WorldTileCollisionResultsY"] = True
-                
-                    # If the difference between the AI's top and the tile's bottom is less than the collision tolerance (there is a collision) and the AI is trying to move up
-                    if abs(self.rect.top - y_collisions_up[0].rect.bottom) < self.movement_information_dict["CollisionTolerance"] and self.movement_information_dict["VerticalSuvatU"] > 0:
-                        # Set the AI's top to the tile's bottom
-                        self.rect.top = y_collisions_up[0].rect.bottom
-                        # Don't allow the AI to move
-                        self.movement_information_dict["Dy"] = 0
-                        # Reset the vertical acceleration only
-                        self.reset_movement_acceleration(vertical_reset = True, horizontal_reset = False)
-
-                    # If the difference between the AI's top and the tile's bottom is less than the collision tolerance (there is a collision) and the AI is trying to move in any direction but up
-                    elif abs(self.rect.top - y_collisions_up[0].rect.bottom) < self.movement_information_dict["CollisionTolerance"] and self.movement_information_dict["VerticalSuvatU"] < 0:
-                        # Allow the AI to move
-                        self.movement_information_dict["Dy"] = distance_to_travel
-                        # Reset floating point correction Y
-                        self.movement_information_dict["FloatingPointCorrectionY"] = 0
-
-                # If there is an y collision below the AI
-                if y_collisions_down != None:
+                # If there is a world tile in the way of the AI
+                if swept_distance != pixels_to_travel:
 
                     # Set the world tiles collision results y to True
                     self.movement_information_dict["WorldTileCollisionResultsY"] = True
-                    
-                    # If the difference between the AI's bottom and the tile's top is less than the collision tolerance (there is a collision) and the AI is trying to move down
-                    if abs(self.rect.bottom - y_collisions_down[0].rect.top) < self.movement_information_dict["CollisionTolerance"] and self.movement_information_dict["VerticalSuvatU"] < 0:
-                        # Set the AI's bottom to the tile's top
-                        self.rect.bottom = y_collisions_down[0].rect.top
-                        # Don't allow the AI to move
-                        self.movement_information_dict["Dy"] = 0
-                        # Reset the vertical acceleration only
-                        self.reset_movement_acceleration(vertical_reset = True, horizontal_reset = False)
-
-                    # If the difference between the AI's bottom and the tile's top is less than the collision tolerance (there is a collision) and the AI is trying to move in any direction but down
-                    elif abs(self.rect.bottom - y_collisions_down[0].rect.top) < self.movement_information_dict["CollisionTolerance"] and self.movement_information_dict["VerticalSuvatU"] > 0:
-                        # Allow the AI to move
-                        self.movement_information_dict["Dy"] = distance_to_travel
-                        # Reset floating point correction Y
-                        self.movement_information_dict["FloatingPointCorrectionY"] = 0
-
-                # If there is no y collision above the AI and there is no y collision below the AI
-                elif y_collisions_up == None and y_collisions_down == None:
+
+                    # Move the AI up to the world tile
+                    self.rect.y += swept_distance
+                    self.movement_information_dict["NewPositionCenterY"] = self.rect.centery
+
+                    # Don't allow the AI to move, resetting the vertical acceleration only
+                    self.reset_movement_acceleration(vertical_reset = True, horizontal_reset = False)
+
+                # If there is nothing in the way of the AI
+                else:
                     # Allow the AI to move
                     self.movement_information_dict["Dy"] = distance_to_travel
 
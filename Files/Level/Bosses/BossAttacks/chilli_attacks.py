@@ -1,12 +1,13 @@
 from Global.generic import Generic
-from math import sin, cos, degrees, radians
+from math import sin, cos, radians
 from Global.settings import *
-from pygame.image import load as pygame_image_load
-from pygame.transform import rotozoom as pygame_transform_rotozoom
+from Global.asset_manager import asset_manager
+from Global.functions import get_rotated_image
+from Global.object_pool import ObjectPool
 
 class ChilliProjectileController:
 
-    # projectiles_dict self.chilli_projectiles_dict (Set when the Golden Monkey boss is spawned)
+    # projectiles_manager = self.chilli_projectiles_manager (Set when the Golden Monkey boss is spawned)
 
 
     # spiral_attack_angle_time_gradient = ?? (Set to be synced with the duration of the monkey)
@@ -46,7 +47,7 @@ class ChilliProjectileController:
             # The projectile angle
             projectile_angle = radians(self.spiral_attack_starting_angle + (i * (360 / self.number_of_spiral_lines)))
 
-            # Create a chilli projectile (automatically added to the chilli projectiles dict)
+            # Create a chilli projectile (automatically added to the chilli projectiles manager)
             self.create_chilli_projectile(
 
                                     x_pos = self.boss_center_position[0] + (ChilliProjectileController.displacement_from_center_position * cos(projectile_angle)),
@@ -57,27 +58,17 @@ class ChilliProjectileController:
 
     def update_chilli_projectiles(self, delta_time, camera_position, surface):
         
-        # For each chilli projectile
-        for chilli_projectile in ChilliProjectileController.projectiles_dict.keys():
+        # Move all of the chilli projectiles
+        ChilliProjectileController.projectiles_manager.update(delta_time = delta_time)
 
-            # Update the chilli projectile's delta time
-            chilli_projectile.delta_time = delta_time
-
-            # Move the projectile
-            chilli_projectile.move_projectile()
-
-            # Draw the projectile
-            chilli_projectile.draw(
-                                surface = surface,
-                                x = chilli_projectile.rect.x - camera_position[0],
-                                y = chilli_projectile.rect.y - camera_position[1],
-                                )
+        # Draw all of the chilli projectiles
+        ChilliProjectileController.projectiles_manager.draw(surface = surface, camera_position = camera_position)
 
     def create_chilli_projectile(self, x_pos, y_pos, angle, damage_amount):
 
-        # Creates a single chilli projectile (automatically added to the chilli projectiles dict)
+        # Creates a single chilli projectile (automatically added to the chilli projectiles manager)
 
-        ChilliProjectile(
+        ChilliProjectile.pool.acquire(
                         x = x_pos,
                         y = y_pos,
                         angle = angle,
@@ -86,14 +77,21 @@ class ChilliProjectileController:
 
 class ChilliProjectile(Generic):
 
-    # Image for all chillis
-    chilli_image = pygame_image_load("graphics/Projectiles/ChilliProjectile.png")
+    # Image for all chillis (loaded by the asset manager when first used, as images can only be converted once the display has been created)
+    chilli_image_path = "graphics/Projectiles/ChilliProjectile.png"
 
     # Default time to cover the distance travelled
     default_time_to_travel_distance_at_final_velocity = 0.22
 
     def __init__(self, x, y, angle, damage_amount):
 
+        # Set up the chilli projectile
+        self.reset(x = x, y = y, angle = angle, damage_amount = damage_amount)
+
+    def reset(self, x, y, angle, damage_amount):
+
+        # Sets up the chilli projectile (also used when the chilli projectile is re-used by the object pool)
+
         # --------------------------------------------------------------------------------
         # Movement
 
@@ -110,18 +108,25 @@ class ChilliProjectile(Generic):
         # Calculate the horizontal and vertical gradients
         self.horizontal_gradient = horizontal_distance / time_to_travel_distance_at_final_velocity
         self.vertical_gradient = vertical_distance / time_to_travel_distance_at_final_velocity
-        """
-        self.delta_time = 0
-        """
+        # Note: The projectile is moved by the projectile manager that it is added to
         
         # -------------------------------------------------------------------------------
         # Images
 
-        # The original image of the chilli projectile
-        self.original_image = pygame_transform_rotozoom(surface = ChilliProjectile.chilli_image.convert_alpha(), angle = degrees(angle), scale = 1.25)
+        # The original image of the chilli projectile and its mask
+        # Note: The rotated images (and their masks) are pre-rendered, so this is only a look-up
+        self.original_image, self.mask = get_rotated_image(image = asset_manager.get_image(path = ChilliProjectile.chilli_image_path), angle = angle, scale = 1.25)
+
+        # If the projectile is being created (rather than re-used by the object pool)
+        if hasattr(self, "rect") == False:
+            # Inherit from the Generic class, which has basic attributes and methods. (Inherits from Generic and pygame.sprite.Sprite)
+            Generic.__init__(self, x = x, y = y, image = self.original_image)
 
-        # Inherit from the Generic class, which has basic attributes and methods. (Inherits from Generic and pygame.sprite.Sprite)
-        Generic.__init__(self, x = x, y = y, image = self.original_image)
+        # If the projectile is being re-used by the object pool
+        else:
+            # Set the image and resize the rect to match it (the rect is positioned below)
+            self.image = self.original_image
+            self.rect.size = self.image.get_size()
 
         # -------------------------------------------------------------------------------
         # Positioning
@@ -132,9 +137,7 @@ class ChilliProjectile(Generic):
         self.rect.centerx = x
         self.rect.centery = y
 
-        # The attributes that will hold the new x and y positions of the projectile (for more accurate shooting as the floating point values are saved)
-        self.new_position_x = self.rect.x
-        self.new_position_y = self.rect.y
+        # Note: The floating point positions of the projectile (for more accurate shooting) are saved inside the projectile manager that the projectile is added to
     
         # Used for VFX
         self.angle = angle
@@ -146,19 +149,9 @@ class ChilliProjectile(Generic):
         self.damage_amount = damage_amount
 
         # --------------------------------------------------------------------------------
-        # Adding to chilli projectiles group
-
-        ChilliProjectileController.projectiles_dict[self] = 0
-
-
-    def move_projectile(self):
-
-        # Moves the projectile
+        # Adding to the chilli projectiles manager
 
-        # Horizontal movement
-        self.new_position_x += self.horizontal_gradient * self.delta_time
-        self.rect.x = round(self.new_position_x)
+        ChilliProjectileController.projectiles_manager.add(self)
 
-        # Vertical movement
-        self.new_position_y -= self.vertical_gradient * self.delta_time
-        self.rect.y = round(self.new_position_y)
\ No newline at end of file
+# Object pool used to re-use chilli projectiles instead of creating new ones
+ChilliProjectile.pool = ObjectPool(object_class = ChilliProjectile)
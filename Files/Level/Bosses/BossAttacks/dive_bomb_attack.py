@@ -1,13 +1,12 @@
 from Global.generic import Generic
-from pygame.image import load as pygame_image_load
-from pygame.transform import scale as pygame_transform_scale
-from pygame.mask import from_surface as pygame_mask_from_surface
+from Global.asset_manager import asset_manager
 from pygame import Surface as pygame_Surface
 from math import sin, radians
 
 class DiveBombAttackController(Generic):
 
-    divebomb_circle_image = pygame_image_load("graphics/Projectiles/DiveBombCircle.png")
+    # Image of the divebomb circle (loaded by the asset manager when first used, as images can only be converted once the display has been created)
+    divebomb_circle_image_path = "graphics/Projectiles/DiveBombCircle.png"
 
     def __init__(self, x, y, damage_amount, knockback_multiplier):
 
@@ -71,7 +70,7 @@ class DiveBombAttackController(Generic):
         # Main
 
         # Inherit from the Generic class, which has basic attributes and methods. (Inherits from Generic and pygame.sprite.Sprite)
-        Generic.__init__(self, x = x, y = y, image = pygame_transform_scale(DiveBombAttackController.divebomb_circle_image.convert_alpha(), (self.maximum_circle_radius * 2, self.maximum_circle_radius * 2)))
+        Generic.__init__(self, x = x, y = y, image = asset_manager.get_image(path = DiveBombAttackController.divebomb_circle_image_path, size = (self.maximum_circle_radius * 2, self.maximum_circle_radius * 2)))
 
         # This will be set to the player's center
         self.landing_position = None   
@@ -85,9 +84,8 @@ class DiveBombAttackController(Generic):
 
         # How impactful the knockback is
         self.knockback_multiplier = knockback_multiplier
-        
-        # Create / update a mask for pixel - perfect collisions
-        self.mask = pygame_mask_from_surface(self.image)
+
+        # Note: Collisions use the "Circle" shape (the circle inside the rect), so no mask is needed for pixel-perfect collisions
 
     def reset_divebomb_attributes(self):
 
@@ -3,9 +3,8 @@ from pygame.sprite import Sprite as pygame_sprite_Sprite
 from pygame import Rect as pygame_Rect
 from math import pi, cos, sin, radians, degrees
 from Global.settings import TILE_SIZE
-from pygame.image import load as load_image
-from pygame.transform import scale as scale_image
 from random import randrange as random_randrange
+from Global.object_pool import ObjectPool
 
 class StompController:
 
@@ -78,7 +77,7 @@ class StompController:
         for i in range(0, desired_number_of_nodes):
 
             # Create a stomp node (automatically added to the stomp nodes group when instantiated)
-            StompNode(
+            StompNode.pool.acquire(
                     x = center_of_boss_position[0] + (calculated_radius * cos(self.starting_angle + (i * angle_change))), 
                     y = center_of_boss_position[1] + (calculated_radius * sin(self.starting_angle + (i * angle_change))) + 20, # + 20 so that the stomp nodes are displaced to be positioned below the boss
                     radius = self.minimum_node_radius,
@@ -88,8 +87,7 @@ class StompController:
 
 class StompNode(pygame_sprite_Sprite):
 
-    # This image is only used for masks
-    base_image = load_image("graphics/BossAttacks/StompAttack.png").convert_alpha()
+    # Note: Stomp nodes are drawn as circles and use the "Circle" shape for collisions (the circle inside the rect), so they do not need an image or mask
 
     def __init__(self, x, y, radius, maximum_radius, angle):
 
@@ -99,6 +97,16 @@ class StompNode(pygame_sprite_Sprite):
         # The stomp attack will start below the center of the boss, b
         self.rect = pygame_Rect(x - radius, y - radius, radius * 2, radius * 2)
 
+        # Set up the stomp node
+        self.reset(x = x, y = y, radius = radius, maximum_radius = maximum_radius, angle = angle)
+
+    def reset(self, x, y, radius, maximum_radius, angle):
+
+        # Sets up the stomp node (also used when the stomp node is re-used by the object pool)
+
+        # Position the stomp node (the rect has already been created)
+        self.rect.update(x - radius, y - radius, radius * 2, radius * 2)
+
         # Add the node to the stomp nodes group
         StompController.nodes_group.add(self)
 
@@ -138,9 +146,6 @@ class StompNode(pygame_sprite_Sprite):
         # ------------------------------------------------------------------------------
         # Other
 
-        # Image used for mask collision
-        self.image = scale_image(StompNode.base_image, (radius * 2, radius * 2))
-
         # The radius of the stomp node
         self.radius = radius
 
@@ -193,14 +198,6 @@ class StompNode(pygame_sprite_Sprite):
         # Set the center back to the original center 
         self.rect.centerx = center_before_changing
 
-    def rescale_image(self):
-
-        # Rescales the image for pixel-perfect collision 
-        # Note: This is done when the rect of the stomp attack node collides with something (So that we only scale the image when we want to check for pixel perfect collision)
-
-        # Rescale to be the diameter of the image
-        self.image = scale_image(StompNode.base_image, (self.radius * 2, self.radius * 2))
-
     def change_reflected_colour_value(self, delta_time):
         
         # Changes the colour value of the reflected additive colour over time
@@ -209,4 +206,7 @@ class StompNode(pygame_sprite_Sprite):
         self.reflected_additive_colour[1] = self.reflected_additive_colour[0]  * (sin(radians(self.reflected_current_sin_angle)) ** 2)
 
         # Increase the current sin angle over time
-        self.reflected_current_sin_angle += self.reflected_angle_time_gradient * delta_time
\ No newline at end of file
+        self.reflected_current_sin_angle += self.reflected_angle_time_gradient * delta_time
+
+# Object pool used to re-use stomp nodes instead of creating new ones
+StompNode.pool = ObjectPool(object_class = StompNode)
@@ -1,11 +1,8 @@
 from Global.generic import Generic
 from Global.settings import TILE_SIZE, FULL_DEATH_ANIMATION_DURATION
-from Global.functions import change_image_colour, change_image_colour_v2, sin_change_object_colour, update_generic_timer, simple_loop_animation, simple_play_animation_once
+from Global.functions import change_image_colour, create_silhouette_images_dict, sin_change_object_colour, update_generic_timer, simple_loop_animation, simple_play_animation_once, get_mask
+from Global.asset_manager import asset_manager
 from random import choice as random_choice
-from pygame.mask import from_surface as pygame_mask_from_surface
-from pygame.image import load as load_image
-from pygame.transform import scale as scale_image
-from os import listdir as os_listdir
 from Level.Bosses.AI import AI
 from Level.Bosses.BossAttacks.chilli_attacks import ChilliProjectileController
 from Level.Bosses.BossAttacks.dive_bomb_attack import DiveBombAttackController
@@ -22,8 +19,8 @@ class GoldenMonkeyBoss(Generic, AI):
     # ImagesDict = ?? (This is set when the boss is instantiated)
     # Example: Chase : [Direction][Image list]
 
-    # Find the boss map boundaries, so that for the divebomb mechanic, they aren't spawned inside of a tile
-    # boss_map_boundaries = {"Top": (0, 32), "Left": (32, 0), "Right": len(self.tile_map[0]) * TILE_SIZE, "Bottom": len(self.tile_map) * TILE_SIZE}
+    # The size of the tile map (used for the second phase circles)
+    # boss_map_boundaries = {"EntireTileMapSize": (len(self.tile_map[0]) * TILE_SIZE, len(self.tile_map) * TILE_SIZE)}
     
     # Characteristics
     knockback_damage = 20
@@ -57,9 +54,17 @@ class GoldenMonkeyBoss(Generic, AI):
         # The starting image when spawned (Used as the starting image and ending image for the boss at the start of the game and when the player dies)
         self.starting_image = GoldenMonkeyBoss.ImagesDict["Sleep"][0]
 
+        # If the silhouettes of the images have not been created already
+        if hasattr(GoldenMonkeyBoss, "SilhouetteImagesDict") == False:
+            # Create the (black) silhouettes of every image, used for the damaged flash effect
+            GoldenMonkeyBoss.SilhouetteImagesDict = create_silhouette_images_dict(images = GoldenMonkeyBoss.ImagesDict, desired_colour = (0, 0, 0))
+
         # Inherit from the Generic class, which has basic attributes and methods.
         Generic.__init__(self, x = x , y = y, image = self.starting_image)
 
+        # The mask of the starting image, so that the boss can be collided with before it has run for the first time (e.g. when it is spawned during the same frame as the collisions are handled)
+        self.mask = get_mask(image = self.image)
+
         # Spawn the boss at the middle of the tile, with the bottom of the boss being at the bottom of the tile
         # Note: Do this before inheriting the AI class so that the rect positions are the same
         self.rect.midbottom = (x, y)
@@ -71,7 +76,6 @@ class GoldenMonkeyBoss(Generic, AI):
         self.delta_time
         self.camera_position
         self.players_position
-        self.neighbouring_tiles_dict
         self.camera_shake_events_list # A list of the camera shake events used to add the "Stomp" camera shake effect
         """
 
@@ -355,6 +359,9 @@ class GoldenMonkeyBoss(Generic, AI):
                     current_animation_list = GoldenMonkeyBoss.ImagesDict[self.current_action]["Land"]
                     current_animation_image = GoldenMonkeyBoss.ImagesDict[self.current_action]["Land"][0]
 
+            # Save the animation image before any colours are changed (used to find the silhouette of the animation image)
+            original_animation_image = current_animation_image
+
             # If the boss is in its second phase
             if self.current_phase == 2:
 
@@ -364,11 +371,13 @@ class GoldenMonkeyBoss(Generic, AI):
             # If the boss has been damaged (red and white version)
             if self.extra_information_dict["DamagedFlashEffectTimer"] != None:
                 
-                # Reduce the colour of the image all the way down to black
-                """Note: This is because yellow is made up of red and green, so the colours must be reduced all the way down first to actually see the red (otherwise the only colour visible would be white
+                # Reduce the colour of the image all the way down to black (using the black silhouette of the animation image)
+                """Note: 
+                - This is because yellow is made up of red and green, so the colours must be reduced all the way down first to actually see the red (otherwise the only colour visible would be white
                 and the default colours)
+                - The silhouettes are created when the images are loaded. The second phase colour does not change the silhouette, as only the alpha values of the image are used
                 """
-                current_animation_image = change_image_colour_v2(current_animation_image = current_animation_image, desired_colour = (0, 0, 0))
+                current_animation_image = GoldenMonkeyBoss.SilhouetteImagesDict[original_animation_image]
 
                 # Set the current animation image to be a flashed version of the current animation image (a white flash effect)
                 current_animation_image = change_image_colour(current_animation_image = current_animation_image, desired_colour = random_choice(((255, 255, 255), (255, 0, 0))))
@@ -469,20 +478,15 @@ class GoldenMonkeyBoss(Generic, AI):
             text_position_x = (self.rect.midtop[0] + 3) - self.camera_position[0]
             text_position_y = ((self.rect.midtop[1] - (self.sleep_effect_text_info_dict["FontSize"][1] / 2)) + 12) - self.camera_position[1]
 
-            # Alpha surface
-            new_alpha_surface = pygame_Surface(self.sleep_effect_text_info_dict["FontSize"])
-            new_alpha_surface.set_colorkey("black")
-            new_alpha_surface.set_alpha(self.sleep_effect_text_info_dict["DefaultAlphaLevel"])
-
-            # Create the effect text (Automatically added to the effect text group)
-            EffectText(
+            # Create the effect text, re-using a previous effect text if possible (Automatically added to the effect text group)
+            EffectText.pool.acquire(
                         x = text_position_x,
                         y = text_position_y,
                         colour = self.sleep_effect_text_info_dict["Colour"],
                         display_time = self.sleep_effect_text_info_dict["DisplayTime"], 
                         text = self.sleep_effect_text_info_dict["Text"],
                         font = self.sleep_effect_text_info_dict["Font"],
-                        alpha_surface = new_alpha_surface,
+                        alpha_surface_size = self.sleep_effect_text_info_dict["FontSize"],
                         alpha_level = self.sleep_effect_text_info_dict["DefaultAlphaLevel"],
                         type_of_effect_text = "Sleep"
                         )
@@ -932,28 +936,20 @@ class GoldenMonkeyBoss(Generic, AI):
                         # Finding a valid divebomb end position 
 
                         """Note:
-                        - The landing position is the center of the player, therefore if the plasayer was at the edge of the map, the boss would be spawned inside the tile.
-                        The following code will correct the positions so that e.g. if the player was on the far right of the map, the landing position would need to be at a position where
-                        the right side of the boss' rect would be touching the far right tile, but not  inside
+                        - The landing position is the center of the player, therefore if the player was next to a tile (e.g. at the edge of the map or next to building tiles), the boss would be spawned inside the tile.
+                        - The clearance map is used to find the closest cell to the player where the boss' rect would not overlap any tiles, so if the boss does not fit at the player's position, it lands at the center of that cell instead
                         """
-                        # Save the new position in a temporary variable
-                        new_position = [self.players_position[0], self.players_position[1]]
+                        landing_cell = self.clearance_map.find_closest_cell(minimum_clearance = self.clearance_map.find_minimum_clearance(rect = self.rect), position = self.players_position)
 
-                        # Right side correction:
-                        if (new_position[0] + (self.rect.width / 2)) >= GoldenMonkeyBoss.boss_map_boundaries["Right"]:
-                            new_position[0] = GoldenMonkeyBoss.boss_map_boundaries["Right"] - (self.rect.width / 2)
-                        
-                        # Left side correction:
-                        if (new_position[0] - (self.rect.width / 2)) <= GoldenMonkeyBoss.boss_map_boundaries["Left"]:
-                            new_position[0] = GoldenMonkeyBoss.boss_map_boundaries["Left"] + (self.rect.width / 2)
-                        
-                        # Top side correction 
-                        if (new_position[1] - (self.rect.height / 2)) <= GoldenMonkeyBoss.boss_map_boundaries["Top"]:
-                            new_position[1] = GoldenMonkeyBoss.boss_map_boundaries["Top"] + (self.rect.height / 2)
+                        # If the boss fits at the player's position (or there is nowhere that the boss fits)
+                        if landing_cell == None or landing_cell == self.tile_grid.find_cell(position = self.players_position):
+                            # Save the new position in a temporary variable
+                            new_position = [self.players_position[0], self.players_position[1]]
 
-                        # Bottom side correction 
-                        if (new_position[1] + (self.rect.height / 2)) >= GoldenMonkeyBoss.boss_map_boundaries["Bottom"]:
-                            new_position[1] = GoldenMonkeyBoss.boss_map_boundaries["Bottom"]  - (self.rect.height / 2)
+                        # If the boss does not fit at the player's position
+                        else:
+                            # Land at the center of the closest cell where the boss fits
+                            new_position = [(landing_cell[1] + 0.5) * TILE_SIZE, (landing_cell[0] + 0.5) * TILE_SIZE]
 
                         # Set the divebomb's end position (where to land) to be the calculated position
                         self.dive_bomb_attack_controller.landing_position = new_position
@@ -1099,10 +1095,8 @@ class GoldenMonkeyBoss(Generic, AI):
                     # Set the current action to death
                     self.current_action = "Death"
 
-                    # Load and scale the death animation images 
-                    self.behaviour_patterns_dict["Death"]["Images"] = [scale_image(
-                        load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha(), ((load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha().get_width() * 2, load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha().get_height() * 2)))  
-                        for i in range(0, len(os_listdir("graphics/Misc/DeathAnimation")))]
+                    # Load and scale the death animation images (the images are shared with any other boss that has died)
+                    self.behaviour_patterns_dict["Death"]["Images"] = asset_manager.get_animation(folder = "graphics/Misc/DeathAnimation", scale = 2)
 
                     # Set up the animation speed and timer
                     self.behaviour_patterns_dict["Death"]["FullAnimationDuration"] = FULL_DEATH_ANIMATION_DURATION
@@ -1112,8 +1106,8 @@ class GoldenMonkeyBoss(Generic, AI):
             # Play animations
             self.play_animations()
 
-            # Create / update a mask for pixel - perfect collisions
-            self.mask = pygame_mask_from_surface(self.image)
+            # Update the mask for pixel - perfect collisions (only built once for each distinct image)
+            self.mask = get_mask(image = self.image)
 
             # If the boss is alive
             if self.extra_information_dict["CurrentHealth"] > 0:
@@ -1200,7 +1194,4 @@ class GoldenMonkeyBoss(Generic, AI):
                 )
 
         # # TEMPORARY
-        # pygame_draw_rect(self.surface, "green", (self.rect.x - self.camera_position[0], self.rect.y - self.camera_position[1], self.rect.width, self.rect.height), 1)
-
-        # for tile in self.neighbouring_tiles_dict.keys():
-        #     pygame_draw_rect(self.surface, "white", (tile.rect.x - self.camera_position[0], tile.rect.y - self.camera_position[1], tile.rect.width, tile.rect.height))
\ No newline at end of file
+        # pygame_draw_rect(self.surface, "green", (self.rect.x - self.camera_position[0], self.rect.y - self.camera_position[1], self.rect.width, self.rect.height), 1)
\ No newline at end of file
@@ -1,15 +1,12 @@
 from Global.generic import Generic
-from Global.functions import change_image_colour, simple_loop_animation, simple_play_animation_once
+from Global.functions import change_image_colour, simple_loop_animation, simple_play_animation_once, get_mask
+from Global.asset_manager import asset_manager
 from Global.settings import TILE_SIZE, FULL_DEATH_ANIMATION_DURATION
 from Level.Bosses.BossAttacks.stomp import StompController
 from pygame import Rect as pygame_Rect
 from pygame.draw import circle as pygame_draw_circle
-from pygame.mask import from_surface as pygame_mask_from_surface
 from random import choice as random_choice
 from Level.Bosses.AI import AI
-from pygame.image import load as load_image
-from pygame.transform import scale as scale_image
-from os import listdir as os_listdir
 from pygame.draw import ellipse as pygame_draw_ellipse
 from math import degrees, cos, sin
 
@@ -52,6 +49,9 @@ class SikaDeerBoss(Generic, AI):
         # Inherit from the Generic class, which has basic attributes and methods.
         Generic.__init__(self, x = x , y = y, image = self.starting_image)
 
+        # The mask of the starting image, so that the boss can be collided with before it has run for the first time (e.g. when it is spawned during the same frame as the collisions are handled)
+        self.mask = get_mask(image = self.image)
+
         # Spawn the boss at the middle of the tile, with the bottom of the boss being at the bottom of the tile
         # Note: Do this before inheriting the AI class so that the rect positions are the same
         self.rect.midbottom = (x, y)
@@ -63,7 +63,6 @@ class SikaDeerBoss(Generic, AI):
         self.delta_time
         self.camera_position
         self.players_position
-        self.neighbouring_tiles_dict
         self.camera_shake_events_list # A list of the camera shake events used to add the "Stomp" camera shake effect
         """
 
@@ -127,7 +126,7 @@ class SikaDeerBoss(Generic, AI):
                                             
                                             "ChargeDirection": None,
                                             "ChargeAngle": None,
-                                            "PlayerPosAtChargeTime": None,
+                                            "ChargeWallPosition": None, # The position where the charge line meets the first world tile (used to draw red guidelines)
                                             "EnterStunnedStateBoolean": False, # A boolean value that represents whether the boss has collided with the player during the charge attack"
 
                                             # Movement (Keep the time values to be less than the full charge duration)
@@ -361,8 +360,14 @@ class SikaDeerBoss(Generic, AI):
                     # Store the current charge angle (for calculations for movement)
                     self.behaviour_patterns_dict["Charge"]["ChargeAngle"] = self.movement_information_dict["Angle"]
 
-                    # Store the position of the player at this point in time (used to draw red guidelines)
-                    self.behaviour_patterns_dict["Charge"]["PlayerPosAtChargeTime"] = self.players_position
+                    # Find the first world tile along the charge line (building tiles are destroyed by the boss, so they do not stop the charge)
+                    wall_distance, wall_tile = self.tile_grid.cast_ray(start = self.rect.center, angle = self.behaviour_patterns_dict["Charge"]["ChargeAngle"], include_building_tiles = False)
+                    
+                    # Store the position where the charge line meets the world tile (or the edge of the tile map) (used to draw red guidelines)
+                    self.behaviour_patterns_dict["Charge"]["ChargeWallPosition"] = (
+                                                                                    self.rect.centerx + (wall_distance * cos(self.behaviour_patterns_dict["Charge"]["ChargeAngle"])),
+                                                                                    self.rect.centery - (wall_distance * sin(self.behaviour_patterns_dict["Charge"]["ChargeAngle"]))
+                                                                                    )
 
                     # Reset the horizontal and vertical velocity (V, A and S are updated during the charge attack)
                     self.movement_information_dict["HorizontalSuvatU"] = 0
@@ -642,10 +647,8 @@ class SikaDeerBoss(Generic, AI):
                     # Set the current action to death
                     self.current_action = "Death"
 
-                    # Load and scale the death animation images 
-                    self.behaviour_patterns_dict["Death"]["Images"] = [scale_image(
-                        load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha(), ((load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha().get_width() * 2, load_image(f"graphics/Misc/DeathAnimation/{i}.png").convert_alpha().get_height() * 2)))  
-                        for i in range(0, len(os_listdir("graphics/Misc/DeathAnimation")))]
+                    # Load and scale the death animation images (the images are shared with any other boss that has died)
+                    self.behaviour_patterns_dict["Death"]["Images"] = asset_manager.get_animation(folder = "graphics/Misc/DeathAnimation", scale = 2)
 
                     # Set up the animation speed and timer
                     self.behaviour_patterns_dict["Death"]["FullAnimationDuration"] = FULL_DEATH_ANIMATION_DURATION
@@ -655,8 +658,8 @@ class SikaDeerBoss(Generic, AI):
             # Play animations
             self.play_animations()
 
-            # Create / update a mask for pixel - perfect collisions
-            self.mask = pygame_mask_from_surface(self.image)
+            # Update the mask for pixel - perfect collisions (only built once for each distinct image)
+            self.mask = get_mask(image = self.image)
 
             # Only if the boss is alive, should the timers be updated
             if self.extra_information_dict["CurrentHealth"] > 0:
@@ -673,7 +676,3 @@ class SikaDeerBoss(Generic, AI):
                 if self.current_action != "Stunned":
                     # Update the no action timer (meaning the boss cannot perform any other actions other than chasing)
                     self.update_no_action_timer()
-
-                # # TEMPORARY
-                # for tile in self.neighbouring_tiles_dict.keys():
-                #     pygame_draw_rect(self.surface, "white", (tile.rect.x - self.camera_position[0], tile.rect.y - self.camera_position[1], tile.rect.width, tile.rect.height))
\ No newline at end of file
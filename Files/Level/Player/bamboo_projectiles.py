@@ -1,22 +1,30 @@
 from Global.generic import Generic
-from math import sin, cos, degrees
+from math import sin, cos
 from Global.settings import *
-from pygame.image import load as pygame_image_load
-from pygame.transform import rotozoom as pygame_transform_rotozoom
+from Global.asset_manager import asset_manager
+from Global.functions import get_rotated_image
+from Global.object_pool import ObjectPool
 
 class BambooProjectile(Generic):
     
-    # Projectile image of all bamboo projectiles that come from the Bamboo AR and will spawn out of the bamboo launcher projectile
-    projectile_image = pygame_image_load("graphics/Projectiles/BambooProjectile.png")
+    # Projectile image of all bamboo projectiles that come from the Bamboo AR and will spawn out of the bamboo launcher projectile (loaded by the asset manager when first used, as images can only be converted once the display has been created)
+    projectile_image_path = "graphics/Projectiles/BambooProjectile.png"
     
     # Projectile image of the initial projectile shot from the bamboo launcher
-    launcher_projectile_image = pygame_image_load("graphics/Projectiles/BambooLauncherProjectile.png")
+    launcher_projectile_image_path = "graphics/Projectiles/BambooLauncherProjectile.png"
 
     # Default time to cover the distance travelled
     default_time_to_travel_distance_at_final_velocity = 0.25
 
     def __init__(self, x, y, angle, damage_amount, is_frenzy_mode_projectile, is_bamboo_launcher_projectile):
 
+        # Set up the bamboo projectile
+        self.reset(x = x, y = y, angle = angle, damage_amount = damage_amount, is_frenzy_mode_projectile = is_frenzy_mode_projectile, is_bamboo_launcher_projectile = is_bamboo_launcher_projectile)
+
+    def reset(self, x, y, angle, damage_amount, is_frenzy_mode_projectile, is_bamboo_launcher_projectile):
+
+        # Sets up the bamboo projectile (also used when the bamboo projectile is re-used by the object pool)
+
         # --------------------------------------------------------------------------------
         # Movement
 
@@ -40,9 +48,7 @@ class BambooProjectile(Generic):
         # Calculate the horizontal and vertical gradients
         self.horizontal_gradient = horizontal_distance / time_to_travel_distance_at_final_velocity
         self.vertical_gradient = vertical_distance / time_to_travel_distance_at_final_velocity
-        """
-        self.delta_time = 0
-        """
+        # Note: The projectile is moved by the projectile manager that it is added to
         
         # -------------------------------------------------------------------------------
         # Images
@@ -52,19 +58,31 @@ class BambooProjectile(Generic):
         - This is because the BLEND_RGB_ADD flag is used, so saving bamboo_projectile.image as the changed colour image will keep adding up the RGB values
         """
         # If this was not shot from the bamboo launcher
+        # Note: The rotated images (and their masks) are pre-rendered, so this is only a look-up
         if is_bamboo_launcher_projectile == False:
-            self.original_image = pygame_transform_rotozoom(surface = BambooProjectile.projectile_image.convert_alpha(), angle = degrees(angle), scale = 1)
+            self.original_image, original_mask = get_rotated_image(image = asset_manager.get_image(path = BambooProjectile.projectile_image_path), angle = angle, scale = 1)
             # The amount of lives it has against other projectiles
             self.lives = 2
 
         # If this was shot from the bamboo launcehr
         elif is_bamboo_launcher_projectile == True:
-            self.original_image = pygame_transform_rotozoom(surface = BambooProjectile.launcher_projectile_image.convert_alpha(), angle = degrees(angle), scale = 1)
+            self.original_image, original_mask = get_rotated_image(image = asset_manager.get_image(path = BambooProjectile.launcher_projectile_image_path), angle = angle, scale = 1)
             # The amount of lives it has against other projectiles
             self.lives = 4
 
-        # Inherit from the Generic class, which has basic attributes and methods.
-        Generic.__init__(self, x = x, y = y, image = self.original_image)
+        # If the projectile is being created (rather than re-used by the object pool)
+        if hasattr(self, "rect") == False:
+            # Inherit from the Generic class, which has basic attributes and methods.
+            Generic.__init__(self, x = x, y = y, image = self.original_image)
+
+        # If the projectile is being re-used by the object pool
+        else:
+            # Set the image and resize the rect to match it (the rect is positioned below)
+            self.image = self.original_image
+            self.rect.size = self.image.get_size()
+
+        # The mask of the projectile (used for pixel-perfect collisions, the frenzy mode colour does not change the mask)
+        self.mask = original_mask
 
 
         # -------------------------------------------------------------------------------
@@ -76,9 +94,7 @@ class BambooProjectile(Generic):
         self.rect.centerx = x
         self.rect.centery = y
 
-        # The attributes that will hold the new x and y positions of the projectile (for more accurate shooting as the floating point values are saved)
-        self.new_position_x = self.rect.x
-        self.new_position_y = self.rect.y
+        # Note: The floating point positions of the projectile (for more accurate shooting) are saved inside the projectile manager that the projectile is added to
     
         # Used for VFX
         self.angle = angle
@@ -97,14 +113,5 @@ class BambooProjectile(Generic):
         # Attribute to check if this projectile is a bamboo launcher projectile
         self.is_bamboo_launcher_projectile = is_bamboo_launcher_projectile
 
-    def move_projectile(self):
-
-        # Moves the projectile
-
-        # Horizontal movement
-        self.new_position_x += self.horizontal_gradient * self.delta_time
-        self.rect.x = round(self.new_position_x)
-
-        # Vertical movement
-        self.new_position_y -= self.vertical_gradient * self.delta_time
-        self.rect.y = round(self.new_position_y)
\ No newline at end of file
+# Object pool used to re-use bamboo projectiles instead of creating new ones
+BambooProjectile.pool = ObjectPool(object_class = BambooProjectile)
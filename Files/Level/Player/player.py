@@ -5,9 +5,8 @@ from Level.Player.bamboo_projectiles import BambooProjectile
 from math import degrees, sin, cos, atan2, pi, dist
 from Global.functions import change_image_colour
 from Global.functions import sin_change_object_colour
-from os import listdir as os_list_dir
-from pygame.image import load as pygame_image_load
-from pygame.transform import flip as pygame_transform_flip
+from Global.functions import get_mask
+from Global.asset_manager import asset_manager
 from pygame.sprite import Sprite as pygame_sprite_Sprite
 from pygame.key import get_pressed as pygame_key_get_pressed
 from pygame import K_w as pygame_K_w
@@ -21,7 +20,6 @@ from pygame.mouse import get_pressed as pygame_mouse_get_pressed
 from pygame.mouse import get_pos as pygame_mouse_get_pos
 from pygame.draw import rect as pygame_draw_rect
 from pygame.draw import circle as pygame_draw_circle
-from pygame.mask import from_surface as pygame_mask_from_surface
 from random import choice as random_choice
 from math import radians
 
@@ -67,14 +65,6 @@ class Player(Generic):
         self.dx = 0 # The distance the player can move based on if there were any collisions
         self.dy = 0 # The distance the player can move based on if there were any collisions
 
-        # Collision tolerance
-        """ Explanation:
-        - This is because the difference between the points of collision most likely won't always be 0
-        - This means that as soon as we find a collision between a tile and a player, where the difference between the two points (i.e. the sides of each item) is less than the collision tolerance, then this will register as a collision.
-        - So if the difference between the points of collision is less than the collision tolerance, then this will be detected as a collision
-        """
-        self.collision_tolerance = 18
-        
         # ---------------------------------------------------------------------------------
         # Angles
         """
@@ -172,9 +162,9 @@ class Player(Generic):
         self.tools  =  {
                         "BuildingTool": {
                                         "Images": { 
-                                            "IconImage": pygame_image_load("graphics/Weapons/BuildingTool/IconImage.png").convert_alpha(),
-                                            "Up": pygame_image_load("graphics/Weapons/BuildingTool/Default.png").convert_alpha(),
-                                            "TileImage": pygame_image_load("graphics/Weapons/BuildingTool/BuildingTile.png").convert()
+                                            "IconImage": asset_manager.get_image(path = "graphics/Weapons/BuildingTool/IconImage.png"),
+                                            "Up": asset_manager.get_image(path = "graphics/Weapons/BuildingTool/Default.png"),
+                                            "TileImage": asset_manager.get_image(path = "graphics/Weapons/BuildingTool/BuildingTile.png", alpha = False)
                                                   },
                                         "MaximumBuildingTileHP": 100,
                                         "MaximumPlacingAndRemovingDistance": 7 * TILE_SIZE , #25 * TILE_SIZE, #7 * TILE_SIZE,
@@ -193,15 +183,15 @@ class Player(Generic):
 
                         "BambooAssaultRifle": { 
                             "Images" : {
-                                "IconImage": pygame_image_load("graphics/Weapons/BambooAR/UpRight.png").convert_alpha(),
-                                "Left": pygame_transform_flip(surface = pygame_image_load(f"graphics/Weapons/BambooAR/Right.png").convert_alpha(), flip_x = True, flip_y = False),
-                                "Right": pygame_image_load("graphics/Weapons/BambooAR/Right.png").convert_alpha(),
-                                "Up": pygame_image_load("graphics/Weapons/BambooAR/Up.png").convert_alpha(),
-                                "Up Left": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooAR/UpRight.png").convert_alpha(), flip_x = True, flip_y = False),"UpLeft": pygame_transform_flip(surface = pygame_image_load(f"graphics/Weapons/BambooAR/UpRight.png").convert_alpha(), flip_x = True, flip_y = False),
-                                "Up Right": pygame_image_load("graphics/Weapons/BambooAR/UpRight.png").convert_alpha(),
-                                "Down": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooAR/Up.png").convert_alpha(), flip_x = False, flip_y = True),
-                                "Down Left": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooAR/DownRight.png").convert_alpha(), flip_x = True, flip_y = False),
-                                "Down Right": pygame_image_load("graphics/Weapons/BambooAR/DownRight.png").convert_alpha()
+                                "IconImage": asset_manager.get_image(path = "graphics/Weapons/BambooAR/UpRight.png"),
+                                "Left": asset_manager.get_image(path = "graphics/Weapons/BambooAR/Right.png", flip_x = True),
+                                "Right": asset_manager.get_image(path = "graphics/Weapons/BambooAR/Right.png"),
+                                "Up": asset_manager.get_image(path = "graphics/Weapons/BambooAR/Up.png"),
+                                "Up Left": asset_manager.get_image(path = "graphics/Weapons/BambooAR/UpRight.png", flip_x = True),"UpLeft": asset_manager.get_image(path = "graphics/Weapons/BambooAR/UpRight.png", flip_x = True),
+                                "Up Right": asset_manager.get_image(path = "graphics/Weapons/BambooAR/UpRight.png"),
+                                "Down": asset_manager.get_image(path = "graphics/Weapons/BambooAR/Up.png", flip_y = True),
+                                "Down Left": asset_manager.get_image(path = "graphics/Weapons/BambooAR/DownRight.png", flip_x = True),
+                                "Down Right": asset_manager.get_image(path = "graphics/Weapons/BambooAR/DownRight.png")
                                         },
                             "ShootingCooldown": 125,
                             "ShootingCooldownTimer": None, # 150 so that the player starts off being unable to shoot (after pressing the play button)
@@ -212,15 +202,15 @@ class Player(Generic):
                     
                         "BambooLauncher": {
                                             "Images": {
-                                                "IconImage": pygame_image_load("graphics/Weapons/BambooLauncher/DownRight.png").convert_alpha(),
-                                                "Left": pygame_transform_flip(surface = pygame_image_load(f"graphics/Weapons/BambooLauncher/Right.png").convert_alpha(), flip_x = True, flip_y = False),
-                                                "Right": pygame_image_load("graphics/Weapons/BambooLauncher/Right.png").convert_alpha(),
-                                                "Up": pygame_image_load("graphics/Weapons/BambooLauncher/Up.png").convert_alpha(),
-                                                "Up Left": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooLauncher/UpRight.png").convert_alpha(), flip_x = True, flip_y = False),"UpLeft": pygame_transform_flip(surface = pygame_image_load(f"graphics/Weapons/BambooLauncher/UpRight.png").convert_alpha(), flip_x = True, flip_y = False),
-                                                "Up Right": pygame_image_load("graphics/Weapons/BambooLauncher/UpRight.png").convert_alpha(),
-                                                "Down": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooLauncher/Up.png").convert_alpha(), flip_x = False, flip_y = True),
-                                                "Down Left": pygame_transform_flip(surface = pygame_image_load("graphics/Weapons/BambooLauncher/DownRight.png").convert_alpha(), flip_x = True, flip_y = False),
-                                                "Down Right": pygame_image_load("graphics/Weapons/BambooLauncher/DownRight.png").convert_alpha()
+                                                "IconImage": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/DownRight.png"),
+                                                "Left": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/Right.png", flip_x = True),
+                                                "Right": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/Right.png"),
+                                                "Up": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/Up.png"),
+                                                "Up Left": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/UpRight.png", flip_x = True),"UpLeft": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/UpRight.png", flip_x = True),
+                                                "Up Right": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/UpRight.png"),
+                                                "Down": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/Up.png", flip_y = True),
+                                                "Down Left": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/DownRight.png", flip_x = True),
+                                                "Down Right": asset_manager.get_image(path = "graphics/Weapons/BambooLauncher/DownRight.png")
                                                       },
                                             "ShootingCooldown": 700, 
                                             "ShootingCooldownTimer": None,
@@ -238,7 +228,7 @@ class Player(Generic):
     def reset_player(self):
 
         # Resets all the attributes that need to be reset when the game is restarted
-        # Note: Building tiles list and neighbouring tiles dict is reset as part of the game reset method so that empty tiles can be added back to the empty tiles dictionary
+        # Note: Building tiles list and neighbouring tiles dict is reset as part of the game reset method so that empty tiles can be added back to the tile grid
         
         # -----------------------------------------------------------------------------------------
         # Animation / direction
@@ -296,34 +286,34 @@ class Player(Generic):
         # A dictionary that will hold all of the animations
         self.animations_dict = {"Normal": {
         "Idle": {
-            "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Idle/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Right")))),
-            "Right": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/Right/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Right")))),
-            "Up": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/Up/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Up")))),
-            "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Idle/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Idle/UpRight")))),
-            "Up Right": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/UpRight/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/UpRight")))),
-            "Down": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/Down/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Down")))),
-            "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Idle/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Idle/DownRight")))),
-            "Down Right": tuple(pygame_image_load(f"graphics/Player/Normal/Idle/DownRight/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Idle/Downright")))),
+            "Left": asset_manager.get_animation(folder = "graphics/Player/Normal/Idle/Right", flip_x = True),
+            "Right": asset_manager.get_animation(folder = "graphics/Player/Normal/Idle/Right"),
+            "Up": asset_manager.get_animation(folder = "graphics/Player/Normal/Idle/Up"),
+            "Up Left": asset_manager.get_animation(folder = "graphics/Player/Normal/Idle/UpRight", flip_x = True),
+            "Up Right": asset_manager.get_animation(folder = "graphics/Player/Normal/Idle/UpRight"),
+            "Down": asset_manager.get_animation(folder = "graphics/Player/Normal/Idle/Down"),
+            "Down Left": asset_manager.get_animation(folder = "graphics/Player/Normal/Idle/DownRight", flip_x = True),
+            "Down Right": asset_manager.get_animation(folder = "graphics/Player/Normal/Idle/DownRight"),
                 },
     
         "Run": {
-            "Left": tuple(pygame_transform_flip(surface = pygame_image_load( f"graphics/Player/Normal/Run/Body/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Run/Body/Right")))),
-            "Right": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Body/Right/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Body/Right")))),
-            "Up": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Body/Up/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Body/Up")))),
-            "Down": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Body/Down/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Body/Down")))),
+            "Left": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Body/Right", flip_x = True),
+            "Right": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Body/Right"),
+            "Up": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Body/Up"),
+            "Down": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Body/Down"),
                }
                                          }
                                }
 
         self.head_dict = {"Normal": {
-            "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Run/Head/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/Right")))),
-            "Right": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/Right/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/Right")))),   
-            "Up": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/Up/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/Up")))),
-            "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Run/Head/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/UpRight")))),
-            "Up Right": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/UpRight/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/UpRight")))),
-            "Down": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/Down/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/Down")))),
-            "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Player/Normal/Run/Head/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/DownRight")))),
-            "Down Right": tuple(pygame_image_load(f"graphics/Player/Normal/Run/Head/DownRight/{i}.png").convert_alpha() for i in range(len(os_list_dir("graphics/Player/Normal/Run/Head/DownRight")))),   
+            "Left": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Head/Right", flip_x = True),
+            "Right": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Head/Right"),   
+            "Up": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Head/Up"),
+            "Up Left": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Head/UpRight", flip_x = True),
+            "Up Right": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Head/UpRight"),
+            "Down": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Head/Down"),
+            "Down Left": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Head/DownRight", flip_x = True),
+            "Down Right": asset_manager.get_animation(folder = "graphics/Player/Normal/Run/Head/DownRight"),   
                                     }
                         }
 
@@ -1276,7 +1266,10 @@ class Player(Generic):
         
         # Handles collisions between tiles and the player
 
-        # Note: A collision is only triggered when one rect is overlapping another rect by less than self.collision_tolerance.
+        """ Notes:
+        - The player's rect is swept through the tile grid by the number of pixels that the player will actually move, in the direction that the player is moving towards, stopping at the first world / building tile
+        - This means that the player can never move into a tile, however large the distance to travel is (e.g. at low or uneven frame rates)
+        """
 
         # If the distance to travel is greater or equal to 1
         if abs(distance_to_travel) >= 1:
@@ -1285,46 +1278,21 @@ class Player(Generic):
                 # ---------------------------------------------------------------------------------
                 # Horizontal collisions
 
-                # Find the x collisions to the left and right of the player
-                x_collisions_left = pygame_Rect(self.rect.x - distance_to_travel , self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)
-                x_collisions_right = pygame_Rect(self.rect.x + distance_to_travel , self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)
-
-                # If there is an x collision to the right of the player
-                if x_collisions_right != None:
-
-                    # If the difference between the player's right and the tile's left is less than the collision tolerance (there is a collision) and the player is trying to move right
-                    if abs(self.rect.right - x_collisions_right[0].rect.left) < self.collision_tolerance and self.direction_variables_dict["Right"] == True:
-                        # Set the player's right to the tile's left
-                        self.rect.right = x_collisions_right[0].rect.left
-                        # Don't allow the player to move
-                        self.dx = 0
-
-                    # If the difference between the player's right and the tile's left is less than the collision tolerance (there is a collision) and the player is trying to move in any direction but right
-                    elif abs(self.rect.right - x_collisions_right[0].rect.left) < self.collision_tolerance and self.direction_variables_dict["Right"] != True:
-                        # Allow the player to move
-                        self.dx = distance_to_travel
-                        # Reset floating point correction x
-                        self.floating_point_correction_x = 0
-
-                # If there is an x collision to the left of the player
-                if x_collisions_left != None:
-
-                    # If the difference between the player's left and the tile's right is less than the collision tolerance (there is a collision) and the player is trying to move left
-                    if abs(self.rect.left - x_collisions_left[0].rect.right) < self.collision_tolerance and self.direction_variables_dict["Left"] == True:
-                        # Set the player's left to the tile's right
-                        self.rect.left = x_collisions_left[0].rect.right
-                        # Don't allow the player to move
-                        self.dx = 0
-                    
-                    # If the difference between the player's left and the tile's right is less than the collision tolerance (there is a collision) and the player is trying to move in any direction but left
-                    elif abs(self.rect.left - x_collisions_left[0].rect.right) < self.collision_tolerance and self.direction_variables_dict["Left"] != True:
-                        # Allow the player to move
-                        self.dx = distance_to_travel
-                        # Reset floating point correction x
-                        self.floating_point_correction_x = 0
-
-                # If there is no x collision to the left of the player and there is no x collision to the right of the player
-                elif x_collisions_left == None and x_collisions_right == None:
+                # Find the number of pixels the player will move horizontally (positive when moving right, negative when moving left, 0 when moving in neither direction)
+                pixels_to_travel = round(abs(distance_to_travel)) * (1 if self.direction_variables_dict["Right"] == True else -1 if self.direction_variables_dict["Left"] == True else 0)
+
+                # Find how far the player can move before reaching a tile
+                swept_distance = self.tile_grid.find_swept_distance(rect = self.rect, axis = "X", distance = pixels_to_travel)
+
+                # If there is a tile in the way of the player
+                if swept_distance != pixels_to_travel:
+                    # Move the player up to the tile
+                    self.rect.x += swept_distance
+                    # Don't allow the player to move
+                    self.dx = 0
+
+                # If there is nothing in the way of the player
+                else:
                     # Allow the player to move
                     self.dx = distance_to_travel
                     # Reset floating point correction x
@@ -1335,46 +1303,21 @@ class Player(Generic):
 
             if check_y == True:
 
-                # Find the collisions above and below the player
-                y_collisions_up = pygame_Rect(self.rect.x, self.rect.y - distance_to_travel, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)     
-                y_collisions_down = pygame_Rect(self.rect.x, self.rect.y + distance_to_travel, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)     
-
-                # If there is an y collision above the player
-                if y_collisions_up != None:
-
-                    # If the difference between the player's top and the tile's bottom is less than the collision tolerance (there is a collision) and the player is trying to move up
-                    if abs(self.rect.top - y_collisions_up[0].rect.bottom) < self.collision_tolerance and self.direction_variables_dict["Up"] == True:
-                        # Set the player's top to the tile's bottom
-                        self.rect.top = y_collisions_up[0].rect.bottom
-                        # Don't allow the player to move
-                        self.dy = 0
-
-                    # If the difference between the player's top and the tile's bottom is less than the collision tolerance (there is a collision) and the player is trying to move in any direction but up
-                    elif abs(self.rect.top - y_collisions_up[0].rect.bottom) < self.collision_tolerance and self.direction_variables_dict["Up"] != True:
-                        # Allow the player to move
-                        self.dy = distance_to_travel
-                        # Reset floating point correction y
-                        self.floating_point_correction_y = 0
-
-                # If there is an y collision below the player
-                if y_collisions_down != None:
-
-                    # If the difference between the player's bottom and the tile's top is less than the collision tolerance (there is a collision) and the player is trying to move down
-                    if abs(self.rect.bottom - y_collisions_down[0].rect.top) < self.collision_tolerance and self.direction_variables_dict["Down"] == True:
-                        # Set the player's bottom to the tile's top
-                        self.rect.bottom = y_collisions_down[0].rect.top
-                        # Don't allow the player to move
-                        self.dy = 0
-
-                    # If the difference between the player's bottom and the tile's top is less than the collision tolerance (there is a collision) and the player is trying to move in any direction but down
-                    elif abs(self.rect.bottom - y_collisions_down[0].rect.top) < self.collision_tolerance and self.direction_variables_dict["Down"] != True:
-                        # Allow the player to move
-                        self.dy = distance_to_travel
-                        # Reset floating point correction y
-                        self.floating_point_correction_y = 0
-
-                # If there is no y collision above the player and there is no y collision below the player
-                elif y_collisions_up == None and y_collisions_down == None:
+                # Find the number of pixels the player will move vertically (positive when moving down, negative when moving up, 0 when moving in neither direction)
+                pixels_to_travel = round(abs(distance_to_travel)) * (1 if self.direction_variables_dict["Down"] == True else -1 if self.direction_variables_dict["Up"] == True else 0)
+
+                # Find how far the player can move before reaching a tile
+                swept_distance = self.tile_grid.find_swept_distance(rect = self.rect, axis = "Y", distance = pixels_to_travel)
+
+                # If there is a tile in the way of the player
+                if swept_distance != pixels_to_travel:
+                    # Move the player up to the tile
+                    self.rect.y += swept_distance
+                    # Don't allow the player to move
+                    self.dy = 0
+
+                # If there is nothing in the way of the player
+                else:
                     # Allow the player to move
                     self.dy = distance_to_travel
                     # Reset floating point correction y
@@ -1594,24 +1537,29 @@ class Player(Generic):
 
             # ---------------------------------------------------------------------------------------------------------------------------------
             # Updating the direction variables for collision checking 
+            # Note: The opposite direction is set to False, so that the tile grid is only swept in the direction that the player is being knocked back in
 
             # If the horizontal distance time gradient is less than 0
             if self.player_gameplay_info_dict["KnockbackHorizontalDistanceTimeGradient"] < 0: 
                 # Check for collisions to the left of the player
                 self.direction_variables_dict["Left"] = True
+                self.direction_variables_dict["Right"] = False
             # If the horizontal distance time gradient is greater than 0
             elif self.player_gameplay_info_dict["KnockbackHorizontalDistanceTimeGradient"] > 0:
                 # Check for collisions to the right of the player
                 self.direction_variables_dict["Right"] = True
+                self.direction_variables_dict["Left"] = False
 
             # If the vertical distance time gradient is less than 0
             if self.player_gameplay_info_dict["KnockbackVerticalDistanceTimeGradient"] > 0:
                 # Check for collisions above the player
                 self.direction_variables_dict["Up"] = True
+                self.direction_variables_dict["Down"] = False
             # If the vertical distance time gradient is greater than 0
             elif self.player_gameplay_info_dict["KnockbackVerticalDistanceTimeGradient"] < 0:
                 # Check for collisions below the player
                 self.direction_variables_dict["Down"] = True
+                self.direction_variables_dict["Up"] = False
 
             # ---------------------------------------------------------------------------------------------------------------------------------
             # Horizontal collision checking and movement
@@ -1842,18 +1790,12 @@ class Player(Generic):
                         # If the distance between this tile and the player is within the maximum removing distance
                         if dist(self.rect.center, building_tile_to_remove.rect.center) <= self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
 
-                            # Remove the building tile from the world tiles group
-                            self.sprite_groups["WorldTiles"].remove(building_tile_to_remove)
-
-                            # "Create" an empty tile where the building tile was
-                            self.empty_tiles_dict[self.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
+                            # Replace the building tile with the empty tile inside the tile grid
+                            self.tile_grid.set_tile(tile = self.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove], tile_type = "Empty")
                             
                             # Remove the building tile from the replaced empty tiles dict
                             self.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
 
-                            # Remove the building tile from the world tiles list
-                            self.world_tiles_dict.pop(building_tile_to_remove)
-
                             # Remove the building tile at the collision result index from the existing building tiles list
                             self.tools["BuildingTool"]["ExistingBuildingTilesList"].pop(collision_result_index)
 
@@ -1874,14 +1816,8 @@ class Player(Generic):
                         # If the distance between this tile and the player is within the maximum removing distance
                         if dist(self.rect.center, building_tile_to_remove.rect.center) <= self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"]:
 
-                            # Remove the building tile from the world tiles group
-                            self.sprite_groups["WorldTiles"].remove(building_tile_to_remove)
-
-                            # Remove the building tile from the world tiles list
-                            self.world_tiles_dict.pop(building_tile_to_remove)
-
-                            # "Create" an empty tile where the building tile was
-                            self.empty_tiles_dict[self.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
+                            # Replace the building tile with the empty tile inside the tile grid
+                            self.tile_grid.set_tile(tile = self.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove], tile_type = "Empty")
 
                             # Remove the building tile from the replaced empty tiles dict
                             self.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
@@ -1905,14 +1841,15 @@ class Player(Generic):
             pygame_draw_circle(self.surface, "red", (self.rect.centerx - self.camera_position[0], self.rect.centery - self.camera_position[1]), self.tools["BuildingTool"]["MinimumPlacingDistance"], 1)
             pygame_draw_circle(self.surface, "red", (self.rect.centerx - self.camera_position[0], self.rect.centery - self.camera_position[1]), self.tools["BuildingTool"]["MaximumPlacingAndRemovingDistance"], 2)
 
-            # Find collisions between the mouse rect and empty tiles inside the tile map
-            empty_tile_collision = pygame_Rect(self.mouse_position[0], self.mouse_position[1] , 1, 1).collidedict(self.empty_tiles_dict)
+            # Find the cell inside the tile map at the mouse position
+            """ Note: This is a direct lookup inside the tile grid, rather than checking the mouse rect against every empty tile inside the tile map"""
+            mouse_cell = self.tile_grid.find_cell(position = self.mouse_position)
 
-            # If there is a collision between the mouse rect and an empty tile 
-            if empty_tile_collision != None:
+            # If the mouse is inside the tile map and the cell at the mouse position is an empty tile
+            if mouse_cell != None and self.tile_grid.get_tile_type(row = mouse_cell[0], column = mouse_cell[1]) == "Empty":
 
-                # The tile rect will be the key of the returned value from the collide dict
-                empty_tile = empty_tile_collision[0]
+                # The empty tile at the mouse position
+                empty_tile = self.tile_grid.get_tile(row = mouse_cell[0], column = mouse_cell[1])
                 
                 # The center of the empty tile
                 empty_tile_center = (
@@ -1954,17 +1891,11 @@ class Player(Generic):
                                 # Create a building tile
                                 building_tile = BuildingTile(x = empty_tile.rect.x, y = empty_tile.rect.y, image = self.tools["BuildingTool"]["Images"]["TileImage"])
 
-                                # Add the building tile to the building tiles sprite group
-                                self.sprite_groups["WorldTiles"].add(building_tile)
-
-                                # Add the building tile to the world tiles dictionary with the key as the building tile and the value as the type of world tile
-                                self.world_tiles_dict[building_tile] = "BuildingTile"
-
                                 # Save the empty tile in the replaced empty tiles dict so that we do not need to create a new empty tile every time a building tile is placed / removed
                                 self.sprite_groups["ReplacedEmptyTiles"][building_tile] = empty_tile
 
-                                # Remove the empty tile from the empty tiles dictionary
-                                self.empty_tiles_dict.pop(empty_tile)
+                                # Replace the empty tile with the building tile inside the tile grid
+                                self.tile_grid.set_tile(tile = building_tile, tile_type = "BuildingTile")
                                 
                                 # Add the building tile to the existing building tiles list
                                 self.tools["BuildingTool"]["ExistingBuildingTilesList"].append(building_tile)
@@ -2073,7 +2004,7 @@ class Player(Generic):
                             if self.player_gameplay_info_dict["FrenzyModeTimer"] == None:
                                 
                                 # Set the "is_frenzy_mode_projectile" attribute to False
-                                bamboo_projectile = BambooProjectile(
+                                bamboo_projectile = BambooProjectile.pool.acquire(
                                                                     x = self.rect.centerx + distance_x,
                                                                     y = self.rect.centery + distance_y,
                                                                     angle = self.look_angle,
@@ -2085,7 +2016,7 @@ class Player(Generic):
                             # If frenzy mode is activated when shooting:
                             elif self.player_gameplay_info_dict["FrenzyModeTimer"] != None:
                                 # Set the "is_frenzy_mode_projectile" attribute to True
-                                bamboo_projectile = BambooProjectile(
+                                bamboo_projectile = BambooProjectile.pool.acquire(
                                                                     x = self.rect.centerx + distance_x,
                                                                     y = self.rect.centery + distance_y,
                                                                     angle = self.look_angle,
@@ -2121,7 +2052,7 @@ class Player(Generic):
             offset_distance_y = -(15 * sin(radians(i * (360 / self.tools["BambooLauncher"]["NumberOfMiniProjectiles"])))) # "-" because pygame's y-axis is flipped
             
             # Create a new projectile with the damage of the mini projectiles damage under the bamboo launcher's dictionary
-            bamboo_projectile = BambooProjectile(
+            bamboo_projectile = BambooProjectile.pool.acquire(
                                                 x = projectile.rect.centerx + offset_distance_x,
                                                 y = projectile.rect.centery + offset_distance_y,
                                                 angle = radians(i * (360 / self.tools["BambooLauncher"]["NumberOfMiniProjectiles"])),
@@ -2146,10 +2077,11 @@ class Player(Generic):
                     # If the player has activated frenzy mode
                     if self.player_gameplay_info_dict["FrenzyModeTimer"] != None:
 
-                        # Note: The copy of the original image is so that we don't continuously add onto the current RGB values of the projectile's image (otherwise it will become completely white)
+                        # Note: The original image is passed in so that we don't continuously add onto the current RGB values of the projectile's image (otherwise it will become completely white)
+                        # (It is not copied, so that the tinted image can be re-used from the cache of change_image_colour)
 
                         # Set the bamboo projectile image to be the same colour as the player when in frenzy mode
-                        bamboo_projectile.image = change_image_colour(current_animation_image = bamboo_projectile.original_image.copy(), desired_colour = self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"])
+                        bamboo_projectile.image = change_image_colour(current_animation_image = bamboo_projectile.original_image, desired_colour = self.player_gameplay_info_dict["FrenzyModeVisualEffectColour"])
 
                     # If the player has not activated frenzy mode
                     elif self.player_gameplay_info_dict["FrenzyModeTimer"] == None:
@@ -2161,12 +2093,8 @@ class Player(Generic):
                             # Set the image back to the original image
                             bamboo_projectile.image = bamboo_projectile.original_image
 
-
-                # Update the bamboo projectile's delta time
-                bamboo_projectile.delta_time = self.delta_time
-
-                # Move the projectile
-                bamboo_projectile.move_projectile()
+            # Move all of the bamboo projectiles
+            self.sprite_groups["BambooProjectiles"].update(delta_time = self.delta_time)
     
     def update_shooting_cooldown_timer(self, current_weapon_dict):
 
@@ -2209,7 +2137,7 @@ class Player(Generic):
                 # If the death animations have not been loaded before
                 if "Death" not in self.animations_dict.keys():
                     # Load the death animation images
-                    self.animations_dict["Death"] = tuple(pygame_image_load(f'graphics/Misc/DeathAnimation/{i}.png').convert_alpha() for i in range(0, len(os_list_dir('graphics/Misc/DeathAnimation'))))
+                    self.animations_dict["Death"] = asset_manager.get_animation(folder = "graphics/Misc/DeathAnimation")
 
                     # Set the frame cooldown (time between each frame)
                     self.animation_frame_cooldowns_dict["Death"] = FULL_DEATH_ANIMATION_DURATION / len(self.animations_dict["Death"])
@@ -2236,8 +2164,8 @@ class Player(Generic):
                 # Track player movement
                 self.handle_player_movement()
                 
-                # Create / update a mask for pixel - perfect collisions
-                self.mask = pygame_mask_from_surface(self.image)
+                # Update the mask for pixel - perfect collisions (only built once for each distinct image)
+                self.mask = get_mask(image = self.image)
 
                 # ----------------------------------
                 # Gameplay
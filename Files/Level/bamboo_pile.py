@@ -1,11 +1,15 @@
 from Global.generic import Generic
+from Global.functions import get_mask
 from Global.settings import TILE_SIZE
-from pygame.image import load as pygame_image_load
+from Global.asset_manager import asset_manager
+from Global.object_pool import ObjectPool
+from math import atan2, degrees, dist
+from random import randrange as random_randrange
 
 class BambooPile(Generic):
 
-    # Bamboo pile image
-    pile_image = pygame_image_load("graphics/Misc/BambooPile.png")
+    # Bamboo pile image (loaded by the asset manager when first used, as images can only be converted once the display has been created)
+    pile_image_path = "graphics/Misc/BambooPile.png"
     
     # Dictionary containing information relating to bamboo piles
     bamboo_pile_info_dict = {
@@ -21,4 +25,102 @@ class BambooPile(Generic):
     def __init__(self, x, y):
 
         # Inherit from the Generic class, which has basic attributes and methods. (Inherits from Generic and pygame.sprite.Sprite)
-        Generic.__init__(self, x = x, y = y, image = BambooPile.pile_image)
\ No newline at end of file
+        Generic.__init__(self, x = x, y = y, image = asset_manager.get_image(path = BambooPile.pile_image_path))
+
+        # The mask of the bamboo pile for pixel - perfect collisions (all bamboo piles share the same mask)
+        self.mask = get_mask(image = self.image)
+
+    def reset(self, x, y):
+
+        # Moves a bamboo pile that is being re-used by the object pool to its new position (the image and mask never change)
+        self.rect.topleft = (x, y)
+
+# Object pool used to re-use bamboo piles instead of creating new ones
+BambooPile.pool = ObjectPool(object_class = BambooPile)
+
+class BambooPileSpawnIndex:
+
+    def __init__(self, tile_grid, middle_position):
+
+        # Index of the empty tiles that bamboo piles can spawn on, bucketed into the segment (of the tile map around the middle position) that each tile is inside of
+        """ Notes:
+        - A tile can only be spawned on if its center is a minimum and maximum distance away from the middle position (BambooPile.bamboo_pile_info_dict)
+        - There is one segment for each bamboo pile that can exist at one time (e.g. 6 segments of 60 degrees each), and the segments start from the positive x axis, going anti-clockwise
+        - The segment of every cell is found once, when the index is created. Cells are then added to / removed from their segment's bucket whenever they become empty / stop being empty (e.g. a building tile or bamboo pile is placed on them)
+        """
+
+        # The tile grid holding the empty tiles
+        self.tile_grid = tile_grid
+
+        # The number of degrees that each segment covers
+        segment_degrees = 360 / BambooPile.bamboo_pile_info_dict["MaximumNumberOfPilesAtOneTime"]
+
+        # Dictionary containing the segment of every cell that is a valid distance away from the middle position
+        """ Format:
+        self.cell_segments_dict[cell index] = segment
+        """
+        self.cell_segments_dict = {}
+
+        for cell_index in range(0, len(tile_grid.cells)):
+
+            # Find the center of the cell
+            row, column = divmod(cell_index, tile_grid.number_of_columns)
+            cell_center = ((column * TILE_SIZE) + (TILE_SIZE / 2), (row * TILE_SIZE) + (TILE_SIZE / 2))
+
+            # If the cell is a valid distance away from the middle position
+            if BambooPile.bamboo_pile_info_dict["MinimumSpawningDistanceFromMiddle"] <= dist(middle_position, cell_center) <= BambooPile.bamboo_pile_info_dict["MaximumSpawningDistanceFromMiddle"]:
+                # Find the segment that the cell is inside of
+                angle = degrees(atan2(-(cell_center[1] - middle_position[1]), cell_center[0] - middle_position[0])) % 360
+                self.cell_segments_dict[cell_index] = int(angle // segment_degrees)
+
+        # Dictionary containing a list of the indexes of the empty cells inside each segment, and the position of each cell inside its segment's list
+        """ Format:
+        self.buckets_dict[segment] = [cell index, ...]
+        self.bucket_positions_dict[cell index] = The position of the cell inside its segment's list
+        
+        Note: Cells are removed by moving the last cell in the list into their position, so that adding, removing and choosing cells do not depend on the number of cells
+        """
+        self.buckets_dict = {segment: [] for segment in range(0, BambooPile.bamboo_pile_info_dict["MaximumNumberOfPilesAtOneTime"])}
+        self.bucket_positions_dict = {}
+
+        # Add all of the empty cells
+        for cell_index in self.cell_segments_dict.keys():
+            self.update_cell(cell_index = cell_index)
+
+        # Update the index whenever a cell is changed
+        self.tile_grid.cell_changed_functions_list.append(lambda row, column: self.update_cell(cell_index = (row * self.tile_grid.number_of_columns) + column))
+
+    def update_cell(self, cell_index):
+
+        # Adds the cell to its segment's bucket if it is empty, or removes it if it is not (only cells that are a valid distance away from the middle position are added)
+
+        if cell_index not in self.cell_segments_dict:
+            return
+
+        bucket = self.buckets_dict[self.cell_segments_dict[cell_index]]
+        
+        # If the cell is empty and is not inside the bucket
+        if self.tile_grid.cells[cell_index] == 0 and cell_index not in self.bucket_positions_dict:
+            self.bucket_positions_dict[cell_index] = len(bucket)
+            bucket.append(cell_index)
+
+        # If the cell is not empty and is inside the bucket
+        elif self.tile_grid.cells[cell_index] != 0 and cell_index in self.bucket_positions_dict:
+            # Move the last cell in the bucket into the position of the removed cell
+            position = self.bucket_positions_dict.pop(cell_index)
+            last_cell_index = bucket.pop()
+            if last_cell_index != cell_index:
+                bucket[position] = last_cell_index
+                self.bucket_positions_dict[last_cell_index] = position
+
+    def count_tiles(self, segment):
+
+        # Returns the number of empty tiles that a bamboo pile can spawn on inside the segment
+        return len(self.buckets_dict[segment])
+
+    def choose_tile(self, segment):
+
+        # Returns a random empty tile that a bamboo pile can spawn on inside the segment
+        cell_index = self.buckets_dict[segment][random_randrange(0, len(self.buckets_dict[segment]))]
+        return self.tile_grid.tiles_list[cell_index]
+
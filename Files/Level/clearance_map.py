@@ -0,0 +1,179 @@
+from Global.settings import TILE_SIZE
+from array import array
+from math import dist, ceil
+
+class ClearanceMap:
+
+    # The largest clearance stored for a cell (queries can only ask for clearances up to this value, e.g. the boss spawning check asks for 5)
+    maximum_clearance = 8
+
+    def __init__(self, tile_grid):
+
+        # Distance map holding how much free space there is around every cell of the tile grid, used for finding positions where a boss of a given size fits (e.g. boss spawning, divebomb landing)
+        """ Notes:
+        - The clearance of a cell is the chessboard distance from the cell to the nearest cell that is not empty (e.g. world tiles, building tiles, bamboo piles) or to the edge of the tile map, capped at the maximum clearance
+        - This means that a cell with a clearance of c is at the center of an empty square of ((2 * c) - 1) x ((2 * c) - 1) cells (a clearance of 0 means that the cell itself is not empty)
+        - The clearances are computed once when the map is created, and when a cell changes between empty and not empty (e.g. a building tile is placed / removed), only the cells within the maximum clearance of it are recomputed
+        - The cells with at least a given clearance are kept in candidate sets, so queries only look at cells where the boss would fit
+        """
+
+        # The tile grid that the clearance map is built over
+        self.tile_grid = tile_grid
+
+        # Compact array holding the clearance of each cell (in row-major order)
+        self.clearances = array("B", bytes(len(tile_grid.cells)))
+
+        # Dictionary containing the sets of cells with at least a given clearance (created when the clearance is first queried)
+        """ Format:
+        self.candidate_cells_dict[minimum clearance] = {cell index, ...}
+        """
+        self.candidate_cells_dict = {}
+
+        # Compute the clearances of every cell
+        self.compute_clearances(first_row = 0, last_row = tile_grid.number_of_rows - 1, first_column = 0, last_column = tile_grid.number_of_columns - 1)
+
+        # Recompute the clearances around a cell whenever it changes between empty and not empty
+        self.tile_grid.cell_changed_functions_list.append(self.invalidate_cell)
+
+    def invalidate_cell(self, row, column):
+
+        # Recomputes the clearances of the cells around the cell, if the cell has changed between empty and not empty
+
+        cell_index = (row * self.tile_grid.number_of_columns) + column
+
+        if (self.tile_grid.cells[cell_index] == 0) != (self.clearances[cell_index] > 0):
+            # Only cells closer than the maximum clearance to the changed cell can have a different clearance
+            self.compute_clearances(
+                                    first_row = max(0, row - (ClearanceMap.maximum_clearance - 1)),
+                                    last_row = min(self.tile_grid.number_of_rows - 1, row + (ClearanceMap.maximum_clearance - 1)),
+                                    first_column = max(0, column - (ClearanceMap.maximum_clearance - 1)),
+                                    last_column = min(self.tile_grid.number_of_columns - 1, column + (ClearanceMap.maximum_clearance - 1))
+                                    )
+
+    def compute_clearances(self, first_row, last_row, first_column, last_column):
+
+        # Recomputes the clearances of the cells inside the region (inclusive of the first and last rows / columns)
+        """ Notes:
+        - The clearances are found with a two-pass distance transform (forwards from the top-left, then backwards from the bottom-right) over the region, extended by the maximum clearance on each side
+        - The extension means that every non-empty cell that can affect the clearance of a cell inside the region is included, so the clearances inside the region are exact
+        """
+
+        number_of_rows = self.tile_grid.number_of_rows
+        number_of_columns = self.tile_grid.number_of_columns
+        maximum_clearance = ClearanceMap.maximum_clearance
+
+        # Extend the region by the maximum clearance (limited to the tile map)
+        region_first_row = max(0, first_row - maximum_clearance)
+        region_last_row = min(number_of_rows - 1, last_row + maximum_clearance)
+        region_first_column = max(0, first_column - maximum_clearance)
+        region_last_column = min(number_of_columns - 1, last_column + maximum_clearance)
+        region_width = (region_last_column - region_first_column) + 1
+        region_height = (region_last_row - region_first_row) + 1
+
+        # The clearances of the extended region (in row-major order)
+        region_clearances = [0] * (region_width * region_height)
+
+        # Forwards pass (from the top-left, using the left, top-left, top and top-right neighbours)
+        for region_row in range(0, region_height):
+            row = region_first_row + region_row
+            for region_column in range(0, region_width):
+                column = region_first_column + region_column
+
+                # Non-empty cells have no clearance
+                if self.tile_grid.cells[(row * number_of_columns) + column] != 0:
+                    continue
+
+                # Start with the distance to the edge of the tile map
+                clearance = min(maximum_clearance, row + 1, column + 1, number_of_rows - row, number_of_columns - column)
+
+                if region_column > 0:
+                    clearance = min(clearance, region_clearances[(region_row * region_width) + region_column - 1] + 1)
+                if region_row > 0:
+                    above_index = ((region_row - 1) * region_width) + region_column
+                    clearance = min(clearance, region_clearances[above_index] + 1)
+                    if region_column > 0:
+                        clearance = min(clearance, region_clearances[above_index - 1] + 1)
+                    if region_column < region_width - 1:
+                        clearance = min(clearance, region_clearances[above_index + 1] + 1)
+
+                region_clearances[(region_row * region_width) + region_column] = clearance
+
+        # Backwards pass (from the bottom-right, using the right, bottom-right, bottom and bottom-left neighbours)
+        for region_row in range(region_height - 1, -1, -1):
+            for region_column in range(region_width - 1, -1, -1):
+                clearance = region_clearances[(region_row * region_width) + region_column]
+
+                # Non-empty cells have no clearance
+                if clearance == 0:
+                    continue
+
+                if region_column < region_width - 1:
+                    clearance = min(clearance, region_clearances[(region_row * region_width) + region_column + 1] + 1)
+                if region_row < region_height - 1:
+                    below_index = ((region_row + 1) * region_width) + region_column
+                    clearance = min(clearance, region_clearances[below_index] + 1)
+                    if region_column > 0:
+                        clearance = min(clearance, region_clearances[below_index - 1] + 1)
+                    if region_column < region_width - 1:
+                        clearance = min(clearance, region_clearances[below_index + 1] + 1)
+
+                region_clearances[(region_row * region_width) + region_column] = clearance
+
+        # Save the clearances of the cells inside the (non-extended) region, updating the candidate sets
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                cell_index = (row * number_of_columns) + column
+                clearance = region_clearances[((row - region_first_row) * region_width) + (column - region_first_column)]
+
+                if self.clearances[cell_index] != clearance:
+                    self.clearances[cell_index] = clearance
+
+                    for minimum_clearance, candidate_cells in self.candidate_cells_dict.items():
+                        if clearance >= minimum_clearance:
+                            candidate_cells.add(cell_index)
+                        else:
+                            candidate_cells.discard(cell_index)
+
+    def find_candidate_cells(self, minimum_clearance):
+
+        # Returns the set of cells with at least the minimum clearance, creating it if this clearance has not been queried before
+        if minimum_clearance not in self.candidate_cells_dict:
+            self.candidate_cells_dict[minimum_clearance] = set(cell_index for cell_index in range(0, len(self.clearances)) if self.clearances[cell_index] >= minimum_clearance)
+
+        return self.candidate_cells_dict[minimum_clearance]
+
+    def find_cells(self, minimum_clearance, position, minimum_distance, maximum_distance):
+
+        # Returns a list of the (row, column) of the cells with at least the minimum clearance, whose centers are within the minimum and maximum distance from the position
+
+        cells = []
+
+        for cell_index in self.find_candidate_cells(minimum_clearance = minimum_clearance):
+            row, column = divmod(cell_index, self.tile_grid.number_of_columns)
+            if minimum_distance <= dist(position, ((column + 0.5) * TILE_SIZE, (row + 0.5) * TILE_SIZE)) <= maximum_distance:
+                cells.append((row, column))
+
+        return cells
+
+    def find_closest_cell(self, minimum_clearance, position):
+
+        # Returns the (row, column) of the cell with at least the minimum clearance that is closest to the position, or None if there are no cells with the minimum clearance
+
+        # If the position's cell has enough clearance
+        cell = self.tile_grid.find_cell(position = position)
+        if cell != None and self.clearances[(cell[0] * self.tile_grid.number_of_columns) + cell[1]] >= minimum_clearance:
+            return cell
+
+        candidate_cells = self.find_candidate_cells(minimum_clearance = minimum_clearance)
+
+        # If there are no cells with the minimum clearance
+        if len(candidate_cells) == 0:
+            return None
+
+        closest_cell_index = min(candidate_cells, key = lambda cell_index: dist(position, (((cell_index % self.tile_grid.number_of_columns) + 0.5) * TILE_SIZE, ((cell_index // self.tile_grid.number_of_columns) + 0.5) * TILE_SIZE)))
+        return divmod(closest_cell_index, self.tile_grid.number_of_columns)
+
+    def find_minimum_clearance(self, rect):
+
+        # Returns the minimum clearance that a cell needs so that the rect fits inside empty cells when centered anywhere inside the cell
+        return ceil((max(rect.width, rect.height) / 2) / TILE_SIZE) + 1
@@ -0,0 +1,292 @@
+from pygame.sprite import collide_mask as pygame_sprite_collide_mask
+from pygame.mask import Mask as pygame_mask_Mask
+from math import sqrt, ceil, floor
+
+class CollisionWorld:
+
+    # Finds collisions between entities on different layers (e.g. bamboo projectiles and the boss), calling the handler added for the pair of layers whenever two entities collide
+    """ Notes:
+    - Broad phase: Once per frame, the entities on every layer that is checked against are placed into a uniform grid, so that an entity is only checked against the entities inside the grid cells that its rect covers
+    - Narrow phase: Only pairs of layers with a handler are checked. Rect collisions are checked first, followed by a check that depends on the shapes of both layers (see narrow_phase_methods_dict)
+    - "Circle" entities are the circle inscribed inside their rect (e.g. stomp nodes, dive bomb attack circles), which are checked analytically so that they never need a scaled image or mask for collisions
+    - Layers that are already stored inside a grid (e.g. the tile grid) find their own candidates instead of being placed into the uniform grid
+    - The entities of a layer are checked in the order of the layer's container and the handlers are called in the order they were added, so collisions are always handled in the same order
+    """
+
+    def __init__(self, cell_size):
+
+        # The width and height of each cell in the uniform grid
+        self.cell_size = cell_size
+
+        # Dictionary containing the information of each layer
+        """ Format:
+        self.layers_dict[layer] = {"FindEntities": Function that returns the container of the layer's entities, "FindCandidates": Function that returns the entities inside the cells a rect covers, "Shape": "Mask", "Rect" or "Circle"}
+
+        - "FindCandidates" is None for layers placed into the uniform grid, "FindEntities" is None for layers that are never checked against other layers
+        """
+        self.layers_dict = {}
+
+        # Dictionary containing the handlers of each layer
+        """ Format:
+        self.handlers_dict[layer] = [(other layer, handler, first collision only, entity condition), ...] (in the order they were added)
+        """
+        self.handlers_dict = {}
+
+        # Dictionary containing the uniform grid of each layer that is checked against, created in the broad phase
+        """ Format:
+        self.broad_phase_dict[layer] = {"Entities": [entity, ...], "Cells": {(column, row): [entity index, ...]}}
+        """
+        self.broad_phase_dict = {}
+
+        # Dictionary containing the number of checks made for each pair of layers during the last frame
+        """
+        - BroadPhaseCandidates = The number of entities found inside the grid cells covered by the entities of the first layer
+        - RectCollisions = The number of candidates whose rects collided
+        - ShapeChecks = The number of analytic circle checks made
+        - MaskChecks = The number of pixel-perfect collision checks made
+        - Collisions = The number of times the handler was called
+        """
+        self.pair_statistics_dict = {}
+
+    def add_layer(self, layer, find_entities = None, find_candidates = None, shape = "Mask"):
+
+        # Adds a layer (replacing any existing layer with the same name, e.g. when a new boss is spawned)
+        """ Notes:
+        - find_entities is a function that returns the container (e.g. sprite group, projectile manager, list) holding the entities of the layer, so that the entities can change between frames
+        - find_candidates is a function that takes a rect and returns the entities inside the cells that the rect covers (for layers that are already stored inside a grid)
+        - shape is "Rect" for layers whose collisions only use rects, and "Circle" for layers whose entities are the circle inscribed inside their rect
+        """
+        self.layers_dict[layer] = {"FindEntities": find_entities, "FindCandidates": find_candidates, "Shape": shape}
+
+    def add_handler(self, layer, other_layer, handler, first_collision_only = False, entity_condition = None):
+
+        # Adds a function that is called with (entity, other entity) whenever an entity on the layer collides with an entity on the other layer
+        """ Notes:
+        - If first_collision_only is True, only the first entity on the other layer whose rect collides with the entity is checked (the same as pygame.Rect.collidedict / collidelist)
+        - entity_condition is a function that takes the entity and returns whether it should be checked against the other layer at all (e.g. only reflected stomp nodes can damage the boss), so that no broad / narrow phase checks are made for entities the handler would ignore
+        - If the handler returns True, the entity is not checked against any other layers for the rest of the frame (e.g. because the entity was removed)
+        - Handlers can be added before their layers, the handler is only used once both layers have been added
+        """
+
+        if layer not in self.handlers_dict:
+            self.handlers_dict[layer] = []
+        self.handlers_dict[layer].append((other_layer, handler, first_collision_only, entity_condition))
+
+        self.pair_statistics_dict[(layer, other_layer)] = {"BroadPhaseCandidates": 0, "RectCollisions": 0, "ShapeChecks": 0, "MaskChecks": 0, "Collisions": 0}
+
+    def update_broad_phase(self):
+
+        # Places the entities of every layer that is checked against into the uniform grid (called once per frame, before any collisions are handled)
+
+        # Reset the statistics of the last frame
+        for pair_statistics in self.pair_statistics_dict.values():
+            for statistic in pair_statistics:
+                pair_statistics[statistic] = 0
+
+        self.broad_phase_dict = {}
+
+        # Find all of the layers that are checked against
+        other_layers = {other_layer for handlers_list in self.handlers_dict.values() for other_layer, handler, first_collision_only, entity_condition in handlers_list}
+
+        for layer in other_layers:
+
+            # Skip layers that have not been added yet and layers that find their own candidates
+            if layer not in self.layers_dict or self.layers_dict[layer]["FindCandidates"] != None:
+                continue
+
+            entities_list = list(self.layers_dict[layer]["FindEntities"]())
+            cells_dict = {}
+
+            # Add the index of each entity to every cell that its rect covers
+            for index, entity in enumerate(entities_list):
+                for cell in self.find_cells(rect = entity.rect):
+                    if cell not in cells_dict:
+                        cells_dict[cell] = []
+                    cells_dict[cell].append(index)
+
+            self.broad_phase_dict[layer] = {"Entities": entities_list, "Cells": cells_dict}
+
+    def find_cells(self, rect):
+
+        # Returns the (column, row) of every cell in the uniform grid that the rect covers
+        return [
+                (column, row)
+                for column in range(rect.left // self.cell_size, ((rect.right - 1) // self.cell_size) + 1)
+                for row in range(rect.top // self.cell_size, ((rect.bottom - 1) // self.cell_size) + 1)
+                ]
+
+    def find_candidates(self, layer, rect):
+
+        # Returns the entities on the layer inside the cells that the rect covers (in the order of the layer's container), which may collide with the rect
+
+        # If the layer is already stored inside a grid
+        if self.layers_dict[layer]["FindCandidates"] != None:
+            return list(self.layers_dict[layer]["FindCandidates"](rect))
+
+        broad_phase = self.broad_phase_dict[layer]
+
+        # Find the indexes of the entities inside the cells
+        entity_indexes = set()
+        for cell in self.find_cells(rect = rect):
+            if cell in broad_phase["Cells"]:
+                entity_indexes.update(broad_phase["Cells"][cell])
+
+        # The container of the layer's entities
+        # Note: This is used to skip entities that have been removed since the broad phase (e.g. a chilli projectile destroyed by an earlier bamboo projectile)
+        entities_container = self.layers_dict[layer]["FindEntities"]()
+
+        return [broad_phase["Entities"][index] for index in sorted(entity_indexes) if broad_phase["Entities"][index] in entities_container]
+
+    def handle_layer_collisions(self, layer, other_layers = None):
+
+        # Checks every entity on the layer against the layers it has handlers for (or only the other layers passed in), calling the handlers for each collision
+
+        # If the layer has not been added yet
+        if layer not in self.layers_dict:
+            return
+
+        # Find the handlers for other layers that have been added
+        handlers_list = [
+                        (other_layer, handler, first_collision_only, entity_condition) for other_layer, handler, first_collision_only, entity_condition in self.handlers_dict.get(layer, [])
+                        if other_layer in self.layers_dict and (other_layers == None or other_layer in other_layers)
+                        ]
+
+        # Nothing to check
+        if len(handlers_list) == 0:
+            return
+
+        # For each entity on the layer
+        # Note: A copy of the entities is iterated over, so that entities can be removed by the handlers
+        for entity in list(self.layers_dict[layer]["FindEntities"]()):
+
+            for other_layer, handler, first_collision_only, entity_condition in handlers_list:
+
+                # Skip the other layer if the entity does not meet the handler's condition
+                if entity_condition != None and entity_condition(entity) == False:
+                    continue
+
+                pair_statistics = self.pair_statistics_dict[(layer, other_layer)]
+
+                # Find the method used to check for a collision between the shapes of the two layers (None if the rect collision is enough)
+                narrow_phase_method = CollisionWorld.narrow_phase_methods_dict.get((self.layers_dict[layer]["Shape"], self.layers_dict[other_layer]["Shape"]))
+
+                candidates_list = self.find_candidates(layer = other_layer, rect = entity.rect)
+                pair_statistics["BroadPhaseCandidates"] += len(candidates_list)
+
+                # Attribute used to stop checking the entity against other layers
+                stop_checking_entity = False
+
+                for other_entity in candidates_list:
+
+                    # Skip candidates whose rects do not collide with the entity's rect
+                    if entity.rect.colliderect(other_entity.rect) == False:
+                        continue
+                    pair_statistics["RectCollisions"] += 1
+
+                    # If there is a collision
+                    if narrow_phase_method == None or narrow_phase_method(self, entity, other_entity, pair_statistics) == True:
+                        pair_statistics["Collisions"] += 1
+                        stop_checking_entity = handler(entity, other_entity) == True
+
+                    # Only the first candidate whose rect collides is checked if first collision only is True
+                    if first_collision_only == True or stop_checking_entity == True:
+                        break
+
+                if stop_checking_entity == True:
+                    break
+
+    # --------------------------------------------------------------------------------------
+    # Narrow phase
+
+    def find_mask_collision(self, entity, other_entity, pair_statistics):
+
+        # Returns whether there is a pixel-perfect collision between two entities with masks
+        pair_statistics["MaskChecks"] += 1
+        return pygame_sprite_collide_mask(entity, other_entity) != None
+
+    def find_circle_collision(self, entity, other_entity, pair_statistics):
+
+        # Returns whether the circles inscribed inside the rects of two entities overlap
+        pair_statistics["ShapeChecks"] += 1
+        return (((entity.rect.x + (entity.rect.width / 2)) - (other_entity.rect.x + (other_entity.rect.width / 2))) ** 2) + \
+                (((entity.rect.y + (entity.rect.height / 2)) - (other_entity.rect.y + (other_entity.rect.height / 2))) ** 2) < (((entity.rect.width + other_entity.rect.width) / 2) ** 2)
+
+    def find_circle_and_rect_collision(self, circle_entity, other_entity, pair_statistics):
+
+        # Returns whether the circle inscribed inside the rect of the circle entity covers any pixel of the other entity's rect
+        pair_statistics["ShapeChecks"] += 1
+        return circle_covers_rect(circle_rect = circle_entity.rect, rect = other_entity.rect)
+
+    def find_circle_and_mask_collision(self, circle_entity, mask_entity, pair_statistics):
+
+        # Returns whether the circle inscribed inside the rect of the circle entity covers any set pixel of the other entity's mask
+        """ Notes:
+        - The circle is checked against the other entity's rect first, so most pairs never check a mask
+        - If the other entity's mask is completely filled (e.g. world / building tiles), the rect check is already pixel-perfect
+        """
+
+        pair_statistics["ShapeChecks"] += 1
+        if circle_covers_rect(circle_rect = circle_entity.rect, rect = mask_entity.rect) == False:
+            return False
+
+        # If every pixel of the mask is set
+        if mask_entity.mask.count() == mask_entity.rect.width * mask_entity.rect.height:
+            return True
+
+        # Check the mask against the (cached) mask of the circle
+        pair_statistics["MaskChecks"] += 1
+        return mask_entity.mask.overlap(
+                                        find_circle_mask(diameter = circle_entity.rect.width),
+                                        (circle_entity.rect.x - mask_entity.rect.x, circle_entity.rect.y - mask_entity.rect.y)
+                                        ) != None
+
+    # Dictionary containing the method used to check for a collision between each pair of shapes (pairs that are not inside the dictionary only need a rect collision)
+    # Note: The methods take the entity with the first shape first, so the entities are swapped for pairs where the circle is the second shape
+    narrow_phase_methods_dict = {
+                                ("Mask", "Mask"): find_mask_collision,
+                                ("Circle", "Circle"): find_circle_collision,
+                                ("Circle", "Rect"): find_circle_and_rect_collision,
+                                ("Rect", "Circle"): lambda self, entity, other_entity, pair_statistics: self.find_circle_and_rect_collision(other_entity, entity, pair_statistics),
+                                ("Circle", "Mask"): find_circle_and_mask_collision,
+                                ("Mask", "Circle"): lambda self, entity, other_entity, pair_statistics: self.find_circle_and_mask_collision(other_entity, entity, pair_statistics),
+                                }
+
+# Dictionary containing the mask of a circle for each diameter, used for pixel-perfect checks between circles and masks
+circle_masks_dict = {}
+
+def circle_covers_rect(circle_rect, rect):
+
+    # Returns whether the circle inscribed inside the circle rect covers the center of any pixel inside the rect
+    # Note: A pixel is covered by the circle if the center of the pixel is inside the circle (the same as the circle masks)
+
+    circle_radius = circle_rect.width / 2
+    circle_center_x = circle_rect.x + circle_radius
+    circle_center_y = circle_rect.y + (circle_rect.height / 2)
+
+    # Find the center of the pixel inside the rect that is closest to the center of the circle
+    closest_x = min(max(circle_center_x, rect.left + 0.5), rect.right - 0.5)
+    closest_y = min(max(circle_center_y, rect.top + 0.5), rect.bottom - 0.5)
+
+    return ((closest_x - circle_center_x) ** 2) + ((closest_y - circle_center_y) ** 2) < (circle_radius ** 2)
+
+def find_circle_mask(diameter):
+
+    # Returns the mask of a circle with the diameter, only building the mask if it has not already been built
+
+    if diameter not in circle_masks_dict:
+
+        circle_radius = diameter / 2
+        circle_mask = pygame_mask_Mask((diameter, diameter))
+
+        # Set the pixels of each row whose centers are inside the circle
+        for row in range(0, diameter):
+            half_width_squared = (circle_radius ** 2) - (((row + 0.5) - circle_radius) ** 2)
+            if half_width_squared > 0:
+                first_column = max(0, floor(circle_radius - sqrt(half_width_squared) - 0.5) + 1)
+                last_column = min(diameter - 1, ceil(circle_radius + sqrt(half_width_squared) - 0.5) - 1)
+                if last_column >= first_column:
+                    circle_mask.draw(pygame_mask_Mask((last_column - first_column + 1, 1), fill = True), (first_column, row))
+
+        circle_masks_dict[diameter] = circle_mask
+
+    return circle_masks_dict[diameter]
@@ -1,7 +1,7 @@
 from pygame.draw import rect as pygame_draw_rect
 from pygame.draw import line as pygame_draw_line
 from pygame import Rect as pygame_Rect
-from Global.functions import draw_text
+from Global.functions import draw_atlas_text
 from pygame import Surface as pygame_Surface
 from Global.settings import BAR_ALPHA_LEVEL
 
@@ -192,7 +192,7 @@ class DisplayCard:
                         )
         
         # Draw the display card number
-        draw_text(
+        draw_atlas_text(
                 text = str(self.display_card_number),
                 font = DisplayCard.tools_display_card_number_text_font,
                 text_colour = "white", 
@@ -219,7 +219,7 @@ class DisplayCard:
         existing_building_tiles_text = f'Number of tiles: {len(player_tools["BuildingTool"]["ExistingBuildingTilesList"])}/{player_tools["BuildingTool"]["MaximumNumberOfTilesAtOneTime"]}'
 
         # Draw the text displaying the number of building tiles that exist inside the map currently
-        draw_text(
+        draw_atlas_text(
                 text = existing_building_tiles_text, 
                 text_colour = "white",
                 font = self.text_font,
@@ -245,7 +245,7 @@ class DisplayCard:
         self.extra_information_dict["bamboo_resource_text"] = amount_of_bamboo_resource_text
 
         # Draw the text displaying the amount of bamboo resource
-        draw_text(
+        draw_atlas_text(
                 text = amount_of_bamboo_resource_text, 
                 text_colour = "white",
                 font = self.text_font,
@@ -377,7 +377,7 @@ class DisplayCard:
         # Player health text
 
         # Draw the text displaying the player's health
-        draw_text(
+        draw_atlas_text(
                 text = players_health_text, 
                 text_colour = "white",
                 font = self.text_font,
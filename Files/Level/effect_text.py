@@ -1,8 +1,19 @@
+from Global.functions import draw_atlas_text
+from Global.object_pool import ObjectPool
+from pygame import Surface as pygame_Surface
+
 class EffectText:
 
     # effect_text_group = []
 
-    def __init__(self, x, y, colour, display_time, text, font, alpha_surface, alpha_level, type_of_effect_text):
+    def __init__(self, x, y, colour, display_time, text, font, alpha_surface_size, alpha_level, type_of_effect_text):
+
+        # Set up the effect text
+        self.reset(x = x, y = y, colour = colour, display_time = display_time, text = text, font = font, alpha_surface_size = alpha_surface_size, alpha_level = alpha_level, type_of_effect_text = type_of_effect_text)
+
+    def reset(self, x, y, colour, display_time, text, font, alpha_surface_size, alpha_level, type_of_effect_text):
+
+        # Sets up the effect text (also used when the effect text is re-used by the object pool)
 
         # Colour of the text
         self.colour = colour
@@ -23,11 +34,21 @@ class EffectText:
         # The font
         self.font = font
 
-        # The alpha surface the effect text will be drawn onto
-        self.alpha_surface = alpha_surface
+        # The alpha surface the effect text will be drawn onto (the alpha surface of a re-used effect text is kept if it is already the correct size)
+        if hasattr(self, "alpha_surface") == False or self.alpha_surface.get_size() != tuple(alpha_surface_size):
+            self.alpha_surface = pygame_Surface(alpha_surface_size)
+            self.alpha_surface.set_colorkey("black")
+
+        # Draw the text onto the alpha surface (only once, as the text never changes)
+        self.alpha_surface.fill("black")
+        draw_atlas_text(text = self.text, text_colour = self.colour, font = self.font, x = 0, y = 0, surface = self.alpha_surface)
 
         # The starting alpha level of the alpha surface
         self.alpha_level = alpha_level
+        self.alpha_surface.set_alpha(self.alpha_level)
 
         # Add self to the effect text list
-        EffectText.effect_text_list.append(self)
\ No newline at end of file
+        EffectText.effect_text_list.append(self)
+
+# Object pool used to re-use effect text instead of creating new effect text
+EffectText.pool = ObjectPool(object_class = EffectText)
@@ -0,0 +1,142 @@
+from Global.settings import TILE_SIZE
+from array import array
+from collections import deque
+from math import atan2, pi
+
+class FlowField:
+
+    # The distance stored for cells that cannot reach the target cell (e.g. cells holding a tile, cells walled off from the target)
+    unreachable_distance = 0xFFFF
+
+    # The (column change, row change) of each neighbouring cell, orthogonal neighbours first
+    neighbour_offsets = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+    def __init__(self, tile_grid):
+
+        # Breadth-first distance map over the tile grid from the target's cell (i.e. the player's cell), shared by every AI that chases the target
+        """ Notes:
+        - Cells holding world tiles or building tiles are blocked
+        - The distance map is only recomputed when the target moves into a different cell, or when a cell changes between blocked and unblocked (e.g. a building tile is placed / removed)
+        - Finding the direction to move in from a position is then a look-up of the neighbouring cells of the position's cell
+        """
+
+        # The tile grid that the flow field is built over
+        self.tile_grid = tile_grid
+
+        # Compact array holding whether each cell is blocked (in row-major order)
+        self.blocked_cells = array("B", (1 if 1 <= tile_number <= 4 else 0 for tile_number in tile_grid.cells))
+
+        # Compact array holding the number of cells between each cell and the target's cell (in row-major order)
+        self.distances = array("H", [FlowField.unreachable_distance]) * len(tile_grid.cells)
+
+        # The (row, column) of the target's cell (None until the target has been set)
+        self.target_cell = None
+
+        # Whether the distance map needs to be recomputed before it is next used
+        self.dirty = True
+
+        # Mark the distance map as dirty whenever a cell changes between blocked and unblocked
+        self.tile_grid.cell_changed_functions_list.append(self.invalidate_cell)
+
+    def invalidate_cell(self, row, column):
+
+        # Updates whether the cell is blocked, marking the distance map as dirty if this has changed
+
+        cell_index = (row * self.tile_grid.number_of_columns) + column
+        blocked = 1 if 1 <= self.tile_grid.cells[cell_index] <= 4 else 0
+
+        if self.blocked_cells[cell_index] != blocked:
+            self.blocked_cells[cell_index] = blocked
+            self.dirty = True
+
+    def set_target(self, position):
+
+        # Sets the position that the flow field leads towards, marking the distance map as dirty if the position is inside a different cell
+
+        target_cell = self.tile_grid.find_cell(position = position)
+
+        if target_cell != self.target_cell:
+            self.target_cell = target_cell
+            self.dirty = True
+
+    def compute_distances(self):
+
+        # Recomputes the distance map with a breadth-first search outwards from the target's cell (only moving between orthogonal neighbours)
+
+        number_of_columns = self.tile_grid.number_of_columns
+        number_of_rows = self.tile_grid.number_of_rows
+
+        # Reset the distances
+        self.distances = array("H", [FlowField.unreachable_distance]) * len(self.distances)
+        self.dirty = False
+
+        # No target inside the tile map
+        if self.target_cell == None:
+            return
+
+        target_index = (self.target_cell[0] * number_of_columns) + self.target_cell[1]
+        self.distances[target_index] = 0
+        cells_to_visit = deque([target_index])
+
+        while len(cells_to_visit) > 0:
+
+            cell_index = cells_to_visit.popleft()
+            row, column = divmod(cell_index, number_of_columns)
+            next_distance = self.distances[cell_index] + 1
+
+            # For each orthogonal neighbour inside the tile map
+            for neighbour_column_change, neighbour_row_change in FlowField.neighbour_offsets[0:4]:
+                neighbour_row = row + neighbour_row_change
+                neighbour_column = column + neighbour_column_change
+                if 0 <= neighbour_row < number_of_rows and 0 <= neighbour_column < number_of_columns:
+                    neighbour_index = (neighbour_row * number_of_columns) + neighbour_column
+
+                    # If the neighbour is not blocked and has not been visited yet
+                    if self.blocked_cells[neighbour_index] == 0 and self.distances[neighbour_index] == FlowField.unreachable_distance:
+                        self.distances[neighbour_index] = next_distance
+                        cells_to_visit.append(neighbour_index)
+
+    def find_angle(self, position):
+
+        # Returns the angle (anti-clockwise from the positive x axis) from the position towards the center of the neighbouring cell that is closest to the target, or None if the position's cell cannot reach the target or is the target's cell
+        # Note: Diagonal neighbours are only used if both of the orthogonal neighbours next to them are not blocked, so that the path does not cut through the corners of tiles
+
+        # Recompute the distance map if it is out of date
+        if self.dirty == True:
+            self.compute_distances()
+
+        cell = self.tile_grid.find_cell(position = position)
+
+        # If the position is outside of the tile map, or the cell cannot reach the target, or the position is already inside the target's cell
+        if cell == None or self.distances[(cell[0] * self.tile_grid.number_of_columns) + cell[1]] in (0, FlowField.unreachable_distance):
+            return None
+
+        row, column = cell
+        number_of_columns = self.tile_grid.number_of_columns
+        number_of_rows = self.tile_grid.number_of_rows
+
+        # Find the neighbouring cell with the smallest distance to the target
+        closest_neighbour = None
+        closest_distance = self.distances[(row * number_of_columns) + column]
+
+        for neighbour_column_change, neighbour_row_change in FlowField.neighbour_offsets:
+            neighbour_row = row + neighbour_row_change
+            neighbour_column = column + neighbour_column_change
+
+            # Skip neighbours outside of the tile map
+            if not (0 <= neighbour_row < number_of_rows and 0 <= neighbour_column < number_of_columns):
+                continue
+
+            # Skip diagonal neighbours that would cut through the corner of a blocked cell
+            if neighbour_row_change != 0 and neighbour_column_change != 0 and \
+                (self.blocked_cells[(row * number_of_columns) + neighbour_column] == 1 or self.blocked_cells[(neighbour_row * number_of_columns) + column] == 1):
+                continue
+
+            if self.distances[(neighbour_row * number_of_columns) + neighbour_column] < closest_distance:
+                closest_neighbour = (neighbour_row, neighbour_column)
+                closest_distance = self.distances[(neighbour_row * number_of_columns) + neighbour_column]
+
+        # Find the angle towards the center of the closest neighbour
+        dx = ((closest_neighbour[1] + 0.5) * TILE_SIZE) - position[0]
+        dy = ((closest_neighbour[0] + 0.5) * TILE_SIZE) - position[1]
+        return atan2(-dy, dx) % (2 * pi)
@@ -1,35 +1,39 @@
 from Global.settings import TILE_SIZE, screen_height, screen_width
+from Global.functions import reset_mask_registry_frame_count
+from Global.object_pool import recycle_released_pool_instances
+from Global.asset_manager import asset_manager
 from Level.world_tile import WorldTile
 from Level.Player.player import Player
 from Level.game_ui import GameUI
-from Level.bamboo_pile import BambooPile
+from Level.bamboo_pile import BambooPile, BambooPileSpawnIndex
+from Level.Player.bamboo_projectiles import BambooProjectile
+from Level.tile_layer_renderer import TileLayerRenderer
+from Level.tile_grid import TileGrid, TileHandle
+from Level.flow_field import FlowField
+from Level.clearance_map import ClearanceMap
+from Level.projectile_manager import ProjectileManager
+from Level.collision_world import CollisionWorld
 from random import choice as random_choice
 from random import randrange as random_randrange
 from random import uniform as random_uniform
-from math import sin, cos, dist, atan2, degrees, pi
-from os import listdir as os_listdir
+from math import sin, cos
 
 from pygame.display import get_surface as pygame_display_get_surface
 from pygame import Surface as pygame_Surface
 from pygame.sprite import Group as pygame_sprite_Group
 from pygame.sprite import GroupSingle as pygame_sprite_GroupSingle
 from pygame.sprite import collide_mask as pygame_sprite_collide_mask
-from pygame.image import load as pygame_image_load
 from pygame.transform import smoothscale as pygame_transform_smoothscale
 from pygame.transform import scale as pygame_transform_scale
-from pygame.transform import flip as pygame_transform_flip
-from pygame.sprite import spritecollide as pygame_sprite_spritecollide
-from pygame.sprite import collide_rect as pygame_sprite_collide_rect
 from pygame.key import get_pressed as pygame_key_get_pressed
 from pygame import K_f as pygame_K_f
 from pygame.draw import rect as pygame_draw_rect
 from pygame.draw import circle as pygame_draw_circle
-from pygame.mixer import Sound as pygame_mixer_Sound
 from pygame.mouse import get_pressed as pygame_mouse_get_pressed
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, sounds_dict):
 
         # Screen
         self.screen = pygame_display_get_surface()  
@@ -114,11 +118,8 @@ class Game:
 
         # --------------------------------------------------------------------------------------
         # Groups
-        self.world_tiles_dict = {} # Dictionary used to hold all the world tiles 
-        self.world_tiles_group = pygame_sprite_Group()
         # self.player_group = pygame_sprite_GroupSingle(self.player) This was created inside the create_objects_tile_map method
-        self.bamboo_projectiles_group = pygame_sprite_Group() # Group for all bamboo projectiles for the player
-        self.empty_tiles_dict = {} # Dictionary used to hold all of the empty tiles in the tile map
+        self.bamboo_projectiles_manager = ProjectileManager(maximum_lifetime = 5, object_pool = BambooProjectile.pool) # Manager for all bamboo projectiles for the player (a projectile crosses the entire tile map in under 3 seconds, so any projectile older than 5 seconds is removed)
         self.bamboo_piles_group = pygame_sprite_Group()
         self.boss_group = pygame_sprite_GroupSingle()
         # self.stomp_attack_nodes_group
@@ -138,7 +139,7 @@ class Game:
         # ---------------------------------------------------------------------------------
         # Cursor images
 
-        self.default_cursor_image = pygame_image_load("graphics/Cursors/Default.png").convert_alpha()
+        self.default_cursor_image = asset_manager.get_image(path = "graphics/Cursors/Default.png")
 
         # --------------------------------------------------------------------------------------
         # Bamboo piles
@@ -158,7 +159,8 @@ class Game:
         # Sound
 
         # [Sound, Timer]
-        self.sounds_dictionary = {os_listdir("sounds")[i].strip(".wav"): [pygame_mixer_Sound(f"sounds/{os_listdir('sounds')[i]}"), None] for i in range(0, len(os_listdir("sounds")))}
+        # Note: The sounds are decoded by the asset loader (while the menu is being shown)
+        self.sounds_dictionary = {sound_name: [sound, None] for sound_name, sound in sounds_dict.items()}
         self.sound_cooldown_timer = None
 
         # Adjusting volume
@@ -626,7 +628,8 @@ class Game:
         # Loads the images of all the world tiles
 
         # Create a dictionary filled with all of the tiles' images
-        self.tile_images = {int(os_listdir("graphics/Tiles")[i].strip(".png")): pygame_image_load(f"graphics/Tiles/{os_listdir('graphics/Tiles')[i]}").convert() for i in range(0, len(os_listdir("graphics/Tiles")))} 
+        # Note: The tile number of each image is its file name (e.g. "graphics/Tiles/1.png" is world tile 1)
+        self.tile_images = {int(path.rsplit("/", 1)[1][:-len(".png")]): asset_manager.get_image(path = path, alpha = False) for path in asset_manager.find_paths(folder = "graphics/Tiles")}
 
     def create_objects_tile_map(self, non_transformed_tile_map):
 
@@ -637,6 +640,18 @@ class Game:
         # Used so that the divebomb mechanic for the golden monkey boss doesn't result in him being spawned inside a tile)
         self.tile_map = non_transformed_tile_map
 
+        # Create the tile grid, which stores the type and object of every cell in the tile map
+        self.tile_grid = TileGrid(tile_map = non_transformed_tile_map)
+
+        # Create the tile layer renderer, which bakes the world tiles and empty tiles into cached chunks
+        self.tile_layer_renderer = TileLayerRenderer(surface = self.scaled_surface, tile_grid = self.tile_grid)
+
+        # Create the flow field, which the bosses follow to chase the player around world / building tiles
+        self.flow_field = FlowField(tile_grid = self.tile_grid)
+
+        # Create the clearance map, which finds where the bosses fit when being spawned / landing from a divebomb
+        self.clearance_map = ClearanceMap(tile_grid = self.tile_grid)
+
         # For all rows of objects in the tile map
         for row_index, row in enumerate(non_transformed_tile_map):
             # For each item in each row
@@ -654,26 +669,22 @@ class Game:
                                         x = (column_index * TILE_SIZE), 
                                         y = (row_index * TILE_SIZE), 
                                         surface = self.scaled_surface, 
-                                        sprite_groups = {"WorldTiles": self.world_tiles_group, "BambooProjectiles": self.bamboo_projectiles_group, "ReplacedEmptyTiles": self.replaced_empty_tiles_dict}
+                                        sprite_groups = {"BambooProjectiles": self.bamboo_projectiles_manager, "ReplacedEmptyTiles": self.replaced_empty_tiles_dict}
                                         )
 
                     # Add the player to its group
                     self.player_group = pygame_sprite_GroupSingle(self.player)
 
-        
-                    # Create an empty tile where the player spawned (so that the player can place a building tile on that tile)
-                    empty_tile = WorldTile(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.tile_images[0])
-                    self.empty_tiles_dict[empty_tile] = 0
-
                 # Identify the tile map object
                 match tile_map_object:
                     
                     # Empty tiles
                     case 0:     
                         
-                        # Create an empty tile where the player spawned (so that the player can place a building tile on that tile)
-                        empty_tile = WorldTile(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.tile_images[0])
-                        self.empty_tiles_dict[empty_tile] = 0
+                        # Create an empty tile (so that the player can place a building tile on that tile)
+                        # Note: This also creates the empty tile where the player spawned, as the middle of the tile map is always empty
+                        empty_tile = TileHandle(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.tile_images[0])
+                        self.tile_grid.set_tile(tile = empty_tile, tile_type = "Empty")
                         
                     # World tile 1
                     case _ if tile_map_object == 1 or tile_map_object == 2 or tile_map_object == 3:
@@ -681,23 +692,26 @@ class Game:
                         # Create a world tile
                         world_tile = WorldTile(x = (column_index * TILE_SIZE), y = (row_index * TILE_SIZE), image = self.tile_images[tile_map_object])
 
-                        # Add the world tile to the world tiles dictionary
-                        # The key is the world tile because we use pygame.rect.collidedict in other areas of the code, the value is the type of world tile (The other type is building tiles)
-                        self.world_tiles_dict[world_tile] = "WorldTile"
+                        # Add it to the tile grid
+                        self.tile_grid.set_tile(tile = world_tile, tile_type = "WorldTile", tile_number = tile_map_object)
 
-                        # Add it to the group of world tiles (For collisions with other objects, excluding the player)
-                        self.world_tiles_group.add(world_tile)
 
+        # Create the spawn index of the empty tiles that bamboo piles can spawn on (kept up to date by the tile grid when building tiles / bamboo piles are placed and removed)
+        self.bamboo_pile_spawn_index = BambooPileSpawnIndex(tile_grid = self.tile_grid, middle_position = (self.middle_tile_position[0] + (TILE_SIZE / 2), self.middle_tile_position[1] + (TILE_SIZE / 2)))
 
         # Save the last tile position so that we can update the camera and limit the player's movement
         self.last_tile_position = [len(non_transformed_tile_map[0]) * TILE_SIZE, len(non_transformed_tile_map) * TILE_SIZE]
         self.player.last_tile_position = self.last_tile_position
 
-        # Save a copy of the world tiles dict for the player, this is for updating the world tiles dict when building tiles are created.
-        self.player.world_tiles_dict = self.world_tiles_dict
+        # Remove bamboo projectiles that leave the tile map, and stop fast bamboo projectiles at the first tile along their path
+        self.bamboo_projectiles_manager.map_size = self.last_tile_position
+        self.bamboo_projectiles_manager.tile_grid = self.tile_grid
 
-        # Save a copy of the empty tiles dict for the player, allowing the player to see which tiles can be replaced with building tiles
-        self.player.empty_tiles_dict = self.empty_tiles_dict
+        # Save a reference to the tile grid for the player, so that the grid can be updated when building tiles are placed / removed, and so that the player can be swept through the grid when moving
+        self.player.tile_grid = self.tile_grid
+
+        # Create the collision world, which finds the collisions between objects
+        self.create_collision_world()
 
         # Set the camera mode 
         self.set_camera_mode()
@@ -714,26 +728,14 @@ class Game:
     def draw_empty_tiles(self):
         
         # Draws the empty tiles
-
-        for empty_tile in self.empty_tiles_dict.keys():
-            # If the empty tile is within view of the camera (i.e. on the screen)
-            if self.camera_position[0] - TILE_SIZE <= empty_tile.rect.x <= (self.camera_position[0] + (self.scaled_surface.get_width())) + TILE_SIZE and \
-                self.camera_position[1] - TILE_SIZE <= empty_tile.rect.y <= (self.camera_position[1] + (self.scaled_surface.get_height())) + TILE_SIZE:
-                
-                # Draw the empty tile onto the screen
-                empty_tile.draw(surface = self.scaled_surface, x = (empty_tile.rect.x - self.camera_position[0]), y = (empty_tile.rect.y - self.camera_position[1])) 
+        # Note: Only the cached chunks that are within view of the camera are drawn
+        self.tile_layer_renderer.draw_layer(layer = "Empty", camera_position = self.camera_position)
 
     def draw_world_tiles(self):
 
         # Draws the world tiles
-
-        for tile in self.world_tiles_dict.keys():
-            # If the tile object is within view of the camera (i.e. on the screen)
-            if self.camera_position[0] - TILE_SIZE <= tile.rect.x <= (self.camera_position[0] + (self.scaled_surface.get_width())) + TILE_SIZE and \
-                self.camera_position[1] - TILE_SIZE <= tile.rect.y <= (self.camera_position[1] + (self.scaled_surface.get_height())) + TILE_SIZE:
-                
-                # Draw the world / building tile onto the screen
-                tile.draw(surface = self.scaled_surface, x = (tile.rect.x - self.camera_position[0]), y = (tile.rect.y - self.camera_position[1]))         
+        # Note: Only the cached chunks that are within view of the camera are drawn
+        self.tile_layer_renderer.draw_layer(layer = "World", camera_position = self.camera_position)
 
     def draw_tiles(self):
         
@@ -752,10 +754,8 @@ class Game:
 
         # Draws bamboo projectiles
 
-        for bamboo_projectile in self.bamboo_projectiles_group:
-            # Draw the bamboo projectile 
-            # pygame_draw_rect(self.scaled_surface, "white", (bamboo_projectile.rect.x - self.camera_position[0], bamboo_projectile.rect.y - self.camera_position[1], bamboo_projectile.rect.width, bamboo_projectile.rect.height), 0)
-            bamboo_projectile.draw(surface = self.scaled_surface, x = bamboo_projectile.rect.x - self.camera_position[0], y = bamboo_projectile.rect.y - self.camera_position[1])
+        # Draw all of the bamboo projectiles that are on the screen
+        self.bamboo_projectiles_manager.draw(surface = self.scaled_surface, camera_position = self.camera_position)
 
     def draw_bamboo_piles(self):
 
@@ -796,288 +796,357 @@ class Game:
         # pygame.draw.line(self.scaled_surface, "pink", ((self.player.rect.left - TILE_SIZE) * 1 - self.camera_position[0], 0 - self.camera_position[1]), ((self.player.rect.left - TILE_SIZE) * 1 - self.camera_position[0], screen_height))
         # pygame.draw.line(self.scaled_surface, "pink", ((self.player.rect.right + TILE_SIZE) * 1 - self.camera_position[0], 0 - self.camera_position[1]), ((self.player.rect.right + TILE_SIZE) * 1 - self.camera_position[0], screen_height))
 
-        # For each tile in the world tiles dictionary (Can be a building tile or a world tile)
-        for tile in self.world_tiles_dict.keys():
+        # ------------------------------------------------------------------------
+        # Player
+
+        # For each tile inside the player's neighbouring tiles dictionary
+        for tile in tuple(self.player.neighbouring_tiles_dict.keys()):
 
+            # If the tile is not within 2 tiles of the player (horizontally and vertically)
+            if not ((self.player.rect.left  - (TILE_SIZE * 2) <= tile.rect.centerx <= self.player.rect.right + (TILE_SIZE * 2)) and (self.player.rect.top - (TILE_SIZE * 2) <= tile.rect.centery <= (self.player.rect.bottom + TILE_SIZE * 2))):
+                # Remove the world/ building tile from the player's neighbouring tiles dictionary
+                self.player.neighbouring_tiles_dict.pop(tile)
 
-            # ------------------------------------------------------------------------
-            # Player
+        # For each world / building tile inside the cells around the player
+        """ Note: Only the cells around the player are checked, rather than every tile inside the tile map"""
+        for tile in self.tile_grid.find_world_tiles(rect = self.player.rect.inflate(TILE_SIZE * 6, TILE_SIZE * 6)).keys():
 
             # If the tile is within 2 tiles of the player (horizontally and vertically)
             if (self.player.rect.left  - (TILE_SIZE * 2) <= tile.rect.centerx <= self.player.rect.right + (TILE_SIZE * 2)) and (self.player.rect.top - (TILE_SIZE * 2) <= tile.rect.centery <= (self.player.rect.bottom + TILE_SIZE * 2)):
                 # Add it to the player's neighbouring tiles dictionary
                 self.player.neighbouring_tiles_dict[tile] = 0 
 
-            # If the tile is not within 2 tiles of the player (horizontally and vertically)
-            else:
-                # If the tile is inside the player's neighbouring tiles dict's keys
-                if tile in self.player.neighbouring_tiles_dict.keys():
-                    # Remove the world/ building tile from the player's neighbouring tiles dictionary
-                    self.player.neighbouring_tiles_dict.pop(tile)
-                    
-            # ------------------------------------------------------------------------
-            # Bosses
+    def create_collision_world(self):
 
-            # If there is a current boss that has been spawned
-            if self.boss_group.sprite != None:
+        # Creates the collision world, which finds the collisions between objects for handle_collisions
+        # Note: The layers for boss attacks (i.e. stomp attack nodes, chilli projectiles and dive bomb attack circles) are added when the boss is spawned
+
+        self.collision_world = CollisionWorld(cell_size = 4 * TILE_SIZE)
+
+        # --------------------------------------------------------------------------------------
+        # Layers
+
+        self.collision_world.add_layer(layer = "BambooProjectiles", find_entities = lambda: self.bamboo_projectiles_manager)
+        self.collision_world.add_layer(layer = "Player", find_entities = lambda: self.player_group)
+        self.collision_world.add_layer(layer = "Boss", find_entities = lambda: self.boss_group)
+        self.collision_world.add_layer(layer = "BambooPiles", find_entities = lambda: self.bamboo_piles_group, shape = "Rect") # Bamboo piles are picked up on a rect collision
+
+        # World / building tiles are already stored inside the tile grid, so they find their own candidates (world tiles before building tiles)
+        self.collision_world.add_layer(layer = "Tiles", find_candidates = lambda rect: self.tile_grid.find_world_tiles(rect = rect))
+
+        # Building tiles only (in the order that they were placed)
+        self.collision_world.add_layer(layer = "BuildingTiles", find_entities = lambda: self.player.tools["BuildingTool"]["ExistingBuildingTilesList"])
+
+        # --------------------------------------------------------------------------------------
+        # Handlers
+        # Note: For each layer, the handlers are called in the order they are added
+
+        # Bamboo projectiles
+        self.collision_world.add_handler(layer = "BambooProjectiles", other_layer = "Tiles", handler = self.handle_bamboo_projectile_and_tile_collision, first_collision_only = True)
+        self.collision_world.add_handler(layer = "BambooProjectiles", other_layer = "Boss", handler = self.handle_bamboo_projectile_and_boss_collision)
+        self.collision_world.add_handler(layer = "BambooProjectiles", other_layer = "ChilliProjectiles", handler = self.handle_bamboo_projectile_and_chilli_projectile_collision, first_collision_only = True)
+
+        # Player
+        self.collision_world.add_handler(layer = "Player", other_layer = "BambooPiles", handler = self.handle_player_and_bamboo_pile_collision, first_collision_only = True)
+
+        # Stomp attack nodes
+        self.collision_world.add_handler(layer = "StompNodes", other_layer = "Tiles", handler = self.handle_stomp_node_and_tile_collision, first_collision_only = True)
+        self.collision_world.add_handler(layer = "StompNodes", other_layer = "Player", handler = self.handle_stomp_node_and_player_collision)
+        self.collision_world.add_handler(layer = "StompNodes", other_layer = "Boss", handler = self.handle_stomp_node_and_boss_collision, entity_condition = lambda stomp_attack_node: stomp_attack_node.reflected == True) # Only reflected stomp nodes can damage the boss
+
+        # Chilli projectiles
+        self.collision_world.add_handler(layer = "ChilliProjectiles", other_layer = "Tiles", handler = self.handle_chilli_projectile_and_tile_collision, first_collision_only = True)
+        self.collision_world.add_handler(layer = "ChilliProjectiles", other_layer = "Player", handler = self.handle_chilli_projectile_and_player_collision)
+
+        # Bosses
+        self.collision_world.add_handler(layer = "Boss", other_layer = "BuildingTiles", handler = self.handle_boss_and_building_tile_collision, first_collision_only = True)
+        self.collision_world.add_handler(layer = "Boss", other_layer = "Player", handler = self.handle_boss_and_player_collision)
+
+        # Dive bomb attack circles
+        self.collision_world.add_handler(layer = "DiveBomb", other_layer = "BuildingTiles", handler = self.handle_dive_bomb_and_building_tile_collision)
+        self.collision_world.add_handler(layer = "DiveBomb", other_layer = "Player", handler = self.handle_dive_bomb_and_player_collision)
 
-                # If the tile is within 2 tiles of the current boss (horizontally and vertically)
-                if (self.boss_group.sprite.rect.left  - (TILE_SIZE * 3) <= tile.rect.centerx <= self.boss_group.sprite.rect.right + (TILE_SIZE * 3)) and (self.boss_group.sprite.rect.top - (TILE_SIZE * 3) <= tile.rect.centery <= (self.boss_group.sprite.rect.bottom + TILE_SIZE * 3)):
-                    
-                    if self.world_tiles_dict[tile] != "BuildingTile":
-                        # Add it to the current boss' neighbouring tiles dictionary
-                        self.boss_group.sprite.neighbouring_tiles_dict[tile] = 0 
-                # If the tile is not within 2 tiles of the current boss (horizontally and vertically)
-                else:
-                    # If the tile is inside the current boss' neighbouring tiles dict's keys
-                    if tile in self.boss_group.sprite.neighbouring_tiles_dict.keys():
-                        # Remove the world/ building tile from the current boss' neighbouring tiles dictionary
-                        self.boss_group.sprite.neighbouring_tiles_dict.pop(tile)
-                        
     def handle_collisions(self):
 
         # Handles collisions between objects (including the player). Collisions between the world tiles and the player are within the Player class.
+        # Note: The collisions between each pair of objects are found by the collision world, which calls the handler methods below
+
+        # Place the objects into the collision world's broad phase grid
+        self.collision_world.update_broad_phase()
 
         # --------------------------------------------------------------------------------------
-        # Bamboo projectiles 
+        # Bamboo projectiles (with world / building tiles, bosses and chilli projectiles)
+        self.collision_world.handle_layer_collisions(layer = "BambooProjectiles")
 
-        
-        # If there are any bamboo projectiles
-        if len(self.bamboo_projectiles_group) > 0:
-
-            # For each bamboo projectile 
-            for bamboo_projectile in self.bamboo_projectiles_group:
-
-                # --------------------------------
-                # World / building tiles
-
-                # Check for a rect collision between the bamboo projectile and world / building tiles inside the world tiles dictionary
-                tile_collision_result = bamboo_projectile.rect.collidedict(self.world_tiles_dict)
-
-                # If the bamboo_projectile collided with a tile
-                if tile_collision_result != None:
-
-                    # Check for a pixel-perfect collision between the bamboo projectile and the world tile that the bamboo_projectile's rect collided with
-                    if pygame_sprite_collide_mask(bamboo_projectile, tile_collision_result[0]) != None:
-
-                        # If this bamboo projectile was shot from the bamboo launcher
-                        if bamboo_projectile.is_bamboo_launcher_projectile == True:
-                            
-                            # Create a bamboo projectiles explosion (shoots projectiles in a circle)
-                            self.player.create_bamboo_projectiles_explosion(projectile = bamboo_projectile)
-
-                            # Create many shattered bamboo pieces
-                            self.game_ui.create_angled_polygons_effects(
-                                                                        purpose = "ShatteredBambooPieces",
-                                                                        position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
-                                                                        specified_number_of_pieces = random_randrange(15, 25)
-                                                                        )
-                        # If this bamboo projectile was not shot from the bamboo launcher
-                        elif bamboo_projectile.is_bamboo_launcher_projectile == False:
-                            # Create a few shattered bamboo pieces
-                            self.game_ui.create_angled_polygons_effects(
-                                                                        purpose = "ShatteredBambooPieces",
-                                                                        position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
-                                                                        angle = bamboo_projectile.angle,
-                                                                        specified_number_of_pieces = random_randrange(2, 6)
-                                                                        )
-
-                        # If there is a pixel-perfect collision, remove the bamboo_projectile from the specified group
-                        self.bamboo_projectiles_group.remove(bamboo_projectile)
-
-                # --------------------------------
-                # Bosses
-
-                # If a boss has been spawned
-                if self.boss_group.sprite != None:
-
-                    # If the bamboo projectile's rect has collided with the current boss' rect
-                    if bamboo_projectile.rect.colliderect(self.boss_group.sprite.rect) == True:
-                        
-                        # Check for a pixel-perfect collision between the bamboo projectile and the current boss
-                        if pygame_sprite_collide_mask(bamboo_projectile, self.boss_group.sprite) != None:
-                            # If there is a pixel-perfect collision:
-
-                            # ------------------------------------------------------------------------------------------------------------------------------------------------
-                            # Damage
-
-                            # Damage the current boss by the amount of damage that was passed into the bamboo projectile and a random additive damage amount (e.g. 25 - 3)
-                            # Note: This allows for different damage values for e.g. different weapons
-                            randomised_damage_amount =  random_randrange(-3, 3)
-
-                            # If the current boss is the "SikaDeer"
-                            if self.bosses_dict["CurrentBoss"] == "SikaDeer":
-                                # If the deer boss is stunned
-                                if self.boss_group.sprite.current_action == "Stunned":
-                                    # Increase the base damage of the bamboo projectile by the damage multiplier dealt to the deer boss when stunned, plus a random damage amount
-                                    total_damage_dealt = (bamboo_projectile.damage_amount * self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["PlayerDamageMultiplierWhenStunned"]) + randomised_damage_amount
-
-                                # If the deer boss is not stunned
-                                elif self.boss_group.sprite.current_action != "Stunned":
-                                    # Set the total damage to be the base damage amount plus a random damage amount
-                                    total_damage_dealt = bamboo_projectile.damage_amount + randomised_damage_amount
-
-                            # If the current boss is the "GoldenMonkey"
-                            elif self.bosses_dict["CurrentBoss"] == "GoldenMonkey":
-                                # If the golden monkey boss is currently sleeping
-                                if self.boss_group.sprite.current_action == "Sleep":
-                                    # Increase the base damage of the bamboo projectile by the damage multiplier dealt to the deer boss when stunned, plus a random damage amount
-                                    total_damage_dealt = (bamboo_projectile.damage_amount * self.boss_group.sprite.behaviour_patterns_dict["Sleep"]["PlayerDamageMultiplierWhenBossIsSleeping"]) + randomised_damage_amount
-                                
-                                # If the golden monkey boss is not sleeping
-                                elif self.boss_group.sprite.current_action != "Sleep":
-                                    # Set the total damage to be the base damage amount plus a random damage amount
-                                    total_damage_dealt = bamboo_projectile.damage_amount + randomised_damage_amount
-
-                            # Deal damage to the boss
-                            self.boss_group.sprite.extra_information_dict["CurrentHealth"] -= total_damage_dealt
-
-                            # ------------------------------------------------------------------------------------------------------------------------------------------------
-                            # Additional
-
-                            # Play the boss' damaged flash effect
-                            self.boss_group.sprite.extra_information_dict["DamagedFlashEffectTimer"] = self.boss_group.sprite.extra_information_dict["DamagedFlashEffectTime"]
-
-                            # If the player's frenzy mode is not activated and the current boss is alive
-                            if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None and self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
-                                # Increase the player's frenzy mode meter by the deal damage increment amount, limiting it to the maximum frenzy mode value
-                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
-                                                                                                    self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["DealDamageFrenzyModeIncrement"],
-                                                                                                    self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
-                                                                                                    )
-                                # Create frenzy mode value increment effect text
-                                self.game_ui.create_effect_text(
-                                                                type_of_effect_text = "FrenzyModeValueIncrement",
-                                                                target = "Player",
-                                                                text = "+" + str(self.player.player_gameplay_info_dict["DealDamageFrenzyModeIncrement"]),
-                                                                larger_font = False
-                                                                )             
-                                
-                            # If the current boss is alive
-                            if self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
-
-                                # Create damage effect text
-                                self.game_ui.create_effect_text(
-                                                                type_of_effect_text = "Damage",
-                                                                target = "Boss",
-                                                                text = "-" + str(total_damage_dealt),
-                                                                larger_font = False
-                                                                )
+        # --------------------------------------------------------------------------------------
+        # Bamboo piles
+        self.collision_world.handle_layer_collisions(layer = "Player", other_layers = ("BambooPiles",))
 
-                            # If this bamboo projectile was shot from the bamboo launcher
-                            if bamboo_projectile.is_bamboo_launcher_projectile == True:
-                                # Always (even when the boss is dead) create a bamboo projectiles explosion (shoots projectiles in a circle)
-                                self.player.create_bamboo_projectiles_explosion(projectile = bamboo_projectile)
-
-                                # Create many shattered bamboo pieces
-                                self.game_ui.create_angled_polygons_effects(
-                                                                            purpose = "ShatteredBambooPieces",
-                                                                            position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
-                                                                            specified_number_of_pieces = random_randrange(15, 25)
-                                                                            )
-                                # Play the bamboo launcher explosion sound effect
-                                self.play_manual_sound(sound_effect = "BambooLauncherProjectileExplosion")
-
-                            # If this bamboo projectile was not shot from the bamboo launcher
-                            elif bamboo_projectile.is_bamboo_launcher_projectile == False:
-                                # Create a few shattered bamboo pieces
-                                self.game_ui.create_angled_polygons_effects(
-                                                                            purpose = "ShatteredBambooPieces",
-                                                                            position = (self.boss_group.sprite.rect.centerx, self.boss_group.sprite.rect.centery),
-                                                                            angle = bamboo_projectile.angle,
-                                                                            specified_number_of_pieces = random_randrange(2, 6)
-                                                                            )
-                                # Play the bamboo launcher explosion sound effect
-                                self.play_manual_sound(sound_effect = "BambooProjectileHit")
-                            # Remove the bamboo projectile
-                            self.bamboo_projectiles_group.remove(bamboo_projectile)
-           
-                # --------------------------------
-                # Chilli projectiles and bamboo projectiles
-
-                # If there is a chilli projectiles dict
-                if hasattr(self, "chilli_projectiles_dict"):
-
-                    # Check for a rect collision between the bamboo projectile and world / chilli projectiles inside the chilli projectiles dictionary
-                    chilli_bamboo_collision_result = bamboo_projectile.rect.collidedict(self.chilli_projectiles_dict)
-                
-                    # If the bamboo_projectile collided with a chilli projectile
-                    if chilli_bamboo_collision_result != None:
-
-                        # Check for a pixel-perfect collision between the bamboo projectile and the chilli projectile that the bamboo_projectile's rect collided with
-                        if pygame_sprite_collide_mask(bamboo_projectile, chilli_bamboo_collision_result[0]) != None:
-                            
-                            # Take away a life from the bamboo projectile
-                            bamboo_projectile.lives -= 1
-
-                            # If the bamboo projectile has no lives
-                            if bamboo_projectile.lives <= 0:
-
-                                # If this bamboo projectile was shot from the bamboo launcher
-                                if bamboo_projectile.is_bamboo_launcher_projectile == True:
-                                    #  Create a bamboo projectiles explosion (shoots projectiles in a circle)
-                                    self.player.create_bamboo_projectiles_explosion(projectile = bamboo_projectile)
-
-                                    # Create many shattered bamboo pieces
-                                    self.game_ui.create_angled_polygons_effects(
-                                                                                purpose = "ShatteredBambooPieces",
-                                                                                position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
-                                                                                specified_number_of_pieces = random_randrange(15, 25)
-                                                                                )
-                                # If this bamboo projectile was not shot from the bamboo launcher
-                                elif bamboo_projectile.is_bamboo_launcher_projectile == False:
-                                    # Create a few shattered bamboo pieces
-                                    self.game_ui.create_angled_polygons_effects(
-                                                                                purpose = "ShatteredBambooPieces",
-                                                                                position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
-                                                                                angle = bamboo_projectile.angle,
-                                                                                specified_number_of_pieces = random_randrange(2, 4)
-                                                                                )         
-                                # Remove it from the group
-                                self.bamboo_projectiles_group.remove(bamboo_projectile)
-
-                            # Create chilli pieces
-                            self.game_ui.create_angled_polygons_effects(
-                                                                        purpose = "ChilliPieces",
-                                                                        position = (chilli_bamboo_collision_result[0].rect.centerx, chilli_bamboo_collision_result[0].rect.centery),
-                                                                        angle = chilli_bamboo_collision_result[0].angle,
-                                                                        specified_number_of_pieces = 5
-                                                                        )                 
-
-                            # Remove the chilli projecitle from the chilli projectiles dict
-                            self.chilli_projectiles_dict.pop(chilli_bamboo_collision_result[0])
+        # --------------------------------------------------------------------------------------
+        # Stomp attack nodes (with world / building tiles, the player and bosses)
+        # Note: This layer does not exist until the Sika Deer boss has spawned
+        self.collision_world.handle_layer_collisions(layer = "StompNodes")
 
         # --------------------------------------------------------------------------------------
-        # Bamboo piles
+        # Chilli projectiles (with world / building tiles and the player)
+        # Note: This layer does not exist until the Golden Monkey boss has spawned
+        self.collision_world.handle_layer_collisions(layer = "ChilliProjectiles")
+
+        # -------------------------------------------------------------------------------------- 
+        # Bosses
+
+        # If there is a current boss and they are alive
+        if self.boss_group.sprite != None and self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
 
-        # Look for collisions between the player and bamboo piles, and only delete the bamboo pile if there is a collision and the player does not currently have the maximum amount of bamboo resource
-        player_and_bamboo_piles_collision_list = pygame_sprite_spritecollide(self.player, self.bamboo_piles_group, dokill = False, collided = pygame_sprite_collide_rect)
-        if len(player_and_bamboo_piles_collision_list) > 0 and \
-            ((self.player.player_gameplay_info_dict["AmountOfBambooResource"] != self.player.player_gameplay_info_dict["MaximumAmountOfBambooResource"]) or (self.player.player_gameplay_info_dict["CurrentHealth"] != self.player.player_gameplay_info_dict["MaximumHealth"])):
+            # --------------------------------------
+            # Building tiles
+            self.collision_world.handle_layer_collisions(layer = "Boss", other_layers = ("BuildingTiles",))
+
+            # --------------------------------------
+            # World tiles while charging
+
+            # Only if the boss is the "SikaDeer" and the current action is "Charge"
+            if self.bosses_dict["CurrentBoss"] == "SikaDeer" and self.boss_group.sprite.current_action == "Charge":
+                    # If there is an x or y world tile collision
+                    if self.boss_group.sprite.movement_information_dict["WorldTileCollisionResultsX"] == True or self.boss_group.sprite.movement_information_dict["WorldTileCollisionResultsY"] == True:
+                        # Play the sound effect for when the boss collides with a tile when charging
+                        self.play_manual_sound(sound_effect = "ChargeTileCollision")
+
+                        # Set the player to change into the "Stunned" state (this will be done inside the SikaDeer class)
+                        self.boss_group.sprite.behaviour_patterns_dict["Charge"]["EnterStunnedStateBoolean"] = True
+
+                        # Set the "Charge" duration timer to 0, to end the charge attack
+                        self.boss_group.sprite.behaviour_patterns_dict["Charge"]["DurationTimer"] = 0
+
+                        # Set the "Stunned" duration timer to start counting down from half the duration (should be shorter as the player did not block them)
+                        self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["DurationTimer"] = (self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["Duration"] / 2)
+
+                        # Create a camera shake effect for when the boss collides with a tile
+                        self.camera_shake_info_dict["EventsList"].append("BossTileCollide")
+
+            # --------------------------------------
+            # Dive bomb attack circles
+
+            # Only if the boss is the "SikaDeer" and the current action is "DiveBomb"
+            if self.bosses_dict["CurrentBoss"] == "GoldenMonkey" and self.boss_group.sprite.current_action == "DiveBomb":
+
+                # If the boss just landed after performing a divebomb attack
+                if self.boss_group.sprite.behaviour_patterns_dict["DiveBomb"]["Land"]["DurationTimer"] == self.boss_group.sprite.behaviour_patterns_dict["DiveBomb"]["Land"]["Duration"]:
+
+                    # Create a camera shake effect for when the boss lands onto the ground
+                    self.camera_shake_info_dict["EventsList"].append("DiveBomb")
+
+                    # Play the dive bomb sound effect
+                    self.play_manual_sound(sound_effect = "DiveBomb")
+
+                    # Building tiles and the player
+                    self.collision_world.handle_layer_collisions(layer = "DiveBomb")
+
+            # --------------------------------------
+            # Player
+            self.collision_world.handle_layer_collisions(layer = "Boss", other_layers = ("Player",))
+
+    def handle_bamboo_projectile_and_tile_collision(self, bamboo_projectile, tile):
+
+        # Handles a pixel-perfect collision between a bamboo projectile and a world / building tile
+
+        # If this bamboo projectile was shot from the bamboo launcher
+        if bamboo_projectile.is_bamboo_launcher_projectile == True:
+
+            # Create a bamboo projectiles explosion (shoots projectiles in a circle)
+            self.player.create_bamboo_projectiles_explosion(projectile = bamboo_projectile)
+
+            # Create many shattered bamboo pieces
+            self.game_ui.create_angled_polygons_effects(
+                                                        purpose = "ShatteredBambooPieces",
+                                                        position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
+                                                        specified_number_of_pieces = random_randrange(15, 25)
+                                                        )
+        # If this bamboo projectile was not shot from the bamboo launcher
+        elif bamboo_projectile.is_bamboo_launcher_projectile == False:
+            # Create a few shattered bamboo pieces
+            self.game_ui.create_angled_polygons_effects(
+                                                        purpose = "ShatteredBambooPieces",
+                                                        position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
+                                                        angle = bamboo_projectile.angle,
+                                                        specified_number_of_pieces = random_randrange(2, 6)
+                                                        )
+
+        # If there is a pixel-perfect collision, remove the bamboo_projectile from the specified group
+        self.bamboo_projectiles_manager.remove(bamboo_projectile)
+
+    def handle_bamboo_projectile_and_boss_collision(self, bamboo_projectile, boss):
+
+        # Handles a pixel-perfect collision between a bamboo projectile and the current boss
+
+        # ------------------------------------------------------------------------------------------------------------------------------------------------
+        # Damage
+
+        # Damage the current boss by the amount of damage that was passed into the bamboo projectile and a random additive damage amount (e.g. 25 - 3)
+        # Note: This allows for different damage values for e.g. different weapons
+        randomised_damage_amount =  random_randrange(-3, 3)
+
+        # If the current boss is the "SikaDeer"
+        if self.bosses_dict["CurrentBoss"] == "SikaDeer":
+            # If the deer boss is stunned
+            if self.boss_group.sprite.current_action == "Stunned":
+                # Increase the base damage of the bamboo projectile by the damage multiplier dealt to the deer boss when stunned, plus a random damage amount
+                total_damage_dealt = (bamboo_projectile.damage_amount * self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["PlayerDamageMultiplierWhenStunned"]) + randomised_damage_amount
+
+            # If the deer boss is not stunned
+            elif self.boss_group.sprite.current_action != "Stunned":
+                # Set the total damage to be the base damage amount plus a random damage amount
+                total_damage_dealt = bamboo_projectile.damage_amount + randomised_damage_amount
+
+        # If the current boss is the "GoldenMonkey"
+        elif self.bosses_dict["CurrentBoss"] == "GoldenMonkey":
+            # If the golden monkey boss is currently sleeping
+            if self.boss_group.sprite.current_action == "Sleep":
+                # Increase the base damage of the bamboo projectile by the damage multiplier dealt to the deer boss when stunned, plus a random damage amount
+                total_damage_dealt = (bamboo_projectile.damage_amount * self.boss_group.sprite.behaviour_patterns_dict["Sleep"]["PlayerDamageMultiplierWhenBossIsSleeping"]) + randomised_damage_amount
+
+            # If the golden monkey boss is not sleeping
+            elif self.boss_group.sprite.current_action != "Sleep":
+                # Set the total damage to be the base damage amount plus a random damage amount
+                total_damage_dealt = bamboo_projectile.damage_amount + randomised_damage_amount
+
+        # Deal damage to the boss
+        self.boss_group.sprite.extra_information_dict["CurrentHealth"] -= total_damage_dealt
+
+        # ------------------------------------------------------------------------------------------------------------------------------------------------
+        # Additional
+
+        # Play the boss' damaged flash effect
+        self.boss_group.sprite.extra_information_dict["DamagedFlashEffectTimer"] = self.boss_group.sprite.extra_information_dict["DamagedFlashEffectTime"]
+
+        # If the player's frenzy mode is not activated and the current boss is alive
+        if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None and self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
+            # Increase the player's frenzy mode meter by the deal damage increment amount, limiting it to the maximum frenzy mode value
+            self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
+                                                                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["DealDamageFrenzyModeIncrement"],
+                                                                                self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
+                                                                                )
+            # Create frenzy mode value increment effect text
+            self.game_ui.create_effect_text(
+                                            type_of_effect_text = "FrenzyModeValueIncrement",
+                                            target = "Player",
+                                            text = "+" + str(self.player.player_gameplay_info_dict["DealDamageFrenzyModeIncrement"]),
+                                            larger_font = False
+                                            )             
+
+        # If the current boss is alive
+        if self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
+
+            # Create damage effect text
+            self.game_ui.create_effect_text(
+                                            type_of_effect_text = "Damage",
+                                            target = "Boss",
+                                            text = "-" + str(total_damage_dealt),
+                                            larger_font = False
+                                            )
+
+        # If this bamboo projectile was shot from the bamboo launcher
+        if bamboo_projectile.is_bamboo_launcher_projectile == True:
+            # Always (even when the boss is dead) create a bamboo projectiles explosion (shoots projectiles in a circle)
+            self.player.create_bamboo_projectiles_explosion(projectile = bamboo_projectile)
+
+            # Create many shattered bamboo pieces
+            self.game_ui.create_angled_polygons_effects(
+                                                        purpose = "ShatteredBambooPieces",
+                                                        position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
+                                                        specified_number_of_pieces = random_randrange(15, 25)
+                                                        )
+            # Play the bamboo launcher explosion sound effect
+            self.play_manual_sound(sound_effect = "BambooLauncherProjectileExplosion")
+
+        # If this bamboo projectile was not shot from the bamboo launcher
+        elif bamboo_projectile.is_bamboo_launcher_projectile == False:
+            # Create a few shattered bamboo pieces
+            self.game_ui.create_angled_polygons_effects(
+                                                        purpose = "ShatteredBambooPieces",
+                                                        position = (self.boss_group.sprite.rect.centerx, self.boss_group.sprite.rect.centery),
+                                                        angle = bamboo_projectile.angle,
+                                                        specified_number_of_pieces = random_randrange(2, 6)
+                                                        )
+            # Play the bamboo launcher explosion sound effect
+            self.play_manual_sound(sound_effect = "BambooProjectileHit")
+        # Remove the bamboo projectile
+        self.bamboo_projectiles_manager.remove(bamboo_projectile)
+
+    def handle_bamboo_projectile_and_chilli_projectile_collision(self, bamboo_projectile, chilli_projectile):
+
+        # Handles a pixel-perfect collision between a bamboo projectile and a chilli projectile
+
+
+        # Take away a life from the bamboo projectile
+        bamboo_projectile.lives -= 1
+
+        # If the bamboo projectile has no lives
+        if bamboo_projectile.lives <= 0:
+
+            # If this bamboo projectile was shot from the bamboo launcher
+            if bamboo_projectile.is_bamboo_launcher_projectile == True:
+                #  Create a bamboo projectiles explosion (shoots projectiles in a circle)
+                self.player.create_bamboo_projectiles_explosion(projectile = bamboo_projectile)
+
+                # Create many shattered bamboo pieces
+                self.game_ui.create_angled_polygons_effects(
+                                                            purpose = "ShatteredBambooPieces",
+                                                            position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
+                                                            specified_number_of_pieces = random_randrange(15, 25)
+                                                            )
+            # If this bamboo projectile was not shot from the bamboo launcher
+            elif bamboo_projectile.is_bamboo_launcher_projectile == False:
+                # Create a few shattered bamboo pieces
+                self.game_ui.create_angled_polygons_effects(
+                                                            purpose = "ShatteredBambooPieces",
+                                                            position = (bamboo_projectile.rect.centerx, bamboo_projectile.rect.centery),
+                                                            angle = bamboo_projectile.angle,
+                                                            specified_number_of_pieces = random_randrange(2, 4)
+                                                            )         
+            # Remove it from the group
+            self.bamboo_projectiles_manager.remove(bamboo_projectile)
+
+        # Create chilli pieces
+        self.game_ui.create_angled_polygons_effects(
+                                                    purpose = "ChilliPieces",
+                                                    position = (chilli_projectile.rect.centerx, chilli_projectile.rect.centery),
+                                                    angle = chilli_projectile.angle,
+                                                    specified_number_of_pieces = 5
+                                                    )                 
+
+        # Remove the chilli projecitle from the chilli projectiles manager
+        self.chilli_projectiles_manager.remove(chilli_projectile)
+
+    def handle_player_and_bamboo_pile_collision(self, player, bamboo_pile):
+
+        # Handles a rect collision between the player and a bamboo pile, only picking up the bamboo pile if the player does not currently have the maximum amount of bamboo resource or health
+        if (self.player.player_gameplay_info_dict["AmountOfBambooResource"] != self.player.player_gameplay_info_dict["MaximumAmountOfBambooResource"]) or (self.player.player_gameplay_info_dict["CurrentHealth"] != self.player.player_gameplay_info_dict["MaximumHealth"]):
 
             # -------------------------------------------------------------------------------------
             # Bamboo piles and segments
-            
+
             # Find the bamboo pile to remove
-            bamboo_pile_to_remove = player_and_bamboo_piles_collision_list[0]
+            bamboo_pile_to_remove = bamboo_pile
 
             # Find the segment that the bamboo pile was taking up
-            segment_key = tuple(segment_number for segment_number, bamboo_pile in self.bamboo_piles_segments_taken_dict.items() if bamboo_pile == bamboo_pile_to_remove)
+            segment_key = tuple(segment_number for segment_number, segment_bamboo_pile in self.bamboo_piles_segments_taken_dict.items() if segment_bamboo_pile == bamboo_pile_to_remove)
 
             # Set this segment to be untaken
             self.bamboo_piles_segments_taken_dict[segment_key[0]] = segment_key[0]
 
             # -------------------------------------------------------------------------------------
 
-            # Remove the bamboo pile from the bamboo piles group
-            self.bamboo_piles_group.remove(player_and_bamboo_piles_collision_list)
+            # Remove the bamboo pile from the bamboo piles group and release it back to the object pool
+            self.bamboo_piles_group.remove(bamboo_pile_to_remove)
+            BambooPile.pool.release(bamboo_pile_to_remove)
 
-            # Add the empty tile back to the empty tiles dictionary so other items can spawn in the tile
-            empty_tile = self.replaced_empty_tiles_dict[player_and_bamboo_piles_collision_list[0]]
-            self.empty_tiles_dict[empty_tile] = 0
+            # Put the empty tile back inside the tile grid so other items can spawn in the tile
+            empty_tile = self.replaced_empty_tiles_dict[bamboo_pile_to_remove]
+            self.tile_grid.set_tile(tile = empty_tile, tile_type = "Empty")
 
             # Remove the bamboo pile from the replaced empty tiles dict
-            self.replaced_empty_tiles_dict.pop(player_and_bamboo_piles_collision_list[0])
+            self.replaced_empty_tiles_dict.pop(bamboo_pile_to_remove)
 
             # Play the bamboo pile pick up sound effect
             self.play_manual_sound(sound_effect = "BambooPilePickUp")
@@ -1087,12 +1156,12 @@ class Game:
                 # Find the amount that we can replenish the player's amount of bamboo resource to the maximum amount
                 bamboo_resource_replenishment_amount = BambooPile.bamboo_pile_info_dict["BambooResourceReplenishAmount"] - (
                     (self.player.player_gameplay_info_dict["AmountOfBambooResource"] + BambooPile.bamboo_pile_info_dict["BambooResourceReplenishAmount"]) % self.player.player_gameplay_info_dict["MaximumAmountOfBambooResource"])
-            
+
             # If adding the bamboo pile's replenishment amount is less than or equal to the player's maximum amount of bamboo resource
             elif self.player.player_gameplay_info_dict["AmountOfBambooResource"] + BambooPile.bamboo_pile_info_dict["BambooResourceReplenishAmount"] <= self.player.player_gameplay_info_dict["MaximumAmountOfBambooResource"]:
                 # Set the health replenishment amount as the bamboo pile's full resource replenishment amount
                 bamboo_resource_replenishment_amount = BambooPile.bamboo_pile_info_dict["BambooResourceReplenishAmount"]
-            
+
             # Create bamboo resource replenishment effect text
             self.game_ui.create_effect_text(
                                             type_of_effect_text = "BambooResourceReplenishment",
@@ -1112,7 +1181,7 @@ class Game:
                     # Find the amount that we can heal the player up to their maximum health
                     health_replenishment_amount = BambooPile.bamboo_pile_info_dict["HealthReplenishmentAmount"] - (
                         (self.player.player_gameplay_info_dict["CurrentHealth"] + BambooPile.bamboo_pile_info_dict["HealthReplenishmentAmount"]) % self.player.player_gameplay_info_dict["MaximumHealth"])
-                
+
                 # If adding the bamboo pile's health replenishment amount is less than or equal to the player's health 
                 elif self.player.player_gameplay_info_dict["CurrentHealth"] + BambooPile.bamboo_pile_info_dict["HealthReplenishmentAmount"] <= self.player.player_gameplay_info_dict["MaximumHealth"]:
                     # Set the health replenishment amount as the bamboo pile's full health replenishment amount
@@ -1132,699 +1201,529 @@ class Game:
                 # Increase the player's current health, limiting it to the maximum health the player can have
                 self.player.player_gameplay_info_dict["CurrentHealth"] += health_replenishment_amount
 
-        # --------------------------------------------------------------------------------------
-        # Stomp attack nodes
+    def handle_stomp_node_and_tile_collision(self, stomp_attack_node, tile):
 
-        # Additional check because this group does not exist until the Sika Deer boss has spawned and started stomping
-        if hasattr(self, "stomp_attack_nodes_group") and len(self.stomp_attack_nodes_group) > 0:
+        # Handles a pixel-perfect collision between a stomp attack node and a world / building tile
 
-            # For each stomp attack node
-            for stomp_attack_node in self.stomp_attack_nodes_group:
+        # The type of the tile ("WorldTile" or "BuildingTile")
+        tile_type = self.tile_grid.get_tile_type(row = tile.rect.y // TILE_SIZE, column = tile.rect.x // TILE_SIZE)
 
-                # --------------------------------
-                # World / building tiles
 
-                # Look for tile rect collisions between the stomp attack nodes and world / building tiles
-                collision_result = stomp_attack_node.rect.collidedict(self.world_tiles_dict)
+        # If the stomp attack node was blocked by a building tile
+        if tile_type == "BuildingTile":
 
-                # Look for tile rect collisions between the stomp attack nodes and world / building tiles
-                if collision_result != None:
-                    
-                    # --------------------------------
-                    # Building tiles
+            # If the stomp attack node has not been reflected already
+            # Note: This is so that it does not bounce backwards and forwards when inside a tile
+            if stomp_attack_node.reflected != True:
+                # Play the reflected projectile sound effect
+                self.play_manual_sound(sound_effect = "ReflectedProjectile")
 
-                    # If the stomp attack node image is not the same as the diameter of the attack node 
-                    """ Note: This is here instead of inside the stomp attack node's increase_size method to avoid resizing the image everytime the attack node's size is changed
-                    - The rect has already been adjusted according to the changed radius
-                    """
-                    if stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
-                        # Rescale the image for pixel-perfect collision
-                        stomp_attack_node.rescale_image()
-                    
-                    # Check for a pixel-perfect collision between the stomp attack node and the building tile
-                    if pygame_sprite_collide_mask(stomp_attack_node, collision_result[0]) != None:
-                        
-                        # If the stomp attack node was blocked by a building tile
-                        if collision_result[1] == "BuildingTile":
-                            
-                            # If the stomp attack node has not been reflected already
-                            # Note: This is so that it does not bounce backwards and forwards when inside a tile
-                            if stomp_attack_node.reflected != True:
-                                # Play the reflected projectile sound effect
-                                self.play_manual_sound(sound_effect = "ReflectedProjectile")
-
-                                # Reflect the stomp attack node, increasing its speed by 1.75
-                                stomp_attack_node.horizontal_gradient *= -1.75 
-                                stomp_attack_node.vertical_gradient *= -1.75
-                                stomp_attack_node.reflected = True
-
-                            # Take one life away from the building tile
-                            collision_result[0].lives -= 1
-
-                            # If the building tile has run out of lives
-                            if collision_result[0].lives <= 0:
-
-                                # "Create" an empty tile where the building tile was
-                                self.empty_tiles_dict[self.player.sprite_groups["ReplacedEmptyTiles"][collision_result[0]]] = 0
-                                
-                                # Remove the building tile from the player's replaced empty tiles dict
-                                self.player.sprite_groups["ReplacedEmptyTiles"].pop(collision_result[0])
-
-                                # Remove the building tile from the world tiles group
-                                self.world_tiles_group.remove(collision_result[0])
-
-                                # Remove the building tile from the world tiles dictionary
-                                self.world_tiles_dict.pop(collision_result[0])
-
-                                # Remove the building tile from the existing building tiles list
-                                self.player.tools["BuildingTool"]["ExistingBuildingTilesList"].remove(collision_result[0])
-
-                                # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                                if collision_result[0] in self.player.neighbouring_tiles_dict.keys():
-                                    # Remove the building tile
-                                    self.player.neighbouring_tiles_dict.pop(collision_result[0])
-
-                                # Create many shattered bamboo pieces
-                                self.game_ui.create_angled_polygons_effects(
-                                                                            purpose = "ShatteredBambooPieces",
-                                                                            position = (collision_result[0].rect.centerx, collision_result[0].rect.centery),
-                                                                            specified_number_of_pieces = random_randrange(10, 20)
-                                                                            )
-                                                                            
-                            # If the player's frenzy mode is not activated
-                            if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
-                                # Increase the player's frenzy mode meter by the block damage increment amount, limiting it to the maximum frenzy mode value
-                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
-                                                                                                    self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["BlockDamageFrenzyModeIncrement"],
-                                                                                                    self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
-                                                                                                )
-                                # Create frenzy mode value increment effect text
-                                self.game_ui.create_effect_text(
-                                                                type_of_effect_text = "FrenzyModeValueIncrement",
-                                                                target = "Player",
-                                                                text = "+" + str(self.player.player_gameplay_info_dict["BlockDamageFrenzyModeIncrement"]),
-                                                                larger_font = False
-                                                                )                                                        
-                    # --------------------------------
-                    # World tiles
-
-                        # If the collided tile was a world tile
-                        elif collision_result[1]  == "WorldTile":
-                            # Remove the stomp attack node from the group if there is a collision
-                            self.stomp_attack_nodes_group.remove(stomp_attack_node)
-                    
-                # --------------------------------
-                # Player
+                # Reflect the stomp attack node, increasing its speed by 1.75
+                stomp_attack_node.horizontal_gradient *= -1.75 
+                stomp_attack_node.vertical_gradient *= -1.75
+                stomp_attack_node.reflected = True
 
-                # Look for tile rect collisions between the stomp attack nodes and the player
-                if stomp_attack_node.rect.colliderect(self.player.rect):
-                    
-                    # If the stomp attack node image is not the same as the diameter of the attack node 
-                    """ Note: This is here instead of inside the stomp attack node's increase_size method to avoid resizing the image everytime the attack node's size is changed
-                    - The rect has already been adjusted according to the changed radius
-                    """
-                    if stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
-                        # Rescale the image for pixel-perfect collision
-                        stomp_attack_node.rescale_image()
+            # Take one life away from the building tile
+            tile.lives -= 1
 
-                    # Check for a pixel-perfect collision between the stomp attack node and the player
-                    if pygame_sprite_collide_mask(stomp_attack_node, self.player) != None:
+            # If the building tile has run out of lives
+            if tile.lives <= 0:
 
-                        # Remove the stomp attack node from the group if there is a collision
-                        self.stomp_attack_nodes_group.remove(stomp_attack_node)
-                        
-                        # Damage the player by the stomp attack node damage
-                        self.player.player_gameplay_info_dict["CurrentHealth"] -= stomp_attack_node.damage_amount
+                # "Create" an empty tile where the building tile was
+                self.tile_grid.set_tile(tile = self.player.sprite_groups["ReplacedEmptyTiles"][tile], tile_type = "Empty")
 
-                        # Play the player hurt sound effect
-                        self.play_manual_sound(sound_effect = "PlayerHurt")
+                # Remove the building tile from the player's replaced empty tiles dict
+                self.player.sprite_groups["ReplacedEmptyTiles"].pop(tile)
 
-                        # If the player is alive / has more than 0 health
-                        if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
-                            # Create damage effect text
-                            self.game_ui.create_effect_text(
-                                                            type_of_effect_text = "Damage",
-                                                            target = "Player",
-                                                            text = "-" + str(stomp_attack_node.damage_amount),
-                                                            larger_font = False
-                                                        )
-                                                        
-                        # Set the damaged flash effect timer to the damage flash effect time set (damaged flashing effect)
-                        self.player.player_gameplay_info_dict["DamagedFlashEffectTimer"] = self.player.player_gameplay_info_dict["DamagedFlashEffectTime"]
-
-                        # If the player's frenzy mode is not activated
-                        if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
-                            # Increase the player's frenzy mode meter by the take damage increment amount, limiting it to the maximum frenzy mode value
-                            self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
-                                                                                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["TakeDamageFrenzyModeIncrement"],
-                                                                                                self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
-                                                                                                )
-                            # Create frenzy mode value increment effect text
-                            self.game_ui.create_effect_text(
-                                                            type_of_effect_text = "FrenzyModeValueIncrement",
-                                                            target = "Player",
-                                                            text = "+" + str(self.player.player_gameplay_info_dict["TakeDamageFrenzyModeIncrement"]),
-                                                            larger_font = False
+                # Remove the building tile from the existing building tiles list
+                self.player.tools["BuildingTool"]["ExistingBuildingTilesList"].remove(tile)
+
+                # If the building tile to remove is in the neighbouring tiles dictionary (keys)
+                if tile in self.player.neighbouring_tiles_dict.keys():
+                    # Remove the building tile
+                    self.player.neighbouring_tiles_dict.pop(tile)
+
+                # Create many shattered bamboo pieces
+                self.game_ui.create_angled_polygons_effects(
+                                                            purpose = "ShatteredBambooPieces",
+                                                            position = (tile.rect.centerx, tile.rect.centery),
+                                                            specified_number_of_pieces = random_randrange(10, 20)
                                                             )
-                # --------------------------------
-                # Boss
 
-                # Look for tile rect collisions between the stomp attack nodes and the current boss
-                # Only enter if there is a rect collision and the stomp attack node was reflected
-                if self.boss_group.sprite != None and stomp_attack_node.rect.colliderect(self.boss_group.sprite.rect) and stomp_attack_node.reflected == True:
-                    
-                    # If the stomp attack node image is not the same as the diameter of the attack node 
-                    """ Note: This is here instead of inside the stomp attack node's increase_size method to avoid resizing the image everytime the attack node's size is changed
-                    - The rect has already been adjusted according to the changed radius
-                    """
-                    if stomp_attack_node.image.get_width() != (stomp_attack_node.radius * 2):
-                        # Rescale the image for pixel-perfect collision
-                        stomp_attack_node.rescale_image()
+            # If the player's frenzy mode is not activated
+            if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
+                # Increase the player's frenzy mode meter by the block damage increment amount, limiting it to the maximum frenzy mode value
+                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
+                                                                                    self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["BlockDamageFrenzyModeIncrement"],
+                                                                                    self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
+                                                                                )
+                # Create frenzy mode value increment effect text
+                self.game_ui.create_effect_text(
+                                                type_of_effect_text = "FrenzyModeValueIncrement",
+                                                target = "Player",
+                                                text = "+" + str(self.player.player_gameplay_info_dict["BlockDamageFrenzyModeIncrement"]),
+                                                larger_font = False
+                                                )                                                        
+    # --------------------------------
+    # World tiles
 
-                    # Check for a pixel-perfect collision between the bamboo projectile and the current boss
-                    if pygame_sprite_collide_mask(stomp_attack_node, self.boss_group.sprite) != None:
-                        
-                        # Remove the stomp attack node from the group if there is a collision
-                        self.stomp_attack_nodes_group.remove(stomp_attack_node)
-                        
-                        # Damage the boss by 5 times the stomp attack node damage
-                        self.boss_group.sprite.extra_information_dict["CurrentHealth"] -= (stomp_attack_node.damage_amount * self.player.tools["BuildingTool"]["ReflectionDamageMultiplier"])
-
-                        # If the boss is alive / has more than 0 health
-                        if self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
-                            # Create damage effect text
-                            self.game_ui.create_effect_text(
-                                                            type_of_effect_text = "Damage",
-                                                            target = "Boss",
-                                                            text = "-" + str(stomp_attack_node.damage_amount * self.player.tools["BuildingTool"]["ReflectionDamageMultiplier"]),
-                                                            larger_font = False
-                                                        )
+        # If the collided tile was a world tile
+        elif tile_type == "WorldTile":
+            # Remove the stomp attack node from the group if there is a collision, releasing it back to the object pool
+            self.stomp_attack_nodes_group.remove(stomp_attack_node)
+            stomp_attack_node.pool.release(stomp_attack_node)
 
-                        # Set the damaged flash effect timer to the damage flash effect time set (damaged flashing effect)
-                        self.boss_group.sprite.extra_information_dict["DamagedFlashEffectTimer"] = self.boss_group.sprite.extra_information_dict["DamagedFlashEffectTime"]
-
-                        # If the player's frenzy mode is not activated
-                        if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
-                            # Increase the player's frenzy mode meter by the reflect damage increment amount, limiting it to the maximum frenzy mode value
-                            self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
-                                                                                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["ReflectDamageFrenzyModeIncrement"],
-                                                                                                self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
-                                                                                                )
-                            # Create frenzy mode value increment effect text
-                            self.game_ui.create_effect_text(
-                                                            type_of_effect_text = "FrenzyModeValueIncrement",
-                                                            target = "Player",
-                                                            text = "+" + str(self.player.player_gameplay_info_dict["ReflectDamageFrenzyModeIncrement"]),
-                                                            larger_font = False
-                                                            )
-        
-        # --------------------------------------------------------------------------------------
-        # Chilli projectiles
+    def handle_stomp_node_and_player_collision(self, stomp_attack_node, player):
 
-        # Additional check because this group does not exist until the Golden Monkey boss has spawned
-        if hasattr(self, "chilli_projectiles_dict") and len(self.chilli_projectiles_dict) > 0:
+        # Handles a pixel-perfect collision between a stomp attack node and the player
 
-            # For each chilli projectile
-            for chilli_projectile in self.chilli_projectiles_dict.copy().keys():
 
-                # --------------------------------
-                # World / building tiles
+        # Remove the stomp attack node from the group if there is a collision, releasing it back to the object pool
+        self.stomp_attack_nodes_group.remove(stomp_attack_node)
+        stomp_attack_node.pool.release(stomp_attack_node)
 
-                # Look for tile rect collisions between the chilli projectiles and world / building tiles
-                collision_result = chilli_projectile.rect.collidedict(self.world_tiles_dict)
+        # Damage the player by the stomp attack node damage
+        self.player.player_gameplay_info_dict["CurrentHealth"] -= stomp_attack_node.damage_amount
 
-                # If there were any rect collisions
-                if collision_result != None:
-                    
-                    # --------------------------------
-                    # Building tiles
-                    
-                    # Check for a pixel-perfect collision between the chilli projectile and the building tile
-                    if pygame_sprite_collide_mask(chilli_projectile, collision_result[0]) != None:
-                        
-                        # If the chilli projectile was blocked by a building tile
-                        if collision_result[1] == "BuildingTile":
-                            
-                            # Take one life away from the building tile
-                            collision_result[0].lives -= 1
+        # Play the player hurt sound effect
+        self.play_manual_sound(sound_effect = "PlayerHurt")
 
-                            # If the building tile has run out of lives
-                            if collision_result[0].lives <= 0:
+        # If the player is alive / has more than 0 health
+        if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
+            # Create damage effect text
+            self.game_ui.create_effect_text(
+                                            type_of_effect_text = "Damage",
+                                            target = "Player",
+                                            text = "-" + str(stomp_attack_node.damage_amount),
+                                            larger_font = False
+                                        )
 
-                                # "Create" an empty tile where the building tile was
-                                self.empty_tiles_dict[self.player.sprite_groups["ReplacedEmptyTiles"][collision_result[0]]] = 0
-                                
-                                # Remove the building tile from the player's replaced empty tiles dict
-                                self.player.sprite_groups["ReplacedEmptyTiles"].pop(collision_result[0])
+        # Set the damaged flash effect timer to the damage flash effect time set (damaged flashing effect)
+        self.player.player_gameplay_info_dict["DamagedFlashEffectTimer"] = self.player.player_gameplay_info_dict["DamagedFlashEffectTime"]
 
-                                # Remove the building tile from the world tiles group
-                                self.world_tiles_group.remove(collision_result[0])
+        # If the player's frenzy mode is not activated
+        if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
+            # Increase the player's frenzy mode meter by the take damage increment amount, limiting it to the maximum frenzy mode value
+            self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
+                                                                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["TakeDamageFrenzyModeIncrement"],
+                                                                                self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
+                                                                                )
+            # Create frenzy mode value increment effect text
+            self.game_ui.create_effect_text(
+                                            type_of_effect_text = "FrenzyModeValueIncrement",
+                                            target = "Player",
+                                            text = "+" + str(self.player.player_gameplay_info_dict["TakeDamageFrenzyModeIncrement"]),
+                                            larger_font = False
+                                            )
 
-                                # Remove the building tile from the world tiles dictionary
-                                self.world_tiles_dict.pop(collision_result[0])
+    def handle_stomp_node_and_boss_collision(self, stomp_attack_node, boss):
 
-                                # Remove the building tile from the existing building tiles list
-                                self.player.tools["BuildingTool"]["ExistingBuildingTilesList"].remove(collision_result[0])
+        # Handles a pixel-perfect collision between a stomp attack node and the current boss, only damaging the boss if the stomp attack node was reflected
+        if stomp_attack_node.reflected == True:
 
-                                # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                                if collision_result[0] in self.player.neighbouring_tiles_dict.keys():
-                                    # Remove the building tile
-                                    self.player.neighbouring_tiles_dict.pop(collision_result[0])
 
-                                # Play the sound effect for when a chilli projectile breaks a building tile
-                                self.play_manual_sound(
-                                                    sound_effect = "ChilliProjectileTileCollision", 
-                                                    specific_cooldown_timer = self.boss_group.sprite.behaviour_patterns_dict["Chase"]["ChilliThrowingCooldown"]
-                                                    )
+            # Remove the stomp attack node from the group if there is a collision, releasing it back to the object pool
+            self.stomp_attack_nodes_group.remove(stomp_attack_node)
+            stomp_attack_node.pool.release(stomp_attack_node)
 
+            # Damage the boss by 5 times the stomp attack node damage
+            self.boss_group.sprite.extra_information_dict["CurrentHealth"] -= (stomp_attack_node.damage_amount * self.player.tools["BuildingTool"]["ReflectionDamageMultiplier"])
 
-                                # Create many shattered bamboo pieces
-                                self.game_ui.create_angled_polygons_effects(
-                                                                            purpose = "ShatteredBambooPieces",
-                                                                            position = (collision_result[0].rect.centerx, collision_result[0].rect.centery),
-                                                                            specified_number_of_pieces = random_randrange(10, 20)
-                                                                            )
-                                                                            
-                            # If the player's frenzy mode is not activated
-                            if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
-                                # Increase the player's frenzy mode meter by the block damage increment amount, limiting it to the maximum frenzy mode value
-                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
-                                                                                                    self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["BlockDamageFrenzyModeIncrement"],
-                                                                                                    self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
-                                                                                                )
-                                # Create frenzy mode value increment effect text
-                                self.game_ui.create_effect_text(
-                                                                type_of_effect_text = "FrenzyModeValueIncrement",
-                                                                target = "Player",
-                                                                text = "+" + str(self.player.player_gameplay_info_dict["BlockDamageFrenzyModeIncrement"]),
-                                                                larger_font = False
-                                                                )       
-
-                            # Remove the chilli projectile from the group if there is a collision
-                            self.chilli_projectiles_dict.pop(chilli_projectile)
-
-                            # Go to the next chilli projectile
-                            """ Note: This is because a copy of the chilli projectiles dictionary was made, and collisions with the player are checked straight after, 
-                            which would output an error if there was a collision with a bamboo projectile and the player.
-                            """
-                            continue
-
-                    # --------------------------------
-                    # World tiles
-
-                        # If the collided tile was a world tiles
-                        elif collision_result[1]  == "WorldTile":
-                            # Remove the chilli projectile from the dict if there is a collision
-                            self.chilli_projectiles_dict.pop(chilli_projectile)
-
-                            # Go to the next chilli projectile
-                            """ Note: This is because a copy of the chilli projectiles dictionary was made, and collisions with the player are checked straight after, 
-                            which would output an error if there was a collision with a bamboo projectile and the player.
-                            """
-                            continue
-                    
-                # --------------------------------
-                # Player
+            # If the boss is alive / has more than 0 health
+            if self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
+                # Create damage effect text
+                self.game_ui.create_effect_text(
+                                                type_of_effect_text = "Damage",
+                                                target = "Boss",
+                                                text = "-" + str(stomp_attack_node.damage_amount * self.player.tools["BuildingTool"]["ReflectionDamageMultiplier"]),
+                                                larger_font = False
+                                            )
 
-                # Look for tile rect collisions between the chilli projectile and the player
-                if chilli_projectile.rect.colliderect(self.player.rect):
-                    
-                    # Check for a pixel-perfect collision between the chilli projectile and the player
-                    if pygame_sprite_collide_mask(chilli_projectile, self.player) != None:
+            # Set the damaged flash effect timer to the damage flash effect time set (damaged flashing effect)
+            self.boss_group.sprite.extra_information_dict["DamagedFlashEffectTimer"] = self.boss_group.sprite.extra_information_dict["DamagedFlashEffectTime"]
+
+            # If the player's frenzy mode is not activated
+            if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
+                # Increase the player's frenzy mode meter by the reflect damage increment amount, limiting it to the maximum frenzy mode value
+                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
+                                                                                    self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["ReflectDamageFrenzyModeIncrement"],
+                                                                                    self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
+                                                                                    )
+                # Create frenzy mode value increment effect text
+                self.game_ui.create_effect_text(
+                                                type_of_effect_text = "FrenzyModeValueIncrement",
+                                                target = "Player",
+                                                text = "+" + str(self.player.player_gameplay_info_dict["ReflectDamageFrenzyModeIncrement"]),
+                                                larger_font = False
+                                                )
 
-                        # Remove the chilli projectile from the dict if there is a collision
-                        self.chilli_projectiles_dict.pop(chilli_projectile)
-                        
-                        # Damage the player by the stomp attack node damage
-                        self.player.player_gameplay_info_dict["CurrentHealth"] -= chilli_projectile.damage_amount
+    def handle_chilli_projectile_and_tile_collision(self, chilli_projectile, tile):
 
-                        # Play the player hurt sound effect
-                        self.play_manual_sound(sound_effect = "PlayerHurt")
+        # Handles a pixel-perfect collision between a chilli projectile and a world / building tile
 
-                        # If the player is alive / has more than 0 health
-                        if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
-                            # Create damage effect text
-                            self.game_ui.create_effect_text(
-                                                            type_of_effect_text = "Damage",
-                                                            target = "Player",
-                                                            text = "-" + str(chilli_projectile.damage_amount),
-                                                            larger_font = False
-                                                        )
-                                                        
-                        # Set the damaged flash effect timer to the damage flash effect time set (damaged flashing effect)
-                        self.player.player_gameplay_info_dict["DamagedFlashEffectTimer"] = self.player.player_gameplay_info_dict["DamagedFlashEffectTime"]
-
-                        # If the player's frenzy mode is not activated
-                        if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
-                            # Increase the player's frenzy mode meter by the take damage increment amount, limiting it to the maximum frenzy mode value
-                            self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
-                                                                                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["TakeDamageFrenzyModeIncrement"],
-                                                                                                self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
-                                                                                                )
-                            # Create frenzy mode value increment effect text
-                            self.game_ui.create_effect_text(
-                                                            type_of_effect_text = "FrenzyModeValueIncrement",
-                                                            target = "Player",
-                                                            text = "+" + str(self.player.player_gameplay_info_dict["TakeDamageFrenzyModeIncrement"]),
-                                                            larger_font = False
-                                                            )
-        
-        # -------------------------------------------------------------------------------------- 
-        # Bosses
+        # The type of the tile ("WorldTile" or "BuildingTile")
+        tile_type = self.tile_grid.get_tile_type(row = tile.rect.y // TILE_SIZE, column = tile.rect.x // TILE_SIZE)
 
-        # If there is a current boss and they are alive
-        if self.boss_group.sprite != None and self.boss_group.sprite.extra_information_dict["CurrentHealth"] > 0:
 
-            # --------------------------------------
-            # Building tiles
+        # If the chilli projectile was blocked by a building tile
+        if tile_type == "BuildingTile":
 
-            # If there is at least one existing building tile
-            if (len(self.player.tools["BuildingTool"]["ExistingBuildingTilesList"]) > 0):
-            
-                # Find the index of the building tile in the existing building tiles list if there is a rect collision between the tile and the boss
-                building_collision_result_index = self.boss_group.sprite.rect.collidelist(self.player.tools["BuildingTool"]["ExistingBuildingTilesList"])
-                
-                # If there is a collision
-                if building_collision_result_index != -1:
-                    
-                    # Check for pixel-perfect collision between the boss and the building tile
-                    if pygame_sprite_collide_mask(self.boss_group.sprite, self.player.tools["BuildingTool"]["ExistingBuildingTilesList"][building_collision_result_index]) != None:
-                        
-                        # Temporary variable for the building tile to remove
-                        building_tile_to_remove = self.player.tools["BuildingTool"]["ExistingBuildingTilesList"][building_collision_result_index]
+            # Take one life away from the building tile
+            tile.lives -= 1
 
-                        # "Create" an empty tile where the building tile was
-                        self.empty_tiles_dict[self.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
-                        
-                        # Remove the building tile from the player's replaced empty tiles dict
-                        self.player.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
+            # If the building tile has run out of lives
+            if tile.lives <= 0:
 
-                        # Remove the building tile from the world tiles group
-                        self.world_tiles_group.remove(building_tile_to_remove)
+                # "Create" an empty tile where the building tile was
+                self.tile_grid.set_tile(tile = self.player.sprite_groups["ReplacedEmptyTiles"][tile], tile_type = "Empty")
 
-                        # Remove the building tile from the world tiles dictionary
-                        self.world_tiles_dict.pop(building_tile_to_remove)
+                # Remove the building tile from the player's replaced empty tiles dict
+                self.player.sprite_groups["ReplacedEmptyTiles"].pop(tile)
 
-                        # Remove the building tile from the existing building tiles list
-                        self.player.tools["BuildingTool"]["ExistingBuildingTilesList"].pop(building_collision_result_index)
+                # Remove the building tile from the existing building tiles list
+                self.player.tools["BuildingTool"]["ExistingBuildingTilesList"].remove(tile)
 
-                        # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                        if building_tile_to_remove in self.player.neighbouring_tiles_dict.keys():
-                            # Remove the building tile
-                            self.player.neighbouring_tiles_dict.pop(building_tile_to_remove)
+                # If the building tile to remove is in the neighbouring tiles dictionary (keys)
+                if tile in self.player.neighbouring_tiles_dict.keys():
+                    # Remove the building tile
+                    self.player.neighbouring_tiles_dict.pop(tile)
 
-                        # ------------------------------------------------------------------
-                        # Additional effects
-                        
-                        # Create many shattered bamboo pieces
-                        self.game_ui.create_angled_polygons_effects(
-                                                                    purpose = "ShatteredBambooPieces",
-                                                                    position = (building_tile_to_remove.rect.centerx, building_tile_to_remove.rect.centery),
-                                                                    specified_number_of_pieces = random_randrange(10, 20)
-                                                                    )
+                # Play the sound effect for when a chilli projectile breaks a building tile
+                self.play_manual_sound(
+                                    sound_effect = "ChilliProjectileTileCollision", 
+                                    specific_cooldown_timer = self.boss_group.sprite.behaviour_patterns_dict["Chase"]["ChilliThrowingCooldown"]
+                                    )
 
-                        # If the boss is currently chasing the player
-                        if self.boss_group.sprite.current_action == "Chase":
-                            # Reset the boss' movement acceleration, so that they slow down
-                            self.boss_group.sprite.reset_movement_acceleration(horizontal_reset = True, vertical_reset = True)
-                            # Play the sound effect when the boss runs into a tile
-                            self.play_manual_sound(sound_effect = "BossTileSmallCollision")
 
-                        # If the boss is the "SikaDeer" and collided with the player whilst charge attacking
-                        elif self.bosses_dict["CurrentBoss"] == "SikaDeer" and self.boss_group.sprite.current_action == "Charge":
+                # Create many shattered bamboo pieces
+                self.game_ui.create_angled_polygons_effects(
+                                                            purpose = "ShatteredBambooPieces",
+                                                            position = (tile.rect.centerx, tile.rect.centery),
+                                                            specified_number_of_pieces = random_randrange(10, 20)
+                                                            )
 
-                            # Play the sound effect for when the boss collides with a tile when charging
-                            self.play_manual_sound(sound_effect = "ChargeTileCollision")
+            # If the player's frenzy mode is not activated
+            if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
+                # Increase the player's frenzy mode meter by the block damage increment amount, limiting it to the maximum frenzy mode value
+                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
+                                                                                    self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["BlockDamageFrenzyModeIncrement"],
+                                                                                    self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
+                                                                                )
+                # Create frenzy mode value increment effect text
+                self.game_ui.create_effect_text(
+                                                type_of_effect_text = "FrenzyModeValueIncrement",
+                                                target = "Player",
+                                                text = "+" + str(self.player.player_gameplay_info_dict["BlockDamageFrenzyModeIncrement"]),
+                                                larger_font = False
+                                                )       
 
-                            # Reset the boss' movement acceleration, so that they slow down
-                            self.boss_group.sprite.reset_movement_acceleration(horizontal_reset = True, vertical_reset = True)
+            # Remove the chilli projectile from the group if there is a collision
+            self.chilli_projectiles_manager.remove(chilli_projectile)
 
-                            # Set the player to change into the "Stunned" state (this will be done inside the SikaDeer class)
-                            self.boss_group.sprite.behaviour_patterns_dict["Charge"]["EnterStunnedStateBoolean"] = True
+            # Stop checking the chilli projectile for collisions (it has been removed, so it must not also collide with the player)
+            return True
 
-                            # Set the "Charge" duration timer to 0, to end the charge attack
-                            self.boss_group.sprite.behaviour_patterns_dict["Charge"]["DurationTimer"] = 0
+    # --------------------------------
+    # World tiles
 
-                            # Set the "Stunned" duration timer to start counting down
-                            self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["DurationTimer"] = self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["Duration"]
+        # If the collided tile was a world tiles
+        elif tile_type == "WorldTile":
+            # Remove the chilli projectile from the manager if there is a collision
+            self.chilli_projectiles_manager.remove(chilli_projectile)
 
-                            # Damage the current boss by the amount of damage dealt from being stunned
-                            self.boss_group.sprite.extra_information_dict["CurrentHealth"] -= self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["StunnedDamageAmount"]
+            # Stop checking the chilli projectile for collisions (it has been removed, so it must not also collide with the player)
+            return True
 
-                            # Create damage effect text
-                            self.game_ui.create_effect_text(
-                                                            type_of_effect_text = "Damage",
-                                                            target = "Boss",
-                                                            text = "-" + str(self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["StunnedDamageAmount"]),
-                                                            larger_font = True
-                                                            )
-                            
-                            # If the player's frenzy mode is not activated
-                            if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
-                                # Increase the player's frenzy mode meter by the stun enemy increment amount, limiting it to the maximum frenzy mode value
-                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
-                                                                                                    self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["StunEnemyFrenzyModeIncrement"],
-                                                                                                    self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
-                                                                                                    )
-
-                                # Create frenzy mode value increment effect text
-                                self.game_ui.create_effect_text(
-                                                                type_of_effect_text = "FrenzyModeValueIncrement",
-                                                                target = "Player",
-                                                                text = "+" + str(self.player.player_gameplay_info_dict["StunEnemyFrenzyModeIncrement"]),
-                                                                larger_font = True
-                                                                )
-                                        
-                            # Create a camera shake effect for when the boss collides with a tile
-                            self.camera_shake_info_dict["EventsList"].append("BossTileCollide")
+    def handle_chilli_projectile_and_player_collision(self, chilli_projectile, player):
 
-            # --------------------------------------
-            # World tiles while charging
+        # Handles a pixel-perfect collision between a chilli projectile and the player
 
-            # Only if the boss is the "SikaDeer" and the current action is "Charge"
-            if self.bosses_dict["CurrentBoss"] == "SikaDeer" and self.boss_group.sprite.current_action == "Charge":
-                    # If there is an x or y world tile collision
-                    if self.boss_group.sprite.movement_information_dict["WorldTileCollisionResultsX"] == True or self.boss_group.sprite.movement_information_dict["WorldTileCollisionResultsY"] == True:
-                        # Play the sound effect for when the boss collides with a tile when charging
-                        self.play_manual_sound(sound_effect = "ChargeTileCollision")
 
-                        # Set the player to change into the "Stunned" state (this will be done inside the SikaDeer class)
-                        self.boss_group.sprite.behaviour_patterns_dict["Charge"]["EnterStunnedStateBoolean"] = True
+        # Remove the chilli projectile from the manager if there is a collision
+        self.chilli_projectiles_manager.remove(chilli_projectile)
 
-                        # Set the "Charge" duration timer to 0, to end the charge attack
-                        self.boss_group.sprite.behaviour_patterns_dict["Charge"]["DurationTimer"] = 0
+        # Damage the player by the stomp attack node damage
+        self.player.player_gameplay_info_dict["CurrentHealth"] -= chilli_projectile.damage_amount
 
-                        # Set the "Stunned" duration timer to start counting down from half the duration (should be shorter as the player did not block them)
-                        self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["DurationTimer"] = (self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["Duration"] / 2)
+        # Play the player hurt sound effect
+        self.play_manual_sound(sound_effect = "PlayerHurt")
 
-                        # Create a camera shake effect for when the boss collides with a tile
-                        self.camera_shake_info_dict["EventsList"].append("BossTileCollide")
+        # If the player is alive / has more than 0 health
+        if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
+            # Create damage effect text
+            self.game_ui.create_effect_text(
+                                            type_of_effect_text = "Damage",
+                                            target = "Player",
+                                            text = "-" + str(chilli_projectile.damage_amount),
+                                            larger_font = False
+                                        )
 
-            # --------------------------------------
-            # Dive bomb attack circles
+        # Set the damaged flash effect timer to the damage flash effect time set (damaged flashing effect)
+        self.player.player_gameplay_info_dict["DamagedFlashEffectTimer"] = self.player.player_gameplay_info_dict["DamagedFlashEffectTime"]
 
-            # Only if the boss is the "SikaDeer" and the current action is "DiveBomb"
-            if self.bosses_dict["CurrentBoss"] == "GoldenMonkey" and self.boss_group.sprite.current_action == "DiveBomb":
+        # If the player's frenzy mode is not activated
+        if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
+            # Increase the player's frenzy mode meter by the take damage increment amount, limiting it to the maximum frenzy mode value
+            self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
+                                                                                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["TakeDamageFrenzyModeIncrement"],
+                                                                                self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
+                                                                                )
+            # Create frenzy mode value increment effect text
+            self.game_ui.create_effect_text(
+                                            type_of_effect_text = "FrenzyModeValueIncrement",
+                                            target = "Player",
+                                            text = "+" + str(self.player.player_gameplay_info_dict["TakeDamageFrenzyModeIncrement"]),
+                                            larger_font = False
+                                            )
 
-                # If the boss just landed after performing a divebomb attack
-                if self.boss_group.sprite.behaviour_patterns_dict["DiveBomb"]["Land"]["DurationTimer"] == self.boss_group.sprite.behaviour_patterns_dict["DiveBomb"]["Land"]["Duration"]:
-                
-                    # Create a camera shake effect for when the boss lands onto the ground
-                    self.camera_shake_info_dict["EventsList"].append("DiveBomb")
+    def handle_boss_and_building_tile_collision(self, boss, building_tile):
 
-                    # Play the dive bomb sound effect
-                    self.play_manual_sound(sound_effect = "DiveBomb")
+        # Handles a pixel-perfect collision between the current boss and a building tile
 
-                    # --------------------------------------
-                    # Building tiles
 
-                    # If there is at least one existing building tile
-                    if (len(self.player.tools["BuildingTool"]["ExistingBuildingTilesList"]) > 0):
-                        
-                        # Find the index of the building tile in the existing building tiles list if there is a rect collision between the tile and the boss
-                        building_collision_result_indexes = self.boss_group.sprite.dive_bomb_attack_controller.rect.collidelistall(self.player.tools["BuildingTool"]["ExistingBuildingTilesList"])
-
-                        # If there are any rect collisions
-                        if len(building_collision_result_indexes) > 0:
-                            
-                            # Create a tuple with the indexes of building tiles inside the existing building tiles list, if there is pixel-perfect collision between the tile and the dive bomb attack circle
-                            pixel_perfect_collision_indexes_tuple = tuple(
-                                                building_collision_result_index for building_collision_result_index in building_collision_result_indexes 
-                                                if pygame_sprite_collide_mask(self.boss_group.sprite.dive_bomb_attack_controller, self.player.tools["BuildingTool"]["ExistingBuildingTilesList"][building_collision_result_index]) != None
-                                                                    )
+        # Temporary variable for the building tile to remove
+        building_tile_to_remove = building_tile
 
-                            # For each building tile index
-                            for building_collision_result_index in pixel_perfect_collision_indexes_tuple:
+        # "Create" an empty tile where the building tile was
+        self.tile_grid.set_tile(tile = self.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove], tile_type = "Empty")
 
-                                # Temporary variable for the building tile to remove
-                                building_tile_to_remove = self.player.tools["BuildingTool"]["ExistingBuildingTilesList"][building_collision_result_index]
+        # Remove the building tile from the player's replaced empty tiles dict
+        self.player.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
 
-                                # "Create" an empty tile where the building tile was
-                                self.empty_tiles_dict[self.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
-                                
-                                # Remove the building tile from the player's replaced empty tiles dict
-                                self.player.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
+        # Remove the building tile from the existing building tiles list
+        self.player.tools["BuildingTool"]["ExistingBuildingTilesList"].remove(building_tile_to_remove)
 
-                                # Remove the building tile from the world tiles group
-                                self.world_tiles_group.remove(building_tile_to_remove)
+        # If the building tile to remove is in the neighbouring tiles dictionary (keys)
+        if building_tile_to_remove in self.player.neighbouring_tiles_dict.keys():
+            # Remove the building tile
+            self.player.neighbouring_tiles_dict.pop(building_tile_to_remove)
 
-                                # Remove the building tile from the world tiles dictionary
-                                self.world_tiles_dict.pop(building_tile_to_remove)
+        # ------------------------------------------------------------------
+        # Additional effects
 
-                                # If the building tile to remove is in the neighbouring tiles dictionary (keys)
-                                if building_tile_to_remove in self.player.neighbouring_tiles_dict.keys():
-                                    # Remove the building tile
-                                    self.player.neighbouring_tiles_dict.pop(building_tile_to_remove)
+        # Create many shattered bamboo pieces
+        self.game_ui.create_angled_polygons_effects(
+                                                    purpose = "ShatteredBambooPieces",
+                                                    position = (building_tile_to_remove.rect.centerx, building_tile_to_remove.rect.centery),
+                                                    specified_number_of_pieces = random_randrange(10, 20)
+                                                    )
 
-                                # Create many shattered bamboo pieces
-                                self.game_ui.create_angled_polygons_effects(
-                                                                            purpose = "ShatteredBambooPieces",
-                                                                            position = (building_tile_to_remove.rect.centerx, building_tile_to_remove.rect.centery),
-                                                                            specified_number_of_pieces = random_randrange(10, 20)
-                                                                            )
+        # If the boss is currently chasing the player
+        if self.boss_group.sprite.current_action == "Chase":
+            # Reset the boss' movement acceleration, so that they slow down
+            self.boss_group.sprite.reset_movement_acceleration(horizontal_reset = True, vertical_reset = True)
+            # Play the sound effect when the boss runs into a tile
+            self.play_manual_sound(sound_effect = "BossTileSmallCollision")
 
-                            # Rebuild the existing building tiles list
-                            # Note: This is because, popping whilst iterating over the list would cause an index error
-                            self.player.tools["BuildingTool"]["ExistingBuildingTilesList"] = [
-                                self.player.tools["BuildingTool"]["ExistingBuildingTilesList"][i] for i in range(0, len(self.player.tools["BuildingTool"]["ExistingBuildingTilesList"])) if i not in pixel_perfect_collision_indexes_tuple]
+        # If the boss is the "SikaDeer" and collided with the player whilst charge attacking
+        elif self.bosses_dict["CurrentBoss"] == "SikaDeer" and self.boss_group.sprite.current_action == "Charge":
 
-                    # ------------------------------------------------------------------
-                    # Player
+            # Play the sound effect for when the boss collides with a tile when charging
+            self.play_manual_sound(sound_effect = "ChargeTileCollision")
 
-                    # If there is pixel perfect collision and the player has not been knocked back yet
-                    if pygame_sprite_collide_mask(self.boss_group.sprite.dive_bomb_attack_controller, self.player) and self.player.player_gameplay_info_dict["InvincibilityTimer"] == None and (self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] == None):
-                        
-                        # -------------------
-                        # Error prevention
-
-                        """Note: This occurs if the boss divebombs the player before its move method has been called"""
-                        try:
-                            # Knockback the player
-                            self.player.player_gameplay_info_dict["KnockbackAttackDirection"] = [self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"], self.boss_group.sprite.movement_information_dict["VerticalSuvatS"]]
-                            self.player.player_gameplay_info_dict["KnockbackTimer"] = self.player.player_gameplay_info_dict["KnockbackTime"] * 2
-                        except:
-                            # Set the horizontal distance travelled based on the current velocity of the boss
-                            self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"] = ((self.boss_group.sprite.movement_information_dict["HorizontalSuvatU"] * self.boss_group.sprite.movement_information_dict["DeltaTime"]) + (0.5 * self.boss_group.sprite.movement_information_dict["HorizontalSuvatA"] * (self.boss_group.sprite.movement_information_dict["DeltaTime"] ** 2)))
-                            # Set the vertical distance travelled based on the current velocity of the boss
-                            self.boss_group.sprite.movement_information_dict["VerticalSuvatS"] = ((self.boss_group.sprite.movement_information_dict["VerticalSuvatU"] * self.boss_group.sprite.movement_information_dict["DeltaTime"]) + (0.5 * self.boss_group.sprite.movement_information_dict["VerticalSuvatA"] * (self.boss_group.sprite.movement_information_dict["DeltaTime"] ** 2)))
-                            
-                        # Knockback the player
-                        self.player.player_gameplay_info_dict["KnockbackAttackDirection"] = [self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"], self.boss_group.sprite.movement_information_dict["VerticalSuvatS"]]
-                        self.player.player_gameplay_info_dict["KnockbackTimer"] = self.player.player_gameplay_info_dict["KnockbackTime"]
-
-                        # Set the horizontal and vertical distance the player should travel based on the angle the boss hit it
-                        # Note: Divided by 1000 because the knockback time is in milliseconds
-                        self.player.player_gameplay_info_dict["KnockbackHorizontalDistanceTimeGradient"] = (self.player.player_gameplay_info_dict["KnockbackDistanceTravelled"] * cos(self.boss_group.sprite.movement_information_dict["Angle"])) / (self.player.player_gameplay_info_dict["KnockbackTime"] / 1000)
-                        self.player.player_gameplay_info_dict["KnockbackVerticalDistanceTimeGradient"] = (self.player.player_gameplay_info_dict["KnockbackDistanceTravelled"] * sin(self.boss_group.sprite.movement_information_dict["Angle"])) / (self.player.player_gameplay_info_dict["KnockbackTime"] / 1000)
-                        """Multipled by the divebomb knockback multiplier for a stronger knockback"""
-                        self.player.player_gameplay_info_dict["KnockbackHorizontalDistanceTimeGradient"] *= self.boss_group.sprite.dive_bomb_attack_controller.knockback_multiplier
-                        self.player.player_gameplay_info_dict["KnockbackVerticalDistanceTimeGradient"] *= self.boss_group.sprite.dive_bomb_attack_controller.knockback_multiplier
-
-                        # Play the player hurt sound effect
-                        self.play_manual_sound(sound_effect = "PlayerHurt")
-
-                        # Set the player's invincibility timer to start counting down 
-                        self.player.player_gameplay_info_dict["InvincibilityTimer"] = self.player.player_gameplay_info_dict["InvincibilityTime"]
-
-                        # If the player is alive / has more than 0 health
-                        if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
-                            # Create damage effect text
-                            self.game_ui.create_effect_text(
-                                                            type_of_effect_text = "Damage",
-                                                            target = "Player",
-                                                            text = "-" + str(self.boss_group.sprite.dive_bomb_attack_controller.damage_amount),
-                                                            larger_font = True
-                                                        )
+            # Reset the boss' movement acceleration, so that they slow down
+            self.boss_group.sprite.reset_movement_acceleration(horizontal_reset = True, vertical_reset = True)
 
-                        # Set the boss to stop moving momentarily
-                        self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] = self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTime"]
+            # Set the player to change into the "Stunned" state (this will be done inside the SikaDeer class)
+            self.boss_group.sprite.behaviour_patterns_dict["Charge"]["EnterStunnedStateBoolean"] = True
 
-                        # Reset the boss' movement acceleration
-                        self.boss_group.sprite.reset_movement_acceleration(horizontal_reset = True, vertical_reset = True)
+            # Set the "Charge" duration timer to 0, to end the charge attack
+            self.boss_group.sprite.behaviour_patterns_dict["Charge"]["DurationTimer"] = 0
 
-                        # Damage the player by the amount of knockback damage the divebomb attack deals
-                        self.player.player_gameplay_info_dict["CurrentHealth"] = max(self.player.player_gameplay_info_dict["CurrentHealth"] - self.boss_group.sprite.dive_bomb_attack_controller.damage_amount, 0)
+            # Set the "Stunned" duration timer to start counting down
+            self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["DurationTimer"] = self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["Duration"]
 
-            # --------------------------------------
-            # Player
+            # Damage the current boss by the amount of damage dealt from being stunned
+            self.boss_group.sprite.extra_information_dict["CurrentHealth"] -= self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["StunnedDamageAmount"]
 
-            # If there is a rect collision between the player and the boss is not currently idling after the knockback and the boss is not currently stunned
+            # Create damage effect text
+            self.game_ui.create_effect_text(
+                                            type_of_effect_text = "Damage",
+                                            target = "Boss",
+                                            text = "-" + str(self.boss_group.sprite.behaviour_patterns_dict["Stunned"]["StunnedDamageAmount"]),
+                                            larger_font = True
+                                            )
 
-            """ Checks:
-            - If the boss collides with the player
-            - If the boss is not idling after knocking back the player (so that the player doesn't keep setting off the idle timer in quick succession)
-            - If the boss is not currently stunned 
-            - If the player is not invincible (after getting knocked back recently)
-            - The boss is the Golden Monkey and they are not currently performing the dive bomb attack, and is currently launching
-            - If the boss' current action is not "Sleep"
-            """
-            if self.boss_group.sprite.rect.colliderect(self.player.rect) == True and \
-                (self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] == None) and \
-                    self.boss_group.sprite.current_action != "Stunned" and \
-                        self.player.player_gameplay_info_dict["InvincibilityTimer"] == None and \
-                            (self.boss_group.sprite.current_action == "DiveBomb" and self.boss_group.sprite.behaviour_patterns_dict["DiveBomb"]["CurrentDiveBombStage"] == "Launch") == False and \
-                                self.boss_group.sprite.current_action != "Sleep":
-
-                # If there is pixel-perfect collision 
-                if pygame_sprite_collide_mask(self.boss_group.sprite, self.player):
-                    # -------------------
-                    # Error prevention
-                    """Note: This occurs if the boss has collided with the player before its move method has been called"""
-                    try:
-                        # Knockback the player
-                        self.player.player_gameplay_info_dict["KnockbackAttackDirection"] = [self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"], self.boss_group.sprite.movement_information_dict["VerticalSuvatS"]]
-                        self.player.player_gameplay_info_dict["KnockbackTimer"] = self.player.player_gameplay_info_dict["KnockbackTime"]
-                    except:
-                        # Set the horizontal distance travelled based on the current velocity of the boss
-                        self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"] = ((self.boss_group.sprite.movement_information_dict["HorizontalSuvatU"] * self.boss_group.sprite.movement_information_dict["DeltaTime"]) + (0.5 * self.boss_group.sprite.movement_information_dict["HorizontalSuvatA"] * (self.boss_group.sprite.movement_information_dict["DeltaTime"] ** 2)))
-                        # Set the vertical distance travelled based on the current velocity of the boss
-                        self.boss_group.sprite.movement_information_dict["VerticalSuvatS"] = ((self.boss_group.sprite.movement_information_dict["VerticalSuvatU"] * self.boss_group.sprite.movement_information_dict["DeltaTime"]) + (0.5 * self.boss_group.sprite.movement_information_dict["VerticalSuvatA"] * (self.boss_group.sprite.movement_information_dict["DeltaTime"] ** 2)))
-                        
-                        # Knockback the player
-                        self.player.player_gameplay_info_dict["KnockbackAttackDirection"] = [self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"], self.boss_group.sprite.movement_information_dict["VerticalSuvatS"]]
-                        self.player.player_gameplay_info_dict["KnockbackTimer"] = self.player.player_gameplay_info_dict["KnockbackTime"]
-
-                    # Set the horizontal and vertical distance the player should travel based on the angle the boss hit it
-                    # Note: Divided by 1000 because the knockback time is in milliseconds
-                    self.player.player_gameplay_info_dict["KnockbackHorizontalDistanceTimeGradient"] = (self.player.player_gameplay_info_dict["KnockbackDistanceTravelled"] * cos(self.boss_group.sprite.movement_information_dict["Angle"])) / (self.player.player_gameplay_info_dict["KnockbackTime"] / 1000)
-                    self.player.player_gameplay_info_dict["KnockbackVerticalDistanceTimeGradient"] = (self.player.player_gameplay_info_dict["KnockbackDistanceTravelled"] * sin(self.boss_group.sprite.movement_information_dict["Angle"])) / (self.player.player_gameplay_info_dict["KnockbackTime"] / 1000)
-
-                    # Set the player's invincibility timer to start counting down 
-                    self.player.player_gameplay_info_dict["InvincibilityTimer"] = self.player.player_gameplay_info_dict["InvincibilityTime"]
-
-                    # If the player is alive / has more than 0 health
-                    if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
-                        # Create damage effect text
-                        self.game_ui.create_effect_text(
-                                                        type_of_effect_text = "Damage",
-                                                        target = "Player",
-                                                        text = "-" + str(self.boss_group.sprite.extra_information_dict["KnockbackDamage"]),
-                                                        larger_font = False
+            # If the player's frenzy mode is not activated
+            if self.player.player_gameplay_info_dict["FrenzyModeTimer"] == None:
+                # Increase the player's frenzy mode meter by the stun enemy increment amount, limiting it to the maximum frenzy mode value
+                self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] = min(
+                                                                                    self.player.player_gameplay_info_dict["CurrentFrenzyModeValue"] + self.player.player_gameplay_info_dict["StunEnemyFrenzyModeIncrement"],
+                                                                                    self.player.player_gameplay_info_dict["MaximumFrenzyModeValue"]
+                                                                                    )
+
+                # Create frenzy mode value increment effect text
+                self.game_ui.create_effect_text(
+                                                type_of_effect_text = "FrenzyModeValueIncrement",
+                                                target = "Player",
+                                                text = "+" + str(self.player.player_gameplay_info_dict["StunEnemyFrenzyModeIncrement"]),
+                                                larger_font = True
+                                                )
+
+            # Create a camera shake effect for when the boss collides with a tile
+            self.camera_shake_info_dict["EventsList"].append("BossTileCollide")
+
+    def handle_dive_bomb_and_building_tile_collision(self, dive_bomb_attack_circle, building_tile):
+
+        # Handles a pixel-perfect collision between the dive bomb attack circle (when the boss has just landed) and a building tile
+
+
+        # Temporary variable for the building tile to remove
+        building_tile_to_remove = building_tile
+
+        # "Create" an empty tile where the building tile was
+        self.tile_grid.set_tile(tile = self.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove], tile_type = "Empty")
+
+        # Remove the building tile from the player's replaced empty tiles dict
+        self.player.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
+
+        # Remove the building tile from the existing building tiles list
+        self.player.tools["BuildingTool"]["ExistingBuildingTilesList"].remove(building_tile_to_remove)
+
+        # If the building tile to remove is in the neighbouring tiles dictionary (keys)
+        if building_tile_to_remove in self.player.neighbouring_tiles_dict.keys():
+            # Remove the building tile
+            self.player.neighbouring_tiles_dict.pop(building_tile_to_remove)
+
+        # Create many shattered bamboo pieces
+        self.game_ui.create_angled_polygons_effects(
+                                                    purpose = "ShatteredBambooPieces",
+                                                    position = (building_tile_to_remove.rect.centerx, building_tile_to_remove.rect.centery),
+                                                    specified_number_of_pieces = random_randrange(10, 20)
                                                     )
-                    
-                    # Play the player hurt sound effect
-                    self.play_manual_sound(sound_effect = "PlayerHurt")
 
-                    # If the boss is the "SikaDeer" and collided with the player whilst charge attacking
-                    if self.bosses_dict["CurrentBoss"] == "SikaDeer" and self.boss_group.sprite.current_action == "Charge":
-                        # Set the "Charge" duration timer to 0 (to end the charge attack)
-                        self.boss_group.sprite.behaviour_patterns_dict["Charge"]["DurationTimer"] = 0
+    def handle_dive_bomb_and_player_collision(self, dive_bomb_attack_circle, player):
 
-                    # Set the boss to stop moving momentarily
-                    self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] = self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTime"]
+        # Handles a pixel-perfect collision between the dive bomb attack circle (when the boss has just landed) and the player, only if the player has not been knocked back yet
+        if self.player.player_gameplay_info_dict["InvincibilityTimer"] == None and (self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] == None):
 
-                    # Reset the boss' movement acceleration
-                    self.boss_group.sprite.reset_movement_acceleration(horizontal_reset = True, vertical_reset = True)
 
-                    # Damage the player by the amount of knockback damage the current boss deals
-                    self.player.player_gameplay_info_dict["CurrentHealth"] = max(self.player.player_gameplay_info_dict["CurrentHealth"] - self.boss_group.sprite.extra_information_dict["KnockbackDamage"], 0)
-                
+            # -------------------
+            # Error prevention
+
+            """Note: This occurs if the boss divebombs the player before its move method has been called"""
+            try:
+                # Knockback the player
+                self.player.player_gameplay_info_dict["KnockbackAttackDirection"] = [self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"], self.boss_group.sprite.movement_information_dict["VerticalSuvatS"]]
+                self.player.player_gameplay_info_dict["KnockbackTimer"] = self.player.player_gameplay_info_dict["KnockbackTime"] * 2
+            except:
+                # Set the horizontal distance travelled based on the current velocity of the boss
+                self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"] = ((self.boss_group.sprite.movement_information_dict["HorizontalSuvatU"] * self.boss_group.sprite.movement_information_dict["DeltaTime"]) + (0.5 * self.boss_group.sprite.movement_information_dict["HorizontalSuvatA"] * (self.boss_group.sprite.movement_information_dict["DeltaTime"] ** 2)))
+                # Set the vertical distance travelled based on the current velocity of the boss
+                self.boss_group.sprite.movement_information_dict["VerticalSuvatS"] = ((self.boss_group.sprite.movement_information_dict["VerticalSuvatU"] * self.boss_group.sprite.movement_information_dict["DeltaTime"]) + (0.5 * self.boss_group.sprite.movement_information_dict["VerticalSuvatA"] * (self.boss_group.sprite.movement_information_dict["DeltaTime"] ** 2)))
+
+            # Knockback the player
+            self.player.player_gameplay_info_dict["KnockbackAttackDirection"] = [self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"], self.boss_group.sprite.movement_information_dict["VerticalSuvatS"]]
+            self.player.player_gameplay_info_dict["KnockbackTimer"] = self.player.player_gameplay_info_dict["KnockbackTime"]
+
+            # Set the horizontal and vertical distance the player should travel based on the angle the boss hit it
+            # Note: Divided by 1000 because the knockback time is in milliseconds
+            self.player.player_gameplay_info_dict["KnockbackHorizontalDistanceTimeGradient"] = (self.player.player_gameplay_info_dict["KnockbackDistanceTravelled"] * cos(self.boss_group.sprite.movement_information_dict["Angle"])) / (self.player.player_gameplay_info_dict["KnockbackTime"] / 1000)
+            self.player.player_gameplay_info_dict["KnockbackVerticalDistanceTimeGradient"] = (self.player.player_gameplay_info_dict["KnockbackDistanceTravelled"] * sin(self.boss_group.sprite.movement_information_dict["Angle"])) / (self.player.player_gameplay_info_dict["KnockbackTime"] / 1000)
+            """Multipled by the divebomb knockback multiplier for a stronger knockback"""
+            self.player.player_gameplay_info_dict["KnockbackHorizontalDistanceTimeGradient"] *= self.boss_group.sprite.dive_bomb_attack_controller.knockback_multiplier
+            self.player.player_gameplay_info_dict["KnockbackVerticalDistanceTimeGradient"] *= self.boss_group.sprite.dive_bomb_attack_controller.knockback_multiplier
+
+            # Play the player hurt sound effect
+            self.play_manual_sound(sound_effect = "PlayerHurt")
+
+            # Set the player's invincibility timer to start counting down 
+            self.player.player_gameplay_info_dict["InvincibilityTimer"] = self.player.player_gameplay_info_dict["InvincibilityTime"]
+
+            # If the player is alive / has more than 0 health
+            if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
+                # Create damage effect text
+                self.game_ui.create_effect_text(
+                                                type_of_effect_text = "Damage",
+                                                target = "Player",
+                                                text = "-" + str(self.boss_group.sprite.dive_bomb_attack_controller.damage_amount),
+                                                larger_font = True
+                                            )
+
+            # Set the boss to stop moving momentarily
+            self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] = self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTime"]
+
+            # Reset the boss' movement acceleration
+            self.boss_group.sprite.reset_movement_acceleration(horizontal_reset = True, vertical_reset = True)
+
+            # Damage the player by the amount of knockback damage the divebomb attack deals
+            self.player.player_gameplay_info_dict["CurrentHealth"] = max(self.player.player_gameplay_info_dict["CurrentHealth"] - self.boss_group.sprite.dive_bomb_attack_controller.damage_amount, 0)
+
+    def handle_boss_and_player_collision(self, boss, player):
+
+        # Handles a pixel-perfect collision between the current boss and the player
+
+        """ Checks:
+        - If the boss is not idling after knocking back the player (so that the player doesn't keep setting off the idle timer in quick succession)
+        - If the boss is not currently stunned 
+        - If the player is not invincible (after getting knocked back recently)
+        - The boss is the Golden Monkey and they are not currently performing the dive bomb attack, and is currently launching
+        - If the boss' current action is not "Sleep"
+        """
+        if (self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] == None) and \
+            self.boss_group.sprite.current_action != "Stunned" and \
+                self.player.player_gameplay_info_dict["InvincibilityTimer"] == None and \
+                    (self.boss_group.sprite.current_action == "DiveBomb" and self.boss_group.sprite.behaviour_patterns_dict["DiveBomb"]["CurrentDiveBombStage"] == "Launch") == False and \
+                        self.boss_group.sprite.current_action != "Sleep":
+
+            # -------------------
+            # Error prevention
+            """Note: This occurs if the boss has collided with the player before its move method has been called"""
+            try:
+                # Knockback the player
+                self.player.player_gameplay_info_dict["KnockbackAttackDirection"] = [self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"], self.boss_group.sprite.movement_information_dict["VerticalSuvatS"]]
+                self.player.player_gameplay_info_dict["KnockbackTimer"] = self.player.player_gameplay_info_dict["KnockbackTime"]
+            except:
+                # Set the horizontal distance travelled based on the current velocity of the boss
+                self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"] = ((self.boss_group.sprite.movement_information_dict["HorizontalSuvatU"] * self.boss_group.sprite.movement_information_dict["DeltaTime"]) + (0.5 * self.boss_group.sprite.movement_information_dict["HorizontalSuvatA"] * (self.boss_group.sprite.movement_information_dict["DeltaTime"] ** 2)))
+                # Set the vertical distance travelled based on the current velocity of the boss
+                self.boss_group.sprite.movement_information_dict["VerticalSuvatS"] = ((self.boss_group.sprite.movement_information_dict["VerticalSuvatU"] * self.boss_group.sprite.movement_information_dict["DeltaTime"]) + (0.5 * self.boss_group.sprite.movement_information_dict["VerticalSuvatA"] * (self.boss_group.sprite.movement_information_dict["DeltaTime"] ** 2)))
+
+                # Knockback the player
+                self.player.player_gameplay_info_dict["KnockbackAttackDirection"] = [self.boss_group.sprite.movement_information_dict["HorizontalSuvatS"], self.boss_group.sprite.movement_information_dict["VerticalSuvatS"]]
+                self.player.player_gameplay_info_dict["KnockbackTimer"] = self.player.player_gameplay_info_dict["KnockbackTime"]
+
+            # Set the horizontal and vertical distance the player should travel based on the angle the boss hit it
+            # Note: Divided by 1000 because the knockback time is in milliseconds
+            self.player.player_gameplay_info_dict["KnockbackHorizontalDistanceTimeGradient"] = (self.player.player_gameplay_info_dict["KnockbackDistanceTravelled"] * cos(self.boss_group.sprite.movement_information_dict["Angle"])) / (self.player.player_gameplay_info_dict["KnockbackTime"] / 1000)
+            self.player.player_gameplay_info_dict["KnockbackVerticalDistanceTimeGradient"] = (self.player.player_gameplay_info_dict["KnockbackDistanceTravelled"] * sin(self.boss_group.sprite.movement_information_dict["Angle"])) / (self.player.player_gameplay_info_dict["KnockbackTime"] / 1000)
+
+            # Set the player's invincibility timer to start counting down 
+            self.player.player_gameplay_info_dict["InvincibilityTimer"] = self.player.player_gameplay_info_dict["InvincibilityTime"]
+
+            # If the player is alive / has more than 0 health
+            if self.player.player_gameplay_info_dict["CurrentHealth"] > 0:
+                # Create damage effect text
+                self.game_ui.create_effect_text(
+                                                type_of_effect_text = "Damage",
+                                                target = "Player",
+                                                text = "-" + str(self.boss_group.sprite.extra_information_dict["KnockbackDamage"]),
+                                                larger_font = False
+                                            )
+
+            # Play the player hurt sound effect
+            self.play_manual_sound(sound_effect = "PlayerHurt")
+
+            # If the boss is the "SikaDeer" and collided with the player whilst charge attacking
+            if self.bosses_dict["CurrentBoss"] == "SikaDeer" and self.boss_group.sprite.current_action == "Charge":
+                # Set the "Charge" duration timer to 0 (to end the charge attack)
+                self.boss_group.sprite.behaviour_patterns_dict["Charge"]["DurationTimer"] = 0
+
+            # Set the boss to stop moving momentarily
+            self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTimer"] = self.boss_group.sprite.movement_information_dict["KnockbackCollisionIdleTime"]
+
+            # Reset the boss' movement acceleration
+            self.boss_group.sprite.reset_movement_acceleration(horizontal_reset = True, vertical_reset = True)
+
+            # Damage the player by the amount of knockback damage the current boss deals
+            self.player.player_gameplay_info_dict["CurrentHealth"] = max(self.player.player_gameplay_info_dict["CurrentHealth"] - self.boss_group.sprite.extra_information_dict["KnockbackDamage"], 0)
+
     def look_for_world_tile_collisions(self, item, other_group):
         
         # Helper method to find collisions between items in another specified group and world tiles
             
-        # Check for a rect collision between the item and world / building tiles inside the world tiles dictionary
-        collision_result = item.rect.collidedict(self.world_tiles_dict)
+        # Check for a rect collision between the item and world / building tiles inside the cells that the item covers
+        collision_result = item.rect.collidedict(self.tile_grid.find_world_tiles(rect = item.rect))
 
         # If the item collided with a tile
         if collision_result != None:
@@ -1866,115 +1765,27 @@ class Game:
             # If there are not the maximum number of piles at one time 
             if len(self.bamboo_piles_group) < BambooPile.bamboo_pile_info_dict["MaximumNumberOfPilesAtOneTime"]:
                 """ Note:
-                - A spawning position is only considered to be "valid" if it is a minimum and maximum distance away from the middle of the map and is within an untaken "segment". (Explanation below)
-                
+                - A spawning position is only considered to be "valid" if it is a minimum and maximum distance away from the middle of the map and is within an untaken "segment"
+                - The tile map is separated into segments around the middle of the map (one for each bamboo pile that can exist at one time), so that bamboo piles are spread out instead of being clumped together
+                - The empty tiles that are a valid distance away from the middle of the map are already bucketed into their segments by the spawn index, so this is only a look-up
                 """
-                
-                # Generate a list of empty tiles inside the empty tiles dict that are a minimum and maximum distance away from the middle of the tile map
-                valid_distance_away_from_player_tiles_list = tuple(empty_tile for empty_tile in self.empty_tiles_dict.keys() 
-                                                                    if BambooPile.bamboo_pile_info_dict["MinimumSpawningDistanceFromMiddle"] <= 
-                                                                    dist(self.middle_tile_position, (empty_tile.rect.x + (empty_tile.rect.width / 2) , empty_tile.rect.x + (empty_tile.rect.height / 2))) <= 
-                                                                    BambooPile.bamboo_pile_info_dict["MaximumSpawningDistanceFromMiddle"]
-                                                                    )
-
-                # If there are no bamboo piles already
-                if len(self.bamboo_piles_group) == 0:
-                        
-
-                    # Choose a random tile from list of empty tiles that are a valid distance away from the player
-                    valid_tile = random_choice(valid_distance_away_from_player_tiles_list)
-
-                    # Find the angle
-                    degrees_depending_on_num_of_segments = 360 / BambooPile.bamboo_pile_info_dict["MaximumNumberOfPilesAtOneTime"]
-                    angle = degrees(atan2(-(valid_tile.rect.y - self.middle_tile_position[1]), (valid_tile.rect.x - self.middle_tile_position[0])) % (2 * pi))
-                    segment = (angle - (angle % degrees_depending_on_num_of_segments)) / degrees_depending_on_num_of_segments
-
-                    # Create a new bamboo pile  
-                    new_bamboo_pile = BambooPile(x = valid_tile.rect.x, y = valid_tile.rect.y)
-                    self.bamboo_piles_group.add(new_bamboo_pile)
-                    # Set the spawning cooldown timer to start counting down
-                    BambooPile.bamboo_pile_info_dict["SpawningCooldownTimer"] = BambooPile.bamboo_pile_info_dict["SpawningCooldown"]
-                    
-                    # Set the current segment chosen to be taken
-                    self.bamboo_piles_segments_taken_dict[segment] = new_bamboo_pile
-
-                    # Save the empty tile in the replaced empty tiles dict so that we do not need to create a new empty tile every time a bamboo pile is spawned / removed
-                    self.replaced_empty_tiles_dict[new_bamboo_pile] = valid_tile
-
-                    # Remove the empty tile from the empty tiles dict
-                    self.empty_tiles_dict.pop(valid_tile)
-
-                # If there are any existing bamboo piles
-                elif len(self.bamboo_piles_group) > 0:
-
-                    """ Segments: There will be x segments (if there were 8, the segment angle would be 360 / 8 == 45)
-
-                    0 <= ? <= 45
-                    45 <= ? <= 90
-                    135 <= ? < 180
-                    and so on.
 
-                    This works by separating the tile map into 8 segments, and spawning a bamboo pile in any segment at random. 
-                    The segment is then saved so that the next time a bamboo pile is about to be spawned, we can ensure that it will never be in the same segment as other bamboo piles
-                    """
-
-                    # --------------------------------------------------------------------------------------------------------
-                    # Create a list of the possible segments that the bamboo pile can spawn in
-
-                    # segments_taken_dict = {i : i}
-                    possible_segments_tuple = tuple(segment_untaken for potential_bamboo_pile_key, segment_untaken in self.bamboo_piles_segments_taken_dict.items() if potential_bamboo_pile_key == segment_untaken)
-
-                    # If there are more than one possible segment that the bamboo pile can spawn in
-                    if len(possible_segments_tuple) > 0:
-                        # Generate a random untaken segment for the pile to spawn in
-                        random_segment = random_choice(possible_segments_tuple)
-
-                    # If there is only one possible segment that the bamboo pile can spawn in
-                    elif len(possible_segments_tuple) == 0:
-                        # Set the segment as that possible segment
-                        random_segment = possible_segments_tuple[0]
-                    
-                    # --------------------------------------------------------------------------------------------------------
-                    # Create a list of empty tiles which are in the segment as the selected segment (i.e. an untaken segment)
-
-                    degrees_depending_on_num_of_segments = 360 / BambooPile.bamboo_pile_info_dict["MaximumNumberOfPilesAtOneTime"]
-
-                    possible_tiles = tuple( 
-                    
-                    empty_tile for empty_tile in valid_distance_away_from_player_tiles_list 
-                
-                        # If this empty tile is in the same segment as the selected segment, add it to the list
-                        if 
-                        ((degrees(atan2(-(empty_tile.rect.y - self.middle_tile_position[1]), (empty_tile.rect.x - self.middle_tile_position[0])) % (2 * pi)) - 
-                        degrees(atan2(-(empty_tile.rect.y - self.middle_tile_position[1]), (empty_tile.rect.x - self.middle_tile_position[0])) % (2 * pi)) % degrees_depending_on_num_of_segments) / degrees_depending_on_num_of_segments) == random_segment
-                            
-                                        )
-
-                    """ Long version: (using 45 degrees with 8 segments as an example)
-
-                    possible_tiles = []
-
-                    # Finding tiles within the chosen random segment
-                    for empty_tile in valid_distance_away_from_player_tiles_list:
-                        angle = degrees(atan2(-(empty_tile[1] - self.middle_tile_position[1]), (empty_tile[0] - self.middle_tile_position[0])) % (2 * pi))
-                        segment = (angle - (angle % 45)) / 45
-
-                        if segment == random_segment: 
-                            possible_tiles.append(empty_tile)
-
-                    """
-    
-                    # --------------------------------------------------------------------------------------------------------
-                    # Select a random tile from this new segment 
-
-                    random_spawning_tile = random_choice(possible_tiles)
+                # Create a tuple of the untaken segments that have at least one empty tile to spawn on
+                # Note: Untaken segments are saved in the segments taken dict as {segment: segment}
+                possible_segments_tuple = tuple(
+                                                segment for segment, bamboo_pile in self.bamboo_piles_segments_taken_dict.items() 
+                                                if segment == bamboo_pile and self.bamboo_pile_spawn_index.count_tiles(segment = segment) > 0
+                                                )
 
-                    # --------------------------------------------------------------------------------------------------------  
-                    # Creating the bamboo pile and setting up segments
+                # If there is at least one segment that the bamboo pile can spawn in
+                if len(possible_segments_tuple) > 0:
 
+                    # Choose a random untaken segment, and then a random empty tile inside of it
+                    random_segment = random_choice(possible_segments_tuple)
+                    random_spawning_tile = self.bamboo_pile_spawn_index.choose_tile(segment = random_segment)
 
                     # Create a new bamboo pile
-                    new_bamboo_pile = BambooPile(x = random_spawning_tile.rect.x, y = random_spawning_tile.rect.y)
+                    new_bamboo_pile = BambooPile.pool.acquire(x = random_spawning_tile.rect.x, y = random_spawning_tile.rect.y)
 
                     # Add it to the bamboo piles group
                     self.bamboo_piles_group.add(new_bamboo_pile)
@@ -1988,8 +1799,9 @@ class Game:
                     # Save the empty tile in the replaced empty tiles dict so that we do not need to create a new empty tile every time a bamboo pile is spawned / removed
                     self.replaced_empty_tiles_dict[new_bamboo_pile] = random_spawning_tile
 
-                    # Remove the empty tile from the empty tiles dict
-                    self.empty_tiles_dict.pop(random_spawning_tile)
+                    # Replace the empty tile with the bamboo pile inside the tile grid
+                    # Note: Setting the tile inside the tile grid also removes the tile from the spawn index
+                    self.tile_grid.set_tile(tile = new_bamboo_pile, tile_type = "BambooPile")
 
     # -------------------------------------------
     # Bosses
@@ -2059,8 +1871,7 @@ class Game:
                         "CurrentBoss": "SikaDeer",
                         "RemainingBossesList": ["SikaDeer", "GoldenMonkey"],
 
-                        "NumOfTilesForChecking": number_of_tiles_for_checking, # The number of tiles to the left / right / up, down of the randomly chosen empty tile for the spawning position to be valid
-                        "RandomSpawningPosition" : random_choice(list(self.empty_tiles_dict.keys())), # Choose a random spawning position
+                        "NumOfTilesForChecking": number_of_tiles_for_checking, # The number of tiles to the left / right / up, down of the spawning position that must be empty for the spawning position to be valid
                         "ValidSpawningPosition": None, 
                         "SpawningPositionTilesList": [],
                         "TimeToSpawn": time_to_spawn, # The time for the boss to spawn
@@ -2078,57 +1889,39 @@ class Game:
         # pygame_draw_circle(surface = self.scaled_surface, color = "green", center = (self.player.rect.centerx - self.camera_position[0], self.player.rect.centery - self.camera_position[1]), radius = 13 * TILE_SIZE, width = 2)
         # pygame_draw_circle(surface = self.scaled_surface, color = "blue", center = (self.player.rect.centerx - self.camera_position[0], self.player.rect.centery - self.camera_position[1]), radius = 25 * TILE_SIZE, width = 2)
 
-        # If the distance between the player and the boss is not within a minimum and maximum range
-        if ((13 * TILE_SIZE) <= dist(self.player.rect.center, self.bosses_dict["RandomSpawningPosition"].rect.center) <= (25 * TILE_SIZE)) == False:
+        # If a valid spawning position has not been found
+        if self.bosses_dict["ValidSpawningPosition"] == None:
+            
+            """ Note:
+            - A spawning position is only valid if it is a minimum and maximum distance away from the player, and all of the tiles within NumOfTilesForChecking tiles of it (to the left / right / up / down) are empty
+            - The clearance map already holds the cells with enough empty tiles around them, so the valid spawning positions are found directly instead of checking random tiles until one has enough space
+            """
+            valid_spawning_cells_list = self.clearance_map.find_cells(
+                                                                    minimum_clearance = self.bosses_dict["NumOfTilesForChecking"] + 1, 
+                                                                    position = self.player.rect.center, 
+                                                                    minimum_distance = 13 * TILE_SIZE, 
+                                                                    maximum_distance = 25 * TILE_SIZE
+                                                                    )
 
-            # Until we find a valid spawning position:
-            for i in range(0, 200, 1):
-                # Generate a new spawning position
-                self.bosses_dict["RandomSpawningPosition"] = random_choice(list(self.empty_tiles_dict.keys()))
+            # If there is "enough space" for the boss to spawn anywhere (e.g. the player has not surrounded themselves with building tiles)
+            if len(valid_spawning_cells_list) > 0:
 
-                # Check if the distance between the player and the boss is within a minimum and maximum range
-                if ((13 * TILE_SIZE) <= dist(self.player.rect.center, self.bosses_dict["RandomSpawningPosition"].rect.center) <= (25 * TILE_SIZE)) == True:
-                    # If it is, exit the loop
-                    # Set the spawning boss variable to True
-                    self.bosses_dict["SpawningBoss"] = True
-                    break
+                # Choose a random valid spawning position
+                row, column = random_choice(valid_spawning_cells_list)
+                self.bosses_dict["ValidSpawningPosition"] = self.tile_grid.get_tile(row = row, column = column)
 
-        # If a valid spawning position has not been found
-        if self.bosses_dict["ValidSpawningPosition"] == None:
+                # Add the empty tiles around the spawning position to the spawning position tiles list (for the spawning effect)
+                self.bosses_dict["SpawningPositionTilesList"] = [
+                                                                self.tile_grid.get_tile(row = row + row_change, column = column + column_change)
+                                                                for row_change in range(-self.bosses_dict["NumOfTilesForChecking"], self.bosses_dict["NumOfTilesForChecking"] + 1)
+                                                                for column_change in range(-self.bosses_dict["NumOfTilesForChecking"], self.bosses_dict["NumOfTilesForChecking"] + 1)
+                                                                if row_change != 0 or column_change != 0
+                                                                ]
 
-            # For each empty tile inside the empty tiles dictionary
-            for empty_tile in self.empty_tiles_dict.keys():
-                
-                # If the length of the tiles list is already has enough empty tiles to prove that it is a valid spawning location
-                if len(self.bosses_dict["SpawningPositionTilesList"]) == (((self.bosses_dict["NumOfTilesForChecking"] * 2) + 1) ** 2) - 1:
-                    # Exit the loop
-                    break
-                
-                # Otherwise
-                else:
-                    # If the empty tile is not the same as the random empty tile and the tile is a certain distance from the selected random empty tile
-                    if empty_tile != self.bosses_dict["RandomSpawningPosition"] and \
-                        self.bosses_dict["RandomSpawningPosition"].rect.x  - (self.bosses_dict["NumOfTilesForChecking"] * TILE_SIZE) <= empty_tile.rect.x <= self.bosses_dict["RandomSpawningPosition"].rect.x + (self.bosses_dict["NumOfTilesForChecking"] * TILE_SIZE) and \
-                                self.bosses_dict["RandomSpawningPosition"].rect.y - (self.bosses_dict["NumOfTilesForChecking"] * TILE_SIZE) <= empty_tile.rect.y <= self.bosses_dict["RandomSpawningPosition"].rect.y + (self.bosses_dict["NumOfTilesForChecking"] * TILE_SIZE):
-
-                                # Add the empty tile to the spawning position tiles list
-                                self.bosses_dict["SpawningPositionTilesList"].append(empty_tile)
-            
-            # If there is "enough space" for the boss to spawn 
-            if len(self.bosses_dict["SpawningPositionTilesList"]) == (((self.bosses_dict["NumOfTilesForChecking"] * 2) + 1) ** 2) - 1:
-                # Set the valid spawning position to be the random spawning position
-                self.bosses_dict["ValidSpawningPosition"] = self.bosses_dict["RandomSpawningPosition"]
                 # Set the boss spawn timer to start
                 self.bosses_dict["TimeToSpawnTimer"] = self.bosses_dict["TimeToSpawn"]
                 # Set the boss spawn effect timer to start
                 self.bosses_dict["SpawningEffectTimer"] = self.bosses_dict["SpawningEffectTimeBetweenEachChange"]
-
-            # If there is not "enough space" for the boss to spawn 
-            elif len(self.bosses_dict["SpawningPositionTilesList"]) < (((self.bosses_dict["NumOfTilesForChecking"] * 2) + 1) ** 2) - 1:
-                # Generate another random spawning position
-                self.bosses_dict["RandomSpawningPosition"] =  random_choice(list(self.empty_tiles_dict.keys()))
-                # Empty the spawning position tiles list
-                self.bosses_dict["SpawningPositionTilesList"] = []
  
     def draw_spawning_effect_and_call_spawn_boss(self, delta_time):
 
@@ -2259,7 +2052,6 @@ class Game:
 
                 # Set the valid spawning position back to None (that way when the game restarts or the player goes to the next boss, the boss can be spawned)
                 self.bosses_dict["ValidSpawningPosition"] = None
-                self.bosses_dict["RandomSpawningPosition"] = random_choice(list(self.empty_tiles_dict.keys()))
 
     def spawn_boss(self, boss_to_spawn):
 
@@ -2277,35 +2069,35 @@ class Game:
                     # Create a class attribute for the SikaDeerBoss, which is an image dictionary holding all the images for each action that the boss has
                     SikaDeerBoss.ImagesDict = {
 
-                        "Chase": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Chase/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Chase")))),
-                        "Stomp": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Stomp/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Stomp")))),
+                        "Chase": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Chase"),
+                        "Stomp": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Stomp"),
 
                         "Target": { 
-                                "Up": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/Up/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/Up")))),
-                                "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Target/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/UpRight")))),
-                                "Up Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/UpRight/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/UpRight")))),
+                                "Up": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Target/Up"),
+                                "Up Left": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Target/UpRight", flip_x = True),
+                                "Up Right": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Target/UpRight"),
 
-                                "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Target/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/Right")))),
-                                "Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/Right/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/Right")))),
+                                "Left": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Target/Right", flip_x = True),
+                                "Right": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Target/Right"),
 
-                                "Down": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/Down/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/Down")))),
-                                "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Target/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/DownRight")))),
-                                "Down Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Target/DownRight/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Target/DownRight")))),
+                                "Down": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Target/Down"),
+                                "Down Left": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Target/DownRight", flip_x = True),
+                                "Down Right": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Target/DownRight"),
                                 },
                         "Charge": {
-                                "Up": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/Up/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/Up")))),
-                                "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/UpRight")))),
-                                "Up Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/UpRight/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/UpRight")))),
+                                "Up": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Charge/Up"),
+                                "Up Left": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Charge/UpRight", flip_x = True),
+                                "Up Right": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Charge/UpRight"),
 
-                                "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/Right")))),
-                                "Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/Right/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/Right")))),
+                                "Left": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Charge/Right", flip_x = True),
+                                "Right": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Charge/Right"),
 
-                                "Down": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/Down/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/Down")))),
-                                "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/DownRight")))),
-                                "Down Right": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Charge/DownRight/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Charge/DownRight")))),
+                                "Down": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Charge/Down"),
+                                "Down Left": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Charge/DownRight", flip_x = True),
+                                "Down Right": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Charge/DownRight"),
                                     
                                     },
-                        "Stunned": tuple(pygame_image_load(f"graphics/Bosses/SikaDeer/Stunned/{i}.png").convert_alpha() for i in range(0, len(os_listdir("graphics/Bosses/SikaDeer/Stunned")))),
+                        "Stunned": asset_manager.get_animation(folder = "graphics/Bosses/SikaDeer/Stunned"),
 
 
                                             }
@@ -2326,6 +2118,9 @@ class Game:
                 self.stomp_attack_nodes_group = pygame_sprite_Group()
                 StompController.nodes_group = self.stomp_attack_nodes_group
 
+                # Add the stomp attack nodes to the collision world
+                self.collision_world.add_layer(layer = "StompNodes", find_entities = lambda: self.stomp_attack_nodes_group, shape = "Circle")
+
                 # Add the boss into the boss group
                 self.boss_group.add(sika_deer_boss)
 
@@ -2335,6 +2130,10 @@ class Game:
                 # Set the current boss' last tile position to be the last tile position found (for collisions)
                 self.boss_group.sprite.last_tile_position = self.last_tile_position
 
+                # Give the current boss the tile grid (for sweeping the boss through the tile grid when moving) and the flow field (for chasing the player around tiles)
+                self.boss_group.sprite.tile_grid = self.tile_grid
+                self.boss_group.sprite.flow_field = self.flow_field
+
             case "GoldenMonkey":
                 # Import the GoldenMonkey boss
                 from Level.Bosses.GoldenMonkeyBoss import GoldenMonkeyBoss
@@ -2346,31 +2145,27 @@ class Game:
                     GoldenMonkeyBoss.ImagesDict = {
 
                         "Chase": {
-                                "Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/Right/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Right")))),
-                                "Right": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/Right/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Right")))),
-                                "Up": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/Up/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Up")))),
-                                "Up Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/UpRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/UpRight")))),
-                                "Up Right": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/UpRight/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/UpRight")))),
-                                "Down": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/Down/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Down")))),
-                                "Down Left": tuple(pygame_transform_flip(surface = pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/DownRight/{i}.png").convert_alpha(), flip_x = True, flip_y = False) for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/DownRight")))),
-                                "Down Right": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Chase/DownRight/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Chase/Downright")))),
+                                "Left": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Chase/Right", flip_x = True),
+                                "Right": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Chase/Right"),
+                                "Up": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Chase/Up"),
+                                "Up Left": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Chase/UpRight", flip_x = True),
+                                "Up Right": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Chase/UpRight"),
+                                "Down": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Chase/Down"),
+                                "Down Left": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Chase/DownRight", flip_x = True),
+                                "Down Right": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Chase/DownRight"),
                                 },
 
-                        "SpiralAttack": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/SpiralAttack/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/SpiralAttack")))),
-                        "Sleep": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/Sleep/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/Sleep")))),
+                        "SpiralAttack": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/SpiralAttack"),
+                        "Sleep": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/Sleep"),
 
                         "DiveBomb": {
-                                    "Launch": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/DiveBomb/Launch/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/DiveBomb/Launch")))),
-                                    "Land": tuple(pygame_image_load(f"graphics/Bosses/GoldenMonkey/DiveBomb/Land/{i}.png").convert_alpha() for i in range(len(os_listdir("graphics/Bosses/GoldenMonkey/DiveBomb/Land"))))
+                                    "Launch": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/DiveBomb/Launch"),
+                                    "Land": asset_manager.get_animation(folder = "graphics/Bosses/GoldenMonkey/DiveBomb/Land")
                                     }
                                                 }
-                # Find the boss map boundaries, so that for the divebomb mechanic, they aren't spawned inside of a tile
+                # Find the size of the tile map
+                # Note: The divebomb landing position is found with the clearance map, so that the boss isn't spawned inside of a tile
                 GoldenMonkeyBoss.boss_map_boundaries = {
-                    "Top": 3 * TILE_SIZE, 
-                    "Left": TILE_SIZE, 
-                    "Right": (len(self.tile_map[0]) - 1) * TILE_SIZE, 
-                    "Bottom": (len(self.tile_map) - 1) * TILE_SIZE,
-
                     # Used for the second phase circles
                     "EntireTileMapSize": (len(self.tile_map[0]) * TILE_SIZE, len(self.tile_map) * TILE_SIZE)
                     
@@ -2386,10 +2181,20 @@ class Game:
                 # ----------------------------------------
                 # Preparing groups 
 
-                # Create a dict for the chilli projectiles created by the Golden Monkey boss
-                from Level.Bosses.BossAttacks.chilli_attacks import ChilliProjectileController
-                self.chilli_projectiles_dict = {}
-                ChilliProjectileController.projectiles_dict = self.chilli_projectiles_dict
+                # Create a projectile manager for the chilli projectiles created by the Golden Monkey boss
+                from Level.Bosses.BossAttacks.chilli_attacks import ChilliProjectileController, ChilliProjectile
+                # Note: Chilli projectiles are removed if they leave the tile map or have existed for longer than 5 seconds (a projectile crosses the entire tile map in under 4 seconds)
+                self.chilli_projectiles_manager = ProjectileManager(maximum_lifetime = 5, object_pool = ChilliProjectile.pool)
+                self.chilli_projectiles_manager.map_size = self.last_tile_position
+                self.chilli_projectiles_manager.tile_grid = self.tile_grid
+                ChilliProjectileController.projectiles_manager = self.chilli_projectiles_manager
+
+                # Add the chilli projectiles and the dive bomb attack circle to the collision world
+                self.collision_world.add_layer(layer = "ChilliProjectiles", find_entities = lambda: self.chilli_projectiles_manager)
+                self.collision_world.add_layer(layer = "DiveBomb", find_entities = lambda: [self.boss_group.sprite.dive_bomb_attack_controller], shape = "Circle")
+
+                # Give the boss the clearance map (for finding where the boss fits when landing from a divebomb)
+                golden_monkey_boss.clearance_map = self.clearance_map
 
                 # Add the boss into the boss group
                 self.boss_group.add(golden_monkey_boss)
@@ -2400,6 +2205,10 @@ class Game:
                 # Set the current boss' last tile position to be the last tile position found (for collisions)
                 self.boss_group.sprite.last_tile_position = self.last_tile_position
 
+                # Give the current boss the tile grid (for sweeping the boss through the tile grid when moving) and the flow field (for chasing the player around tiles)
+                self.boss_group.sprite.tile_grid = self.tile_grid
+                self.boss_group.sprite.flow_field = self.flow_field
+
 
 
         # Remove the boss from the remaining bosses list 
@@ -2434,6 +2243,9 @@ class Game:
             # Update the current boss with the current position of the player (Used for finding the angle between the boss and the player)
             self.boss_group.sprite.players_position = self.player.rect.center
 
+            # Update the target of the flow field with the current position of the player (the flow field is only recomputed if the player is inside a different cell)
+            self.flow_field.set_target(position = self.player.rect.center)
+
             # Update the player with the rect information of the current boss (Used for limiting building placement if the player is building on top of the boss)
             self.player.boss_rect = self.boss_group.sprite.rect
 
@@ -2502,18 +2314,10 @@ class Game:
                     # Reset the current sin angle for the blinking visual effect back to 0
                     self.boss_group.sprite.behaviour_patterns_dict["Target"]["BlinkingVisualEffectCurrentSinAngle"]
 
-                # Calculate a new length and point depending on where the angle at which the boss is charging at 
-                # Note: (Extends the line from the current position of the boss and last locked in position of the player)
-                new_length = dist(self.boss_group.sprite.behaviour_patterns_dict["Charge"]["PlayerPosAtChargeTime"], self.boss_group.sprite.rect.center) + screen_width / 2
-                new_point = (
-                    self.boss_group.sprite.rect.centerx + (new_length * cos(self.boss_group.sprite.behaviour_patterns_dict["Charge"]["ChargeAngle"])), 
-                    self.boss_group.sprite.rect.centery - (new_length * sin(self.boss_group.sprite.behaviour_patterns_dict["Charge"]["ChargeAngle"]))
-                    )
-
-                # Draw red dashed guidelines between the player and the boss
+                # Draw red dashed guidelines between the boss and the first world tile along the charge line (i.e. where the charge will stop)
                 self.game_ui.draw_guidelines_between_a_and_b(
                                                             a = self.boss_group.sprite.rect.center, 
-                                                            b = new_point, 
+                                                            b = self.boss_group.sprite.behaviour_patterns_dict["Charge"]["ChargeWallPosition"], 
                                                             colour = "red",
                                                             camera_position = self.camera_position, 
                                                             guidelines_segments_thickness = self.guidelines_segments_thickness,
@@ -2745,8 +2549,6 @@ class Game:
             self.bosses_dict["SpawningEffectCounter"] = self.bosses_dict["OriginalSpawningEffectCounter"]
             self.bosses_dict["SpawningPositionTilesList"] = []
             self.bosses_dict["ValidSpawningPosition"] = None
-            # Generate a new spawning position (even if it is valid, the boss should spawn in a different location)
-            self.bosses_dict["RandomSpawningPosition"] = random_choice(list(self.empty_tiles_dict.keys()))
 
             # Resetting boss list and current boss
             self.bosses_dict["RemainingBossesList"] = ["SikaDeer", "GoldenMonkey"]
@@ -2831,7 +2633,7 @@ class Game:
         # ------------------------------------------------------
         # Building tiles
 
-        # Find building tiles and remove them from the world tiles dict and the world tiles group
+        # Find building tiles and replace them with their empty tiles inside the tile grid
         # Note: Once removed, all empty tiles will be re-added
 
         # If there are any existing building tiles
@@ -2841,17 +2643,11 @@ class Game:
             for building_tile_to_remove in self.player.tools["BuildingTool"]["ExistingBuildingTilesList"]:
 
                 # Replace the building tile with an empty tile
-                self.empty_tiles_dict[self.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove]] = 0
+                self.tile_grid.set_tile(tile = self.player.sprite_groups["ReplacedEmptyTiles"][building_tile_to_remove], tile_type = "Empty")
 
                 # Remove the building tile from the replaced empty tiles dict
                 self.player.sprite_groups["ReplacedEmptyTiles"].pop(building_tile_to_remove)
 
-                # Remove the building tile from the world tiles group
-                self.world_tiles_group.remove(building_tile_to_remove)
-
-                # Remove the building tile from the world tiles list
-                self.world_tiles_dict.pop(building_tile_to_remove)
-
             # Empty the player's existing building tiles list
             self.player.tools["BuildingTool"]["ExistingBuildingTilesList"] = []
 
@@ -2871,27 +2667,36 @@ class Game:
             # For all bamboo piles
             for bamboo_pile in self.bamboo_piles_group:
                 # Replace the bamboo pile with an empty tile
-                self.empty_tiles_dict[self.replaced_empty_tiles_dict[bamboo_pile]] = 0
+                self.tile_grid.set_tile(tile = self.replaced_empty_tiles_dict[bamboo_pile], tile_type = "Empty")
 
-                # Remove the bamboo pile from the bamboo piles group
+                # Remove the bamboo pile from the bamboo piles group and release it back to the object pool
                 self.bamboo_piles_group.remove(bamboo_pile)
+                BambooPile.pool.release(bamboo_pile)
 
         # ------------------------------------------------------
         # Groups
-        self.bamboo_projectiles_group.empty()
+        self.bamboo_projectiles_manager.empty()
         self.boss_group.empty()
 
         # If there is a group for the stomp attack nodes
         if hasattr(self, "stomp_attack_nodes_group") and len(self.stomp_attack_nodes_group) > 0:
-            # Empty the group
+            # Release all of the stomp attack nodes back to the object pool and empty the group
+            for stomp_attack_node in self.stomp_attack_nodes_group:
+                stomp_attack_node.pool.release(stomp_attack_node)
             self.stomp_attack_nodes_group.empty()
 
-        # If there is a group for the chilli projectiles
-        if hasattr(self, "chilli_projectiles_dict") and len(self.chilli_projectiles_dict) > 0:
-            # Empty the dict
-            self.chilli_projectiles_dict = {}
+        # If there is a manager for the chilli projectiles
+        if hasattr(self, "chilli_projectiles_manager") and len(self.chilli_projectiles_manager) > 0:
+            # Remove all of the chilli projectiles
+            self.chilli_projectiles_manager.empty()
 
     def run(self, delta_time):
+
+        # Start counting the number of masks built during this frame
+        reset_mask_registry_frame_count()
+
+        # Allow the objects released back to the object pools during the last frame to be re-used
+        recycle_released_pool_instances()
         
         # -----------------------------------------------------------
         # Sound
@@ -3,15 +3,14 @@ from pygame import Surface as pygame_Surface
 from pygame.font import Font as pygame_font_Font
 from pygame.draw import rect as pygame_draw_rect
 from pygame.draw import line as pygame_draw_line
-from pygame.image import load as load_image
 from Level.display_card import DisplayCard
 from Global.settings import TILE_SIZE, BAR_ALPHA_LEVEL
-from Global.functions import draw_text, sin_change_object_colour, move_item_vertically_sin
+from Global.functions import draw_text, draw_atlas_text, sin_change_object_colour, move_item_vertically_sin
+from Global.asset_manager import asset_manager
 from pygame import Surface as pygame_Surface
 from Level.effect_text import EffectText
 from random import randrange as random_randrange
 from math import degrees
-from pygame.image import load as pygame_image_load
 
 
 class GameUI:
@@ -104,7 +103,7 @@ class GameUI:
 
         # A dictionary containing the images for the player stats
         self.stats_images_dict = {
-                        "BambooResource": load_image("graphics/Misc/BambooResource.png").convert_alpha(),
+                        "BambooResource": asset_manager.get_image(path = "graphics/Misc/BambooResource.png"),
                         "BuildingTiles": self.player_tools["BuildingTool"]["Images"]["TileImage"]
                                  }
 
@@ -183,7 +182,7 @@ class GameUI:
 
         # ------------------------------------------------------------
         # Cursor image
-        self.default_cursor_image = load_image("graphics/Cursors/Default.png").convert_alpha()
+        self.default_cursor_image = asset_manager.get_image(path = "graphics/Cursors/Default.png")
     
         """ 'Hidden' attributes:
 
@@ -278,6 +277,10 @@ class GameUI:
 
         # If there are any effect text in the list
         if len(EffectText.effect_text_list) > 0:
+            # Release all of the effect text back to the object pool
+            for effect_text in EffectText.effect_text_list:
+                EffectText.pool.release(effect_text)
+
             # Clear the list
             EffectText.effect_text_list = []
 
@@ -286,10 +289,9 @@ class GameUI:
         # Resets visual effects dictionaries
         
         # If there are any angled polygons effects
-        if hasattr(self, "angled_polygons_controller") and len(self.angled_polygons_controller.polygons_dict) > 0:
-            # Empty the dictionary and reset the amount of polygons created
-            self.angled_polygons_controller.polygons_dict = {}
-            self.angled_polygons_controller.polygons_created = 0
+        if hasattr(self, "angled_polygons_controller") and self.angled_polygons_controller.number_of_polygons > 0:
+            # Remove all of the polygons
+            self.angled_polygons_controller.reset_polygons()
     
     # ---------------------------------------------------------------------
     # Display methods
@@ -463,7 +465,7 @@ class GameUI:
             boss_health_text_font_size = self.dimensions["boss_bar"]["text_font"].size(boss_health_text)
             
             # Draw the text displaying the amount of bamboo resource
-            draw_text(
+            draw_atlas_text(
                     text = boss_health_text, 
                     text_colour = "white",
                     font = self.dimensions["boss_bar"]["text_font"],
@@ -482,7 +484,7 @@ class GameUI:
             if self.dimensions.get("golden_monkey_energy_indicator") == None:
                 # Load the image and text font and calculate the x and y positions that the image will be blitted at
                 self.dimensions["golden_monkey_energy_indicator"] = {
-                                                                    "Image": pygame_image_load("graphics/Misc/Energy.png").convert_alpha(),
+                                                                    "Image": asset_manager.get_image(path = "graphics/Misc/Energy.png"),
                                                                     "x": self.dimensions["boss_bar"]["x"] + self.dimensions["boss_bar"]["width"],
                                                                     "y": self.dimensions["boss_bar"]["y"] + (self.dimensions["boss_bar"]["height"] / 2),
                                                                     "Font": self.dimensions["boss_bar"]["text_font"],
@@ -517,7 +519,7 @@ class GameUI:
             #pygame_draw_line(self.surface, "green", (0, (self.dimensions["golden_monkey_energy_indicator"]["y"])),(self.surface.get_width(), (self.dimensions["golden_monkey_energy_indicator"]["y"])))
 
             # Draw the text displaying the amount of energy the golden monkey boss has
-            draw_text(
+            draw_atlas_text(
                     text = energy_text, 
                     text_colour = "white",
                     font = self.dimensions["golden_monkey_energy_indicator"]["Font"],
@@ -693,7 +695,7 @@ class GameUI:
         frenzy_mode_value_text_font_size = self.dimensions["player_stats"]["frenzy_mode_value_text_font"].size(frenzy_mode_value_text)
         
         # Draw the text displaying the amount of bamboo resource
-        draw_text(
+        draw_atlas_text(
                 text = frenzy_mode_value_text, 
                 text_colour = "white",
                 font = self.dimensions["player_stats"]["frenzy_mode_value_text_font"],
@@ -863,8 +865,8 @@ class GameUI:
             # Create a dictionary containing info for the introduction box
             self.introduction_box_dict = {
                                                     "Images": (
-                                                                    pygame_image_load("graphics/Misc/IntroText1.png").convert_alpha(),
-                                                                    pygame_image_load("graphics/Misc/IntroText2.png").convert_alpha()
+                                                                    asset_manager.get_image(path = "graphics/Misc/IntroText1.png"),
+                                                                    asset_manager.get_image(path = "graphics/Misc/IntroText2.png")
                                                                     ),
                                                     "IntroductionCompleted": False,
                                                     "IntroductionBoxSize": (700, 800),
@@ -968,7 +970,7 @@ class GameUI:
                     self.guide_text_dict["DisplayTime"] -= delta_time
 
                 # Draw the text onto the surface
-                draw_text(
+                draw_atlas_text(
                         text = self.guide_text_list[0], 
                         text_colour = "white", 
                         font = self.guide_text_dict["Font"],
@@ -1100,21 +1102,15 @@ class GameUI:
                 # Positioned from the bottom of the bar with a random y offset
                 text_position_y = ((self.dimensions["player_stats"]["frenzy_mode_bar_y"] + self.dimensions["player_stats"]["frenzy_mode_bar_height"]) - (font_size[1])) - random_y_offset
 
-        # Alpha surface
-        new_alpha_surface = pygame_Surface(font_size)
-        new_alpha_surface.set_colorkey("black")
-        new_alpha_surface.set_alpha(self.effect_text_info_dict[type_of_effect_text]["DefaultAlphaLevel"])
-
-
-        # Create the effect text (Automatically added to the effect text group)
-        EffectText(
+        # Create the effect text, re-using a previous effect text if possible (Automatically added to the effect text group)
+        EffectText.pool.acquire(
                     x = text_position_x,
                     y = text_position_y,
                     colour = self.effect_text_info_dict[type_of_effect_text]["Colour"],
                     display_time = self.effect_text_info_dict[type_of_effect_text]["DisplayTime"], 
                     text = text,
                     font = font_selected,
-                    alpha_surface = new_alpha_surface,
+                    alpha_surface_size = font_size,
                     alpha_level = self.effect_text_info_dict[type_of_effect_text]["DefaultAlphaLevel"],
                     type_of_effect_text = type_of_effect_text
                     )
@@ -1131,26 +1127,15 @@ class GameUI:
 
                 # If their display time is less than 0 or equal to 0
                 if effect_text.display_time <= 0:
-                    # Remove it from the effect text list
+                    # Remove it from the effect text list and release it back to the object pool
                     EffectText.effect_text_list.pop(index)
+                    EffectText.pool.release(effect_text)
 
                 # If their display time is greater than 0
                 if effect_text.display_time > 0:
                     
-                    # Fill the effect text's alpha surface with black
-                    effect_text.alpha_surface.fill("black")
-
-                    # Draw the text
-                    draw_text(
-                        text = effect_text.text,
-                        text_colour = effect_text.colour,
-                        font = effect_text.font,
-                        x = 0,
-                        y = 0,
-                        surface = effect_text.alpha_surface,
-                        )
-
                     # Draw the alpha surface onto the main surface
+                    # Note: The text was drawn onto the alpha surface when the effect text was created, as the text never changes
                     self.surface.blit(effect_text.alpha_surface, (effect_text.x, effect_text.y))
                     
                     # Decrease the y-pos of the effect text over time
@@ -1362,7 +1347,7 @@ class GameUI:
         self.angled_polygons_surface.fill("black")
 
         # If there are any angled polygons to draw
-        if hasattr(self, "angled_polygons_controller") and len(self.angled_polygons_controller.polygons_dict) > 0:
+        if hasattr(self, "angled_polygons_controller") and self.angled_polygons_controller.number_of_polygons > 0:
             # Draw the angled polygons
             self.angled_polygons_controller.draw(delta_time = delta_time, camera_position = camera_position)
 
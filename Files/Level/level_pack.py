@@ -0,0 +1,130 @@
+from struct import Struct
+from mmap import mmap, ACCESS_READ
+
+""" Level pack format:
+- The level pack is a compiled version of the level tile maps text file, so that a level can be loaded without parsing the text file one character at a time
+- Header: Magic bytes (b"PWLP"), version number, number of levels
+- Index: For each level, the offset of its tile array from the start of the file, its number of rows and its number of columns
+- Tile arrays: For each level, one unsigned byte for each tile number (in row-major order)
+
+All numbers are little-endian.
+"""
+
+# The paths of the level tile maps text file (the source) and the level pack compiled from it (relative to the folder that the game is run from)
+LEVEL_TILE_MAPS_PATH = "Files/Level/level_tile_maps.txt"
+LEVEL_PACK_PATH = "Files/Level/level_tile_maps.lvlpack"
+
+# The magic bytes and version number at the start of every level pack
+LEVEL_PACK_MAGIC = b"PWLP"
+LEVEL_PACK_VERSION = 1
+
+# The layouts of the header and of each entry in the index
+level_pack_header = Struct("<4sHH")
+level_pack_index_entry = Struct("<IHH")
+
+def parse_tile_map_text(tile_map_text):
+
+    # Converts a tile map from the level tile maps text file into a list of rows of tile numbers
+    """ Notes:
+    - Each tile map is saved on its own line, starting with a "?" separator
+    - Each tile number is followed by an "!" separator, and each row of tiles is followed by a "," separator
+    - This is only used when compiling the level pack (and for checking the level pack against the text file)
+    """
+
+    # [1:] to get rid of the "?" separator, rstrip to get rid of the "\n" line break
+    tile_map_to_convert = tile_map_text[1:].rstrip("\n")
+
+    non_transformed_tile_map = [] # Holds the tile map of the tile's numbers
+    tile_number = "" # Used as some tiles may have double digit tile numbers
+    row_of_tiles_list = [] # Used to hold all the tiles in one row
+
+    # For all characters in the tile map
+    for character in tile_map_to_convert:
+
+        # Identify what the character is
+        match character:
+
+            # Comma separator
+            case ",":
+                # Add the row of tiles to the final tile map, and empty the row of tiles list
+                non_transformed_tile_map.append(row_of_tiles_list)
+                row_of_tiles_list = []
+
+            # Exclamation mark separator
+            case "!":
+                # Add the tile number to the row of tiles, and reset the tile number
+                row_of_tiles_list.append(int(tile_number))
+                tile_number = ""
+
+            # If it is neither a comma separator or an exclamation mark separator
+            case _:
+                tile_number += character
+
+    return non_transformed_tile_map
+
+def compile_level_pack(level_tile_maps_path = LEVEL_TILE_MAPS_PATH, level_pack_path = LEVEL_PACK_PATH):
+
+    # Compiles the level tile maps text file into a level pack, returning the number of levels compiled
+
+    # Parse every tile map inside the text file
+    with open(level_tile_maps_path, "r") as level_tile_maps_file:
+        tile_maps_list = [parse_tile_map_text(tile_map_text = tile_map_text) for tile_map_text in level_tile_maps_file.readlines() if tile_map_text.startswith("?")]
+
+    # The tile arrays start after the header and the index
+    offset = level_pack_header.size + (level_pack_index_entry.size * len(tile_maps_list))
+    index_entries = []
+    tile_arrays = []
+
+    for level_number, tile_map in enumerate(tile_maps_list, start = 1):
+
+        # All rows must be the same width, and the tile numbers must fit inside one byte
+        if any(len(row) != len(tile_map[0]) for row in tile_map):
+            raise ValueError(f"Level {level_number} has rows of different widths")
+        if any(not (0 <= tile_number <= 255) for row in tile_map for tile_number in row):
+            raise ValueError(f"Level {level_number} has a tile number that does not fit inside the level pack")
+
+        index_entries.append(level_pack_index_entry.pack(offset, len(tile_map), len(tile_map[0])))
+        tile_arrays.append(bytes(tile_number for row in tile_map for tile_number in row))
+        offset += len(tile_arrays[-1])
+
+    # Write the header, the index and then the tile arrays
+    with open(level_pack_path, "wb") as level_pack_file:
+        level_pack_file.write(level_pack_header.pack(LEVEL_PACK_MAGIC, LEVEL_PACK_VERSION, len(tile_maps_list)))
+        level_pack_file.write(b"".join(index_entries))
+        level_pack_file.write(b"".join(tile_arrays))
+
+    return len(tile_maps_list)
+
+def load_tile_map(level_number, level_pack_path = LEVEL_PACK_PATH):
+
+    # Loads the tile map of the level (starting from level 1) from the level pack, returning a list of rows of tile numbers
+    # Note: The level pack is memory-mapped, so only the header, the level's index entry and the level's tile array are read
+
+    with open(level_pack_path, "rb") as level_pack_file, mmap(level_pack_file.fileno(), 0, access = ACCESS_READ) as level_pack:
+
+        # Check the header
+        magic, version, number_of_levels = level_pack_header.unpack_from(level_pack, 0)
+        if magic != LEVEL_PACK_MAGIC or version != LEVEL_PACK_VERSION:
+            raise ValueError(f"{level_pack_path} is not a version {LEVEL_PACK_VERSION} level pack")
+        if not (1 <= level_number <= number_of_levels):
+            raise ValueError(f"Level {level_number} is not inside {level_pack_path} (which has {number_of_levels} levels)")
+
+        # Find the tile array of the level
+        offset, number_of_rows, number_of_columns = level_pack_index_entry.unpack_from(level_pack, level_pack_header.size + (level_pack_index_entry.size * (level_number - 1)))
+
+        # Slice each row out of the tile array (list() of a bytes slice gives the tile numbers)
+        return [list(level_pack[offset + (row * number_of_columns):offset + ((row + 1) * number_of_columns)]) for row in range(0, number_of_rows)]
+
+if __name__ == "__main__":
+
+    # Compiles the level pack and checks that every level loads back the same as the text file (run from the folder that the game is run from)
+    number_of_levels = compile_level_pack()
+
+    with open(LEVEL_TILE_MAPS_PATH, "r") as level_tile_maps_file:
+        tile_maps_list = [parse_tile_map_text(tile_map_text = tile_map_text) for tile_map_text in level_tile_maps_file.readlines() if tile_map_text.startswith("?")]
+
+    for level_number in range(1, number_of_levels + 1):
+        if load_tile_map(level_number = level_number) != tile_maps_list[level_number - 1]:
+            raise SystemExit(f"Level {level_number} does not match {LEVEL_TILE_MAPS_PATH}")
+
+    print(f"Compiled {number_of_levels} level(s) into {LEVEL_PACK_PATH}")
@@ -0,0 +1,277 @@
+from numpy import zeros as numpy_zeros
+from numpy import rint as numpy_rint
+from numpy import flatnonzero as numpy_flatnonzero
+from numpy import argsort as numpy_argsort
+from numpy import concatenate as numpy_concatenate
+from numpy import hypot as numpy_hypot
+from math import atan2
+from Global.settings import TILE_SIZE
+
+class ProjectileManager:
+
+    # Holds a type of projectile (e.g. bamboo projectiles, chilli projectiles), moving and drawing all of them at once
+    """ Notes:
+    - This is used in the same way as a sprite group (add, remove, empty, len, iterating over it)
+    - Collisions with other objects are found by the collision world, which iterates over the manager like any other layer's container
+    - The projectiles themselves keep their gameplay attributes (e.g. damage amount, lives), only their positions and velocities are stored inside the arrays
+    - Projectiles are removed automatically once they have existed for longer than the maximum lifetime, or once they have left the tile map (if the size of the tile map has been set)
+    - If an object pool is passed in, removed projectiles are released back to the pool so that they can be re-used
+    - If the tile grid has been set, projectiles that travel far enough in a frame to pass over a tile are ray cast along their path, and stopped just inside the first world / building tile they would have passed through (so that the tile collision is still found)
+    """
+
+    def __init__(self, maximum_lifetime = None, object_pool = None):
+
+        # The time in seconds that a projectile can exist for before it is removed (None for no limit)
+        self.maximum_lifetime = maximum_lifetime
+
+        # The object pool that removed projectiles are released back to (None if the projectiles are not pooled)
+        self.object_pool = object_pool
+
+        # The (width, height) of the tile map in pixels, projectiles that are completely outside of the tile map are removed (None if the projectiles should not be removed when leaving the tile map)
+        # Note: This is set by "Game" once the tile map has been created
+        self.map_size = None
+
+        # The tile grid used to ray cast the paths of fast projectiles (None if the paths should not be ray cast)
+        # Note: This is set by "Game" once the tile map has been created
+        self.tile_grid = None
+
+        # Dictionary containing the number of projectiles that existed / were removed when updating, and the number of projectiles drawn, during the last frame
+        self.frame_statistics_dict = {"Live": 0, "Culled": 0, "Drawn": 0, "TotalCulled": 0}
+
+        # The number of projectiles that can be stored before the arrays need to be made larger
+        self.capacity = 64
+
+        # Arrays holding the information of every projectile (each projectile is stored in the same slot of every array)
+        """
+        - positions = The (x, y) position of the top-left of the projectile's rect, saved as floating point values (for more accurate shooting)
+        - velocities = The change in the x and y position of the projectile each second
+        - rect_positions = The (x, y) position of the top-left of the projectile's rect (the rounded positions)
+        - rect_sizes = The (width, height) of the projectile's rect
+        - ages = The time in seconds since the projectile was added
+        - creation_numbers = The number of projectiles added before the projectile (so that the projectiles are always checked / drawn in the order they were added, even when slots are re-used)
+        - alive = Whether the slot currently holds a projectile
+        """
+        self.positions = numpy_zeros((self.capacity, 2))
+        self.velocities = numpy_zeros((self.capacity, 2))
+        self.rect_positions = numpy_zeros((self.capacity, 2), dtype = int)
+        self.rect_sizes = numpy_zeros((self.capacity, 2), dtype = int)
+        self.ages = numpy_zeros(self.capacity)
+        self.creation_numbers = numpy_zeros(self.capacity, dtype = int)
+        self.alive = numpy_zeros(self.capacity, dtype = bool)
+
+        # List holding the projectile inside of each slot
+        self.slot_projectiles_list = [None] * self.capacity
+
+        # List of the slots that do not hold a projectile (the last slot in the list is used first)
+        self.free_slots_list = list(range(self.capacity - 1, -1, -1))
+
+        # Dictionary containing the slot of each projectile, in the order they were added
+        self.projectiles_dict = {}
+
+        # Number of projectiles added, used as the creation number of each projectile added
+        self.projectiles_added = 0
+
+    def __len__(self):
+        return len(self.projectiles_dict)
+
+    def __iter__(self):
+        # Note: A copy of the projectiles is iterated over, so that projectiles can be removed whilst iterating (the same as a sprite group)
+        return iter(list(self.projectiles_dict.keys()))
+
+    def __contains__(self, projectile):
+        return projectile in self.projectiles_dict
+
+    def add(self, projectile):
+
+        # Adds a projectile, storing the position of its rect and its velocity inside a free slot
+        # Note: The projectile must have a "horizontal_gradient" and "vertical_gradient" (the vertical gradient is positive when moving up the screen)
+
+        # If every slot is in use, make the arrays larger
+        if len(self.free_slots_list) == 0:
+            self.increase_capacity()
+
+        # Take a free slot for the projectile
+        slot = self.free_slots_list.pop()
+
+        self.positions[slot] = projectile.rect.topleft
+        self.velocities[slot] = (projectile.horizontal_gradient, -projectile.vertical_gradient)
+        self.rect_positions[slot] = projectile.rect.topleft
+        self.rect_sizes[slot] = projectile.rect.size
+        self.ages[slot] = 0
+        self.creation_numbers[slot] = self.projectiles_added
+        self.alive[slot] = True
+        self.slot_projectiles_list[slot] = projectile
+        self.projectiles_dict[projectile] = slot
+
+        self.projectiles_added += 1
+
+    def remove(self, projectile):
+
+        # Removes a projectile (if it has not already been removed), freeing its slot
+
+        if projectile in self.projectiles_dict:
+            slot = self.projectiles_dict.pop(projectile)
+            self.alive[slot] = False
+            self.velocities[slot] = (0, 0)
+            self.slot_projectiles_list[slot] = None
+            self.free_slots_list.append(slot)
+
+            # Release the projectile back to the object pool
+            if self.object_pool != None:
+                self.object_pool.release(projectile)
+
+    def empty(self):
+
+        # Removes all of the projectiles
+
+        # Release all of the projectiles back to the object pool
+        if self.object_pool != None:
+            for projectile in self.projectiles_dict:
+                self.object_pool.release(projectile)
+
+        self.alive[:] = False
+        self.velocities[:] = 0
+        self.slot_projectiles_list = [None] * self.capacity
+        self.free_slots_list = list(range(self.capacity - 1, -1, -1))
+        self.projectiles_dict = {}
+        self.projectiles_added = 0
+
+    def increase_capacity(self):
+
+        # Doubles the number of slots inside of the arrays, keeping the existing projectiles in the same slots
+
+        # The new slots start after the existing slots
+        new_slots = range(self.capacity, self.capacity * 2)
+
+        self.positions = numpy_concatenate((self.positions, numpy_zeros((self.capacity, 2))))
+        self.velocities = numpy_concatenate((self.velocities, numpy_zeros((self.capacity, 2))))
+        self.rect_positions = numpy_concatenate((self.rect_positions, numpy_zeros((self.capacity, 2), dtype = int)))
+        self.rect_sizes = numpy_concatenate((self.rect_sizes, numpy_zeros((self.capacity, 2), dtype = int)))
+        self.ages = numpy_concatenate((self.ages, numpy_zeros(self.capacity)))
+        self.creation_numbers = numpy_concatenate((self.creation_numbers, numpy_zeros(self.capacity, dtype = int)))
+        self.alive = numpy_concatenate((self.alive, numpy_zeros(self.capacity, dtype = bool)))
+        self.slot_projectiles_list.extend([None] * self.capacity)
+
+        # Add the new slots to the free slots (so that the lowest new slot is used first)
+        self.free_slots_list.extend(reversed(new_slots))
+
+        self.capacity *= 2
+
+    def find_slots_in_order(self, slots):
+
+        # Returns the slots, sorted into the order that their projectiles were added
+        return slots[numpy_argsort(self.creation_numbers[slots], kind = "stable")]
+
+    def update(self, delta_time):
+
+        # Moves all of the projectiles, removing the projectiles that have existed for too long or have left the tile map
+
+        # Reset the number of projectiles removed this frame
+        self.frame_statistics_dict["Culled"] = 0
+
+        # Nothing to move
+        if len(self.projectiles_dict) == 0:
+            self.frame_statistics_dict["Live"] = 0
+            return
+
+        # Move every projectile (empty slots have no velocity)
+        self.positions += self.velocities * delta_time
+
+        # If the tile grid has been set
+        if self.tile_grid != None:
+            # Stop fast projectiles inside the first tile along their path
+            self.find_continuous_tile_collisions(delta_time = delta_time)
+
+        # Round the positions to find the new positions of the projectiles' rects
+        self.rect_positions = numpy_rint(self.positions).astype(int)
+
+        # Increase the age of every projectile
+        self.ages += delta_time
+
+        # --------------------------------------------
+        # Culling
+
+        # Find the projectiles that have existed for longer than the maximum lifetime
+        culled = self.alive & (self.ages > self.maximum_lifetime) if self.maximum_lifetime != None else numpy_zeros(self.capacity, dtype = bool)
+
+        # If the size of the tile map has been set
+        if self.map_size != None:
+            # Find the projectiles that are completely outside of the tile map
+            culled |= self.alive & \
+                        ((self.rect_positions[:, 0] >= self.map_size[0]) | (self.rect_positions[:, 0] + self.rect_sizes[:, 0] <= 0) | \
+                        (self.rect_positions[:, 1] >= self.map_size[1]) | (self.rect_positions[:, 1] + self.rect_sizes[:, 1] <= 0))
+
+        # Remove the culled projectiles
+        for slot in numpy_flatnonzero(culled).tolist():
+            self.remove(self.slot_projectiles_list[slot])
+            self.frame_statistics_dict["Culled"] += 1
+
+        self.frame_statistics_dict["TotalCulled"] += self.frame_statistics_dict["Culled"]
+        self.frame_statistics_dict["Live"] = len(self.projectiles_dict)
+
+        # Update the rect of each projectile
+        rect_positions_list = self.rect_positions.tolist()
+        for projectile, slot in self.projectiles_dict.items():
+            projectile.rect.topleft = rect_positions_list[slot]
+
+    def find_continuous_tile_collisions(self, delta_time):
+
+        # Ray casts the path travelled during this frame by every projectile that moved far enough to pass over a tile, moving the projectile to just inside the first world / building tile along its path
+        """ Notes:
+        - Projectiles are only checked for collisions at their end-of-frame positions, so without this, a long frame (e.g. a frame-time spike) could let a projectile pass through a tile
+        - Projectiles that started the frame inside a tile are not moved (they will already be colliding with the tile)
+        """
+
+        # Find the distance travelled by every projectile this frame
+        distances_travelled = numpy_hypot(self.velocities[:, 0], self.velocities[:, 1]) * delta_time
+
+        # For each projectile that travelled at least half of a tile
+        for slot in numpy_flatnonzero(self.alive & (distances_travelled >= TILE_SIZE / 2)).tolist():
+
+            # The velocity of the projectile and the position of the projectile at the start of the frame
+            velocity_x, velocity_y = self.velocities[slot].tolist()
+            start_x = self.positions[slot][0] - (velocity_x * delta_time)
+            start_y = self.positions[slot][1] - (velocity_y * delta_time)
+
+            # Ray cast from the center of the projectile at the start of the frame, along the path of the projectile
+            hit_distance, hit_tile = self.tile_grid.cast_ray(
+                                                            start = (start_x + (self.rect_sizes[slot][0] / 2), start_y + (self.rect_sizes[slot][1] / 2)),
+                                                            angle = atan2(-velocity_y, velocity_x),
+                                                            maximum_distance = distances_travelled[slot]
+                                                            )
+
+            # If the projectile passed into a tile (after leaving the tile it started in)
+            if hit_tile != None and hit_distance > 0:
+                # Move the projectile so that its center is 1 pixel inside the tile (without moving it further than it travelled this frame)
+                distance_to_tile = min(hit_distance + 1, distances_travelled[slot])
+                self.positions[slot] = (
+                                        start_x + ((velocity_x / distances_travelled[slot]) * delta_time * distance_to_tile),
+                                        start_y + ((velocity_y / distances_travelled[slot]) * delta_time * distance_to_tile)
+                                        )
+
+    def draw(self, surface, camera_position):
+
+        # Draws all of the projectiles that are on the screen with a single batch of blits (in the order that the projectiles were added)
+
+        # Nothing to draw
+        if len(self.projectiles_dict) == 0:
+            self.frame_statistics_dict["Drawn"] = 0
+            return
+
+        # Find the positions of the projectiles on the surface
+        screen_x_positions = self.rect_positions[:, 0] - camera_position[0]
+        screen_y_positions = self.rect_positions[:, 1] - camera_position[1]
+
+        # Find the projectiles that are (at least partly) on the surface
+        visible = self.alive & \
+                    (screen_x_positions < surface.get_width()) & (screen_x_positions + self.rect_sizes[:, 0] > 0) & \
+                    (screen_y_positions < surface.get_height()) & (screen_y_positions + self.rect_sizes[:, 1] > 0)
+
+        visible_slots = self.find_slots_in_order(slots = numpy_flatnonzero(visible)).tolist()
+        self.frame_statistics_dict["Drawn"] = len(visible_slots)
+
+        # Blit all of the visible projectiles onto the surface
+        surface.blits(
+                    [(self.slot_projectiles_list[slot].image, (self.slot_projectiles_list[slot].rect.x - camera_position[0], self.slot_projectiles_list[slot].rect.y - camera_position[1])) for slot in visible_slots],
+                    doreturn = False
+                    )
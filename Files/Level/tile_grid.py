@@ -0,0 +1,249 @@
+from Global.settings import TILE_SIZE
+from pygame import Rect as pygame_Rect
+from array import array
+from math import cos, sin, floor, inf
+
+class TileHandle:
+
+    # Lightweight handle for a single "empty" cell in the tile map
+    """ Note: This is used instead of a WorldTile (pygame.sprite.Sprite) because empty tiles are never added to a sprite group, they only need a rect (for positions / rect collisions) and an image (for drawing)"""
+
+    __slots__ = ("rect", "image")
+
+    def __init__(self, x, y, image):
+
+        # The image of the tile
+        self.image = image
+
+        # The rect of the tile
+        self.rect = pygame_Rect(x, y, TILE_SIZE, TILE_SIZE)
+
+class TileGrid:
+
+    # The number stored inside the grid for each type of tile
+    # Note: World tiles keep their tile number from the tile map (i.e. 1, 2 or 3), as this is the image that the world tile uses
+    tile_type_numbers_dict = {"Empty": 0, "BuildingTile": 4, "BambooPile": 5}
+
+    def __init__(self, tile_map):
+
+        # The size of the tile map
+        self.number_of_rows = len(tile_map)
+        self.number_of_columns = len(tile_map[0])
+
+        # Compact array holding the type of tile inside of each cell (in row-major order)
+        self.cells = array("B", (tile_number for row in tile_map for tile_number in row))
+
+        # List holding the object (e.g. world tile, building tile, empty tile, bamboo pile) inside of each cell (in row-major order)
+        self.tiles_list = [None] * (self.number_of_rows * self.number_of_columns)
+
+        # List of functions called with (row, column) whenever the contents of a cell are changed (e.g. for re-baking a chunk of the tile layer renderer)
+        self.cell_changed_functions_list = []
+
+    def find_cell(self, position):
+
+        # Returns the (row, column) of the cell at the position, or None if the position is outside of the tile map
+        row = int(position[1] // TILE_SIZE)
+        column = int(position[0] // TILE_SIZE)
+
+        # If the cell is inside the tile map
+        if 0 <= row < self.number_of_rows and 0 <= column < self.number_of_columns:
+            return (row, column)
+
+        # If the cell is outside of the tile map
+        else:
+            return None
+
+    def get_tile_type(self, row, column):
+
+        # Returns the type of tile inside of the cell
+
+        tile_number = self.cells[(row * self.number_of_columns) + column]
+
+        match tile_number:
+            case 0:
+                return "Empty"
+            case 4:
+                return "BuildingTile"
+            case 5:
+                return "BambooPile"
+            case _:
+                return "WorldTile"
+
+    def get_tile(self, row, column):
+
+        # Returns the object inside of the cell
+        return self.tiles_list[(row * self.number_of_columns) + column]
+
+    def set_tile(self, tile, tile_type, tile_number = None):
+
+        # Places an object into the cell at the top-left of its rect
+        # Note: tile_number is only used for world tiles, so that the world tile's image can be identified
+
+        # Find the cell of the tile
+        row = tile.rect.y // TILE_SIZE
+        column = tile.rect.x // TILE_SIZE
+
+        # Update the cell
+        self.cells[(row * self.number_of_columns) + column] = tile_number if tile_type == "WorldTile" else TileGrid.tile_type_numbers_dict[tile_type]
+        self.tiles_list[(row * self.number_of_columns) + column] = tile
+
+        # Call the functions that need to know about cell changes
+        for cell_changed_function in self.cell_changed_functions_list:
+            cell_changed_function(row, column)
+
+    def find_world_tiles(self, rect):
+
+        # Returns a dictionary containing the world tiles and building tiles inside of the cells that the rect covers
+        """ Format:
+        {tile: "WorldTile"} or {tile: "BuildingTile"}
+
+        Notes:
+        - Only the cells that the rect covers are checked, so the cost depends only on the size of the rect rather than the number of tiles
+        - World tiles are added before building tiles, so that collidedict returns a world tile over a building tile when the rect collides with both
+        """
+
+        # Find the first and last rows and columns of cells that the rect covers (limited to the tile map)
+        first_row = max(0, rect.top // TILE_SIZE)
+        last_row = min(self.number_of_rows - 1, (rect.bottom - 1) // TILE_SIZE)
+        first_column = max(0, rect.left // TILE_SIZE)
+        last_column = min(self.number_of_columns - 1, (rect.right - 1) // TILE_SIZE)
+
+        world_tiles_dict = {}
+        building_tiles_dict = {}
+
+        # For each cell that the rect covers
+        for row in range(first_row, last_row + 1):
+            for cell_index in range((row * self.number_of_columns) + first_column, (row * self.number_of_columns) + last_column + 1):
+
+                # Identify the type of tile inside of the cell
+                match self.cells[cell_index]:
+
+                    # Building tiles
+                    case 4:
+                        building_tiles_dict[self.tiles_list[cell_index]] = "BuildingTile"
+
+                    # World tiles
+                    case _ if 1 <= self.cells[cell_index] <= 3:
+                        world_tiles_dict[self.tiles_list[cell_index]] = "WorldTile"
+
+        # Add the building tiles after the world tiles
+        world_tiles_dict.update(building_tiles_dict)
+
+        return world_tiles_dict
+
+    def find_swept_distance(self, rect, axis, distance, include_building_tiles = True):
+
+        # Sweeps the rect along an axis ("X" or "Y") through the tile grid, returning how far the rect can move (up to the distance) before its leading edge reaches the first cell holding a world / building tile
+        """ Notes:
+        - distance is a whole number of pixels (negative for moving left / up), and the returned distance has the same sign
+        - Only the cells that the leading edge of the rect passes through are checked, so the cost depends only on the size of the rect and the distance, rather than the number of tiles nearby
+        - If the rect is already overlapping a blocking cell in front of it, the rect cannot move any further into it (0 is returned)
+        - Cells outside of the tile map never block the rect (the edges of the tile map are handled by the movers themselves)
+        """
+
+        # Not moving
+        if distance == 0:
+            return 0
+
+        # The highest tile number that blocks the rect (world tiles are 1 - 3, building tiles are 4)
+        highest_blocking_tile_number = TileGrid.tile_type_numbers_dict["BuildingTile"] if include_building_tiles == True else 3
+
+        # Find the position of the leading edge of the rect and the range of cells (the "lanes") that the rect covers across the axis (limited to the tile map)
+        if axis == "X":
+            leading_edge = rect.right if distance > 0 else rect.left
+            first_lane = max(0, rect.top // TILE_SIZE)
+            last_lane = min(self.number_of_rows - 1, (rect.bottom - 1) // TILE_SIZE)
+            number_of_cells_along_axis = self.number_of_columns
+
+        elif axis == "Y":
+            leading_edge = rect.bottom if distance > 0 else rect.top
+            first_lane = max(0, rect.left // TILE_SIZE)
+            last_lane = min(self.number_of_columns - 1, (rect.right - 1) // TILE_SIZE)
+            number_of_cells_along_axis = self.number_of_rows
+
+        # Find the first and last cells along the axis that the leading edge passes through
+        if distance > 0:
+            first_cell = leading_edge // TILE_SIZE
+            last_cell = (leading_edge + distance - 1) // TILE_SIZE
+            step = 1
+        else:
+            first_cell = (leading_edge - 1) // TILE_SIZE
+            last_cell = (leading_edge + distance) // TILE_SIZE
+            step = -1
+
+        # For each cell along the axis, in the order that the leading edge reaches them
+        for cell in range(first_cell, last_cell + step, step):
+
+            # The rest of the sweep is outside of the tile map
+            if not (0 <= cell < number_of_cells_along_axis):
+                break
+
+            # For each cell across the axis that the rect covers
+            for lane in range(first_lane, last_lane + 1):
+
+                # Find the index of the cell inside the grid
+                cell_index = (lane * self.number_of_columns) + cell if axis == "X" else (cell * self.number_of_columns) + lane
+
+                # If the cell holds a blocking tile, the rect can only move up to the edge of the cell
+                if 1 <= self.cells[cell_index] <= highest_blocking_tile_number:
+                    return max(0, (cell * TILE_SIZE) - leading_edge) if distance > 0 else min(0, ((cell + 1) * TILE_SIZE) - leading_edge)
+
+        # Nothing blocks the rect
+        return distance
+
+    def cast_ray(self, start, angle, maximum_distance = None, include_building_tiles = True):
+
+        # Walks the tile grid cell by cell (DDA) from the start position along the angle, returning (distance, tile) for the first cell holding a world / building tile
+        """ Notes:
+        - The angle is measured anti-clockwise from the positive x axis (the same as the angles used for movement, i.e. x + cos(angle), y - sin(angle))
+        - If nothing is hit before the maximum distance (or the edge of the tile map if there is no maximum distance), (the distance travelled, None) is returned
+        - If the start position is inside a cell holding a blocking tile, (0, tile) is returned
+        - Only the cells that the ray passes through are looked up, so the cost depends only on the length of the ray
+        """
+
+        # The highest tile number that blocks the ray (world tiles are 1 - 3, building tiles are 4)
+        highest_blocking_tile_number = TileGrid.tile_type_numbers_dict["BuildingTile"] if include_building_tiles == True else 3
+
+        # The direction of the ray
+        direction_x = cos(angle)
+        direction_y = -sin(angle)
+
+        # The cell that the ray starts in
+        column = floor(start[0] / TILE_SIZE)
+        row = floor(start[1] / TILE_SIZE)
+
+        # The direction of the next cell along each axis, the distance along the ray to the next cell boundary along each axis, and the distance along the ray between cell boundaries along each axis
+        step_x = 1 if direction_x > 0 else -1
+        step_y = 1 if direction_y > 0 else -1
+        next_boundary_distance_x = (((column + (1 if direction_x > 0 else 0)) * TILE_SIZE) - start[0]) / direction_x if direction_x != 0 else inf
+        next_boundary_distance_y = (((row + (1 if direction_y > 0 else 0)) * TILE_SIZE) - start[1]) / direction_y if direction_y != 0 else inf
+        boundary_distance_x = TILE_SIZE / abs(direction_x) if direction_x != 0 else inf
+        boundary_distance_y = TILE_SIZE / abs(direction_y) if direction_y != 0 else inf
+
+        # The distance along the ray at which the ray entered the current cell
+        distance = 0
+
+        # Until the ray leaves the tile map
+        while 0 <= row < self.number_of_rows and 0 <= column < self.number_of_columns:
+
+            # If the ray has travelled further than the maximum distance
+            if maximum_distance != None and distance > maximum_distance:
+                return (maximum_distance, None)
+
+            # If the current cell holds a blocking tile
+            if 1 <= self.cells[(row * self.number_of_columns) + column] <= highest_blocking_tile_number:
+                return (distance, self.tiles_list[(row * self.number_of_columns) + column])
+
+            # Move into the next cell along the axis whose cell boundary is closest
+            if next_boundary_distance_x < next_boundary_distance_y:
+                distance = next_boundary_distance_x
+                next_boundary_distance_x += boundary_distance_x
+                column += step_x
+            else:
+                distance = next_boundary_distance_y
+                next_boundary_distance_y += boundary_distance_y
+                row += step_y
+
+        # The ray left the tile map without hitting anything
+        return (min(distance, maximum_distance) if maximum_distance != None else distance, None)
+
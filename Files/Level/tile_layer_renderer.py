@@ -0,0 +1,103 @@
+from Global.settings import TILE_SIZE
+from pygame import Surface as pygame_Surface
+from pygame import SRCALPHA as pygame_SRCALPHA
+from math import ceil
+
+class TileLayerRenderer:
+
+    # The number of tiles along each side of a chunk
+    chunk_size = 16
+
+    # The types of tiles drawn onto each layer
+    layer_tile_types_dict = {"World": ("WorldTile", "BuildingTile"), "Empty": ("Empty",)}
+
+    def __init__(self, surface, tile_grid):
+
+        # Surface that the chunks are drawn onto
+        self.surface = surface
+
+        # The tile grid that the chunks are baked from
+        self.tile_grid = tile_grid
+
+        # The width / height of each chunk in pixels
+        self.chunk_pixel_size = TileLayerRenderer.chunk_size * TILE_SIZE
+
+        # The number of chunks along the width and height of the tile map
+        self.number_of_chunks = (ceil(tile_grid.number_of_columns / TileLayerRenderer.chunk_size), ceil(tile_grid.number_of_rows / TileLayerRenderer.chunk_size))
+
+        # Dictionary containing the chunk surfaces of each layer
+        """ Format:
+        self.layers_dict[layer][(chunk_x, chunk_y)] = {"Surface": Surface, "Dirty": Boolean}
+
+        Notes:
+        - "World" holds the world tiles and building tiles, "Empty" holds the "empty" tiles
+        - The layers are kept separate so that the divebomb circles can be drawn over the empty tiles, but not over the walls
+        - A chunk is only re-baked (when it is next drawn) if it has been marked as dirty, i.e. a cell inside of it was changed
+        """
+        self.layers_dict = {
+                            layer: {(chunk_x, chunk_y): {"Surface": None, "Dirty": True} for chunk_y in range(0, self.number_of_chunks[1]) for chunk_x in range(0, self.number_of_chunks[0])}
+                            for layer in TileLayerRenderer.layer_tile_types_dict.keys()
+                            }
+
+        # Re-bake the chunk containing a cell whenever the cell is changed
+        self.tile_grid.cell_changed_functions_list.append(self.invalidate_cell)
+
+    def invalidate_cell(self, row, column):
+
+        # Marks the chunk that the cell is inside of as dirty in every layer, so that it is re-baked the next time it is drawn
+        for layer in self.layers_dict.keys():
+            self.layers_dict[layer][(column // TileLayerRenderer.chunk_size, row // TileLayerRenderer.chunk_size)]["Dirty"] = True
+
+    def bake_chunk(self, layer, chunk_key):
+
+        # Draws all of the tiles of the layer inside of a chunk onto the chunk's surface
+
+        chunk = self.layers_dict[layer][chunk_key]
+
+        # If the chunk does not have a surface yet, create one
+        # Note: The surface is transparent so that the cells without a tile in this layer will show what is underneath
+        if chunk["Surface"] == None:
+            chunk["Surface"] = pygame_Surface((self.chunk_pixel_size, self.chunk_pixel_size), pygame_SRCALPHA)
+
+        # Clear the surface
+        chunk["Surface"].fill((0, 0, 0, 0))
+
+        # The first row and column of the chunk
+        first_row = chunk_key[1] * TileLayerRenderer.chunk_size
+        first_column = chunk_key[0] * TileLayerRenderer.chunk_size
+
+        # For each cell inside the chunk
+        for row in range(first_row, min(first_row + TileLayerRenderer.chunk_size, self.tile_grid.number_of_rows)):
+            for column in range(first_column, min(first_column + TileLayerRenderer.chunk_size, self.tile_grid.number_of_columns)):
+
+                # If the tile inside this cell belongs to this layer
+                if self.tile_grid.get_tile_type(row, column) in TileLayerRenderer.layer_tile_types_dict[layer]:
+                    # Draw the tile at its position relative to the chunk
+                    chunk["Surface"].blit(self.tile_grid.get_tile(row, column).image, ((column - first_column) * TILE_SIZE, (row - first_row) * TILE_SIZE))
+
+        # The chunk is now up to date
+        chunk["Dirty"] = False
+
+    def draw_layer(self, layer, camera_position):
+
+        # Draws all chunks of a layer that the camera overlaps
+
+        # Find the first and last chunks that are within view of the camera (i.e. on the screen)
+        first_chunk_x = max(0, int(camera_position[0] // self.chunk_pixel_size))
+        first_chunk_y = max(0, int(camera_position[1] // self.chunk_pixel_size))
+        last_chunk_x = min(self.number_of_chunks[0] - 1, int((camera_position[0] + self.surface.get_width()) // self.chunk_pixel_size))
+        last_chunk_y = min(self.number_of_chunks[1] - 1, int((camera_position[1] + self.surface.get_height()) // self.chunk_pixel_size))
+
+        # For each chunk within view of the camera
+        for chunk_y in range(first_chunk_y, last_chunk_y + 1):
+            for chunk_x in range(first_chunk_x, last_chunk_x + 1):
+
+                # If a cell inside this chunk has been changed, re-bake the chunk
+                if self.layers_dict[layer][(chunk_x, chunk_y)]["Dirty"] == True:
+                    self.bake_chunk(layer = layer, chunk_key = (chunk_x, chunk_y))
+
+                # Draw the chunk onto the screen
+                self.surface.blit(
+                                self.layers_dict[layer][(chunk_x, chunk_y)]["Surface"],
+                                ((chunk_x * self.chunk_pixel_size) - camera_position[0], (chunk_y * self.chunk_pixel_size) - camera_position[1])
+                                )
@@ -1,7 +1,11 @@
 from Global.generic import Generic
+from Global.functions import get_mask
 
 class WorldTile(Generic):
     def __init__(self, x, y, image):
 
         # Inherit from the Generic class, which has basic attributes and methods.
-        Generic.__init__(self, x = x, y = y, image = image)
\ No newline at end of file
+        Generic.__init__(self, x = x, y = y, image = image)
+
+        # The mask of the tile for pixel - perfect collisions (all tiles with the same image share the same mask)
+        self.mask = get_mask(image = image)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from Global.settings import * 
-from Global.functions import draw_text
+from Global.functions import draw_atlas_text
 from random import randrange as random_randrange
 from pygame import Rect as pygame_Rect
 from pygame import Surface as pygame_Surface
@@ -331,7 +331,7 @@ class Button:
         pygame_draw_rect(surface = self.surface, color = self.colours["ButtonRectBorder"], rect = self.rect, width = 3)
 
         # Draw the button text onto the main surface
-        draw_text(
+        draw_atlas_text(
             text = self.purpose, 
             text_colour = self.colours["Text"], 
             font = self.text_font, 
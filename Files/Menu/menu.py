@@ -9,8 +9,8 @@ from pygame import Rect as pygame_Rect
 from pygame import quit as pygame_quit
 from pygame.mouse import set_visible as pygame_mouse_set_visible
 from pygame.draw import rect as pygame_draw_rect
-from pygame.image import load as pygame_image_load
 from Global.functions import draw_text, move_item_vertically_sin
+from Global.asset_manager import asset_manager
 
 class Menu:
     def __init__(self):
@@ -275,7 +275,7 @@ class Menu:
             if hasattr(self, "controls_menu_dict") == False:
                 # Create it
                 self.controls_menu_dict = {
-                                        "Image": pygame_image_load("graphics/Misc/ControlsDisplay.png").convert_alpha(),
+                                        "Image": asset_manager.get_image(path = "graphics/Misc/ControlsDisplay.png"),
                                         "BoxSize": (1000, 600),
                                         }
 
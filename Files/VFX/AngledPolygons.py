@@ -1,7 +1,12 @@
-from math import sqrt, radians, cos, sin
+from math import radians, cos, sin
 from random import randint as random_randint
-from pygame import Surface as pygame_Surface
 from pygame.draw import polygon as pygame_draw_polygon
+from numpy import zeros as numpy_zeros
+from numpy import flatnonzero as numpy_flatnonzero
+from numpy import sqrt as numpy_sqrt
+from numpy import abs as numpy_abs
+from numpy import concatenate as numpy_concatenate
+from numpy import argsort as numpy_argsort
 
 class AngledPolygons:
 
@@ -9,10 +14,40 @@ class AngledPolygons:
 
         self.surface = surface
 
-        # Dictionary to hold all the polygons created
-        self.polygons_dict = {}
+        # The number of polygons that can be stored before the arrays need to be made larger
+        self.capacity = 256
 
-        # Number of polygons created, used as the key for each polygon created
+        # Arrays holding the information of every polygon (each polygon is stored in the same slot of every array)
+        """
+        - points = The ordered (x, y) positions of the 4 points of the polygon
+        - gradients = The gradients / rate of change of the x and y co-ordinates based on the distance the polygon needs to travel and the time period given
+        - distance_travelled = Holds the distance travelled on the x and y axis
+        - distance_polygon_must_travel_to_disappear = The distance the polygon must travel before disappearing
+        - colour_indexes = The index of the colour of the polygon inside of self.colours_list
+        - blend_rgb_add_booleans = Whether the polygon should use BLEND_RGB_ADD
+        - creation_numbers = The number of polygons created before the polygon (so that the polygons are drawn in the order they were created, even when slots are re-used)
+        - alive = Whether the slot currently holds a polygon
+
+        Notes:
+        - The arrays are created once and made larger (doubling the capacity) only when every slot is in use
+        - The slots of polygons that have travelled the full distance are re-used by new polygons
+        """
+        self.points = numpy_zeros((self.capacity, 4, 2))
+        self.gradients = numpy_zeros((self.capacity, 2))
+        self.distance_travelled = numpy_zeros((self.capacity, 2))
+        self.distance_polygon_must_travel_to_disappear = numpy_zeros(self.capacity)
+        self.colour_indexes = numpy_zeros(self.capacity, dtype = int)
+        self.blend_rgb_add_booleans = numpy_zeros(self.capacity, dtype = bool)
+        self.creation_numbers = numpy_zeros(self.capacity, dtype = int)
+        self.alive = numpy_zeros(self.capacity, dtype = bool)
+
+        # List of the slots that do not hold a polygon (the last slot in the list is used first)
+        self.free_slots_list = list(range(self.capacity - 1, -1, -1))
+
+        # The number of polygons that currently exist
+        self.number_of_polygons = 0
+
+        # Number of polygons created, used as the creation number of each polygon created
         self.polygons_created = 0
 
         # Colour palettes for the different polygons
@@ -27,6 +62,9 @@ class AngledPolygons:
                                         
                                         }
 
+        # List containing every colour of every colour palette, and the index of each colour inside of the list
+        self.colours_list = [colour for colour_palette in self.polygons_colour_palettes.values() for colour in colour_palette]
+        self.colour_indexes_dict = {colour_palette: [self.colours_list.index(colour) for colour in self.polygons_colour_palettes[colour_palette]] for colour_palette in self.polygons_colour_palettes.keys()}
 
         # Attribute set to True whenever the user wants to switch the colour palette
         self.switch_colour_palette = False
@@ -60,19 +98,11 @@ class AngledPolygons:
                             
         ]
 
-        # Calculate the largest and smallest x and y positions
+        # Calculate the smallest x and y positions
         # Note: The lambda function is so that only the x or y positions are compared
-        largest_x_pos =  max(self.points_list, key = lambda x: x[0])[0]
         smallest_x_pos = min(self.points_list, key = lambda x: x[0])[0]
-        largest_y_pos = max(self.points_list, key = lambda x: x[1])[1]
         smallest_y_pos = min(self.points_list, key = lambda x: x[1])[1]
 
-        # The width would be the largest x pos minus the smallest x pos
-        polygon_width = largest_x_pos - smallest_x_pos
-
-        # The width would be the largest y pos minus the smallest y pos
-        polygon_height = largest_y_pos - smallest_y_pos
-
         # ------------------------------------------------------------------
         # Correcting co-ordinates so that the polygon is drawn properly onto the polygon surface
 
@@ -149,56 +179,97 @@ class AngledPolygons:
     
         # -----------------------------------------------------------------
         # Adding additional polygon functionality e.g. movement
-        # Declare the distance the polygon must travel before disappearing and the time 
-        distance_polygon_must_travel_to_disappear = distance_to_travel
 
-        """ Dictionary to store all of the polygons' information
-        - id = Used to remove the polygon from the list once it has travelled the full distance
-        - distance_travelled = Holds the distance travelled on the x and y axis
-        - gradients = The gradients / rate of change of the x and y co-ordinates based on the distance the polygon needs to travel and the time period given
-        - ordered_points_list = The ordered list of all the points of the polygon.
-        """ 
-        self.polygons_dict[self.polygons_created] = {
-            "id": self.polygons_created,
-            "distance_travelled": [0, 0],
-            "distance_polygon_must_travel_to_disappear": distance_polygon_must_travel_to_disappear,
-            "gradients": ((distance_polygon_must_travel_to_disappear * cos(angle))/ time_to_travel_distance, (distance_polygon_must_travel_to_disappear * sin(angle)) / time_to_travel_distance),
-            "colour": self.polygons_colour_palettes[colour_palette][random_randint(0, len(self.polygons_colour_palettes[colour_palette]) - 1)],
-            "polygon_surface": pygame_Surface((polygon_width, polygon_height)),
-            "ordered_points_list": self.ordered_points_list,
-            "blend_rgb_add_boolean": blend_rgb_add_boolean
-            }
-
-        # Increment the number of polygons created
+        # If every slot is in use, make the arrays larger
+        if len(self.free_slots_list) == 0:
+            self.increase_capacity()
+
+        # Take a free slot for the polygon
+        slot = self.free_slots_list.pop()
+
+        # Store the polygon's information inside of the slot
+        self.points[slot] = self.ordered_points_list
+        self.gradients[slot] = ((distance_to_travel * cos(angle)) / time_to_travel_distance, (distance_to_travel * sin(angle)) / time_to_travel_distance)
+        self.distance_travelled[slot] = (0, 0)
+        self.distance_polygon_must_travel_to_disappear[slot] = distance_to_travel
+        self.colour_indexes[slot] = self.colour_indexes_dict[colour_palette][random_randint(0, len(self.polygons_colour_palettes[colour_palette]) - 1)]
+        self.blend_rgb_add_booleans[slot] = blend_rgb_add_boolean == True
+        self.creation_numbers[slot] = self.polygons_created
+        self.alive[slot] = True
+
+        # Increment the number of polygons and the number of polygons created
+        self.number_of_polygons += 1
         self.polygons_created += 1
 
-    def draw(self, delta_time, camera_position):     
-        
-        # Loop through the dictionary of each polygon
-        for polygon_points_dict in self.polygons_dict.copy().values():
-            
-            # If the polygon has not travelled the complete distance
-            if sqrt((polygon_points_dict["distance_travelled"][0] ** 2) + (polygon_points_dict["distance_travelled"][1] ** 2)) < polygon_points_dict["distance_polygon_must_travel_to_disappear"]:
-
-                # For all points inside the ordered polygon points list
-                for i in range(0, len(polygon_points_dict["ordered_points_list"])):
-                    # Increasing the x position of the polygon
-                    polygon_points_dict["ordered_points_list"][i][0] += polygon_points_dict["gradients"][0] * delta_time
-                    # Increasing the y position of the polygon
-                    polygon_points_dict["ordered_points_list"][i][1] -= polygon_points_dict["gradients"][1] * delta_time
-
-                # Increase the distance travelled by the entire polygon
-                polygon_points_dict["distance_travelled"][0] += abs(polygon_points_dict["gradients"][0] * delta_time)
-                polygon_points_dict["distance_travelled"][1] += abs(polygon_points_dict["gradients"][1] * delta_time)
-
-                # Create a generator for the polygon points, minus the camera position (Where the polygon will be drawn) 
-                # Note: This is converted into a tuple to save memory
-                camera_polygon_points = ([polygon_points_dict["ordered_points_list"][i][0] - camera_position[0], polygon_points_dict["ordered_points_list"][i][1] - camera_position[1] ] for i in range(0, len(polygon_points_dict["ordered_points_list"])))
-
-                # Draw the polygon onto the angled polygons surface
-                pygame_draw_polygon(surface = self.surface, color = polygon_points_dict["colour"], points = tuple(camera_polygon_points))
-
-            # If the polygon has travelled the complete distance
-            else:
-                # Delete the polygon from the polygons dictionary
-                self.polygons_dict.pop(polygon_points_dict["id"])
\ No newline at end of file
+    def increase_capacity(self):
+
+        # Doubles the number of slots inside of the arrays, keeping the existing polygons in the same slots
+
+        # The new slots start after the existing slots
+        new_slots = range(self.capacity, self.capacity * 2)
+
+        self.points = numpy_concatenate((self.points, numpy_zeros((self.capacity, 4, 2))))
+        self.gradients = numpy_concatenate((self.gradients, numpy_zeros((self.capacity, 2))))
+        self.distance_travelled = numpy_concatenate((self.distance_travelled, numpy_zeros((self.capacity, 2))))
+        self.distance_polygon_must_travel_to_disappear = numpy_concatenate((self.distance_polygon_must_travel_to_disappear, numpy_zeros(self.capacity)))
+        self.colour_indexes = numpy_concatenate((self.colour_indexes, numpy_zeros(self.capacity, dtype = int)))
+        self.blend_rgb_add_booleans = numpy_concatenate((self.blend_rgb_add_booleans, numpy_zeros(self.capacity, dtype = bool)))
+        self.creation_numbers = numpy_concatenate((self.creation_numbers, numpy_zeros(self.capacity, dtype = int)))
+        self.alive = numpy_concatenate((self.alive, numpy_zeros(self.capacity, dtype = bool)))
+
+        # Add the new slots to the free slots (so that the lowest new slot is used first)
+        self.free_slots_list.extend(reversed(new_slots))
+
+        self.capacity *= 2
+
+    def reset_polygons(self):
+
+        # Removes all of the polygons (e.g. when the game is over)
+        self.alive[:] = False
+        self.free_slots_list = list(range(self.capacity - 1, -1, -1))
+        self.number_of_polygons = 0
+        self.polygons_created = 0
+
+    def draw(self, delta_time, camera_position):
+
+        # Moves all of the polygons, removes the polygons that have travelled the complete distance and draws the rest onto the surface
+
+        # The slots of all of the polygons, in the order that the polygons were created
+        live_slots = numpy_flatnonzero(self.alive)
+        live_slots = live_slots[numpy_argsort(self.creation_numbers[live_slots], kind = "stable")]
+
+        # Find which polygons have not travelled the complete distance
+        not_finished = numpy_sqrt((self.distance_travelled[live_slots, 0] ** 2) + (self.distance_travelled[live_slots, 1] ** 2)) < self.distance_polygon_must_travel_to_disappear[live_slots]
+
+        # --------------------------------------------
+        # Removing the polygons that have travelled the complete distance
+
+        finished_slots = live_slots[~not_finished]
+        self.alive[finished_slots] = False
+        self.free_slots_list.extend(finished_slots.tolist())
+        self.number_of_polygons -= len(finished_slots)
+
+        # --------------------------------------------
+        # Moving the remaining polygons
+
+        moving_slots = live_slots[not_finished]
+
+        # The change in the x and y positions of each polygon this frame
+        position_changes = self.gradients[moving_slots] * delta_time
+
+        # Increase the x positions and decrease the y positions of all 4 points of each polygon
+        self.points[moving_slots, :, 0] += position_changes[:, 0:1]
+        self.points[moving_slots, :, 1] -= position_changes[:, 1:2]
+
+        # Increase the distance travelled by each polygon
+        self.distance_travelled[moving_slots] += numpy_abs(position_changes)
+
+        # --------------------------------------------
+        # Drawing the polygons
+
+        # The points of each polygon, minus the camera position (where the polygons will be drawn)
+        camera_polygons_points_list = (self.points[moving_slots] - (camera_position[0], camera_position[1])).tolist()
+
+        # Draw each polygon onto the angled polygons surface
+        for polygon_points, colour_index in zip(camera_polygons_points_list, self.colour_indexes[moving_slots].tolist()):
+            pygame_draw_polygon(surface = self.surface, color = self.colours_list[colour_index], points = polygon_points)
@@ -17,10 +17,13 @@ from sys import exit as sys_exit
 from Global.settings import screen_width, screen_height
 from Menu.menu import Menu
 from Level.game import Game
+from Level.level_pack import load_tile_map
+from Global.asset_manager import asset_manager
+from Global.asset_loader import AssetLoader
 from pygame.draw import rect as pygame_draw_rect
 
 class GameStatesController():
-    def __init__(self):
+    def __init__(self, start_time):
 
         # Screen
         # Set the screen to be full screen 
@@ -28,9 +31,16 @@ class GameStatesController():
 
         self.full_screen = True
 
+        # Asset loading
+        # Start decoding the game's images and sounds on worker threads, so that the menu can be shown while they are loading
+        self.asset_loader = AssetLoader(asset_manager = asset_manager, start_time = start_time)
+
+        # The height of the progress bar shown at the bottom of the menus while the assets are loading
+        self.loading_bar_height = 6
+
         # Game states
         self.menu = Menu()
-        self.game = Game() # The actual level
+        self.game = None # The actual level (created when the level is first loaded, as it needs the sounds decoded by the asset loader)
         
         # Attribute so that we only load the level once, and not every frame
         self.level_loaded = False
@@ -74,51 +84,22 @@ class GameStatesController():
         if self.level_loaded == False:
 
             # ------------------------------------------------------------------------
-            # Loading the tile map from the level tile maps text file
-
-            # Open the text file which holds 
-            with open("Files/Level/level_tile_maps.txt", "r") as level_tile_maps_file:
-                
-                for line_number, tile_map in enumerate(level_tile_maps_file.readlines()):
-                    # If the line number is equal to the chosen level minus one (This is because the tile maps are zero indexed in order)
-                    if line_number == (chosen_level_number - 1):
-                        # [1:-1] to get rid of the "?" separator and the "\n" line break for each tile map
-                        tile_map_to_convert = tile_map[1:-1]
-
-            # ----------------------------------------------------------------------------------------
-            # Convert the tile map into a series of tile numbers, so that inside the level, we can create objects 
-
-
-            non_transformed_tile_map = [] # Holds the tile map of the tile's numbers
-            tile_number = "" # Used as some tiles may have double digit tile numbers
-            row_of_tiles_list = [] # Used to hold all the tiles in one row
+            # Creating the game
 
-            # For all characters in the tile map
-            for i in range(0, len(tile_map_to_convert)):
-                
-                # Identify what the character is
-                match tile_map_to_convert[i]:
-
-                    # Comma separator
-                    case ",":
-                    
-                        # Add the row of tiles to the final tile map
-                        non_transformed_tile_map.append(row_of_tiles_list)
-
-                        # Empty the row of tiles list
-                        row_of_tiles_list = []
+            # If the game has not been created yet
+            if self.game == None:
+                # Wait for the assets to finish loading (this only waits if the player clicked "Play" before the loading had completed)
+                self.asset_loader.wait()
 
-                    # Exclamation mark separator
-                    case "!":
-                        # Add the tile number to the row of tiles 
-                        row_of_tiles_list.append(int(tile_number))
+                # Create the game with the decoded sounds
+                self.game = Game(sounds_dict = self.asset_loader.get_sounds())
 
-                        # Reset the tile number
-                        tile_number = ""
+            # ------------------------------------------------------------------------
+            # Loading the tile map from the level pack
 
-                    # If it is neither a comma separator or an exclamation mark separator
-                    case _: # Can also be "case other"
-                        tile_number += tile_map_to_convert[i]
+            # Load the tile map of the chosen level as a series of tile numbers, so that inside the level, we can create objects
+            # Note: The level pack is compiled from the level tile maps text file (by running Files/Level/level_pack.py), so the text file does not need to be parsed when loading a level
+            non_transformed_tile_map = load_tile_map(level_number = chosen_level_number)
 
             # Create the level's object tile map, which is a tile map consisting of the objects (the actual game tile map)
             self.game.create_objects_tile_map(non_transformed_tile_map)
@@ -170,7 +151,8 @@ class GameStatesController():
                     # ------------------------------------------------------------
                     # In-game / Level events
 
-                    if self.menu.current_menu == "game":
+                    # Note: The game may not have been created yet on the first frame after transitioning to the game (as the level is loaded after the event loop)
+                    if self.menu.current_menu == "game" and self.game != None:
                         
                         # Find which key was pressed
                         match event.key:
@@ -221,7 +203,7 @@ class GameStatesController():
         # Detects for game state transitions
         
         # If the player has died (Transition from the game to the restart menu) and the transition has not started
-        if self.game.game_over == True and self.menu.current_menu != "restart_menu" and self.bar_transition_timer == None:
+        if self.game != None and self.game.game_over == True and self.menu.current_menu != "restart_menu" and self.bar_transition_timer == None:
 
             # Show the mouse cursor
             pygame_mouse_set_visible(True)
@@ -250,7 +232,7 @@ class GameStatesController():
         """ Note: the self.menu.current_menu == "main_menu" check is so that the following only occurs once (as the player can spam click the exit session button, resulting in multiple resets)
         - Therefore by only resetting it once the player is back in the main menu, that issue can be prevented
         """
-        if (self.game.game_over == True and self.menu.current_menu == "main_menu") or (self.menu.session_exit == True and self.menu.current_menu == "main_menu"):
+        if self.game != None and ((self.game.game_over == True and self.menu.current_menu == "main_menu") or (self.menu.session_exit == True and self.menu.current_menu == "main_menu")):
 
             # Reset the player's attributes
             self.game.player.reset_player()
@@ -350,6 +332,40 @@ class GameStatesController():
                 self.transition_where = "Nothing"
                 self.menu.transition_to_which_menu = "Nothing"
 
+    def draw_loading_progress(self):
+
+        # Draws a progress bar at the bottom of the screen while the asset loader is still loading
+
+        # If the loading has completed
+        if self.asset_loader.completion_future.done() == True:
+            return
+
+        # Background of the progress bar
+        pygame_draw_rect(
+            surface = self.surface,
+            color = (60, 60, 60),
+            rect = (
+                    0,
+                    self.surface.get_height() - self.loading_bar_height,
+                    self.surface.get_width(),
+                    self.loading_bar_height
+                    ),
+            width = 0
+            )
+
+        # Progress of the loading
+        pygame_draw_rect(
+            surface = self.surface,
+            color = (113, 179, 64),
+            rect = (
+                    0,
+                    self.surface.get_height() - self.loading_bar_height,
+                    self.surface.get_width() * self.asset_loader.find_progress(),
+                    self.loading_bar_height
+                    ),
+            width = 0
+            )
+
     def run(self, delta_time):
         
         # Run the event loop
@@ -377,5 +393,8 @@ class GameStatesController():
             # Run the menus
             self.menu.run(delta_time)
 
+            # Draw the loading progress of the assets (if the loading has not completed)
+            self.draw_loading_progress()
+
         # Performs the transition between game states (i.e. changes between the menu and draws the transition)
         self.perform_transition(delta_time = delta_time)
\ No newline at end of file
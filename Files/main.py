@@ -11,6 +11,9 @@ from pygame.mixer import init as pygame_mixer_init
 class Main:
     def __init__(self):
 
+        # Record the time that the game was started (used to measure the time to the first frame and the time until the game is interactive)
+        self.start_time = perf_counter()
+
         # Sound
         pygame_mixer_pre_init(44100, -16, 2, 512)
         pygame_mixer_init()
@@ -22,7 +25,7 @@ class Main:
         pygame_display_set_caption("A Panda's Wit")
         
         # Create a game states controller
-        self.game_states_controller = GameStatesController()
+        self.game_states_controller = GameStatesController(start_time = self.start_time)
 
         # Times
         # Record the previous frame that was played
@@ -50,6 +53,10 @@ class Main:
             # -------------------------------------
             # Update display
             pygame_display_update() 
+
+            # Record the loading times, reporting them once the game's assets have finished loading
+            if self.game_states_controller.asset_loader.update() == True:
+                print(self.game_states_controller.asset_loader.create_report())
             
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+from pygame import init as pygame_init
+from pygame import HIDDEN as pygame_HIDDEN
+from pygame.display import set_mode as pygame_display_set_mode
+from pygame.mask import from_surface as pygame_mask_from_surface
+from time import perf_counter
+
+# Benchmark comparing change_image_colour_v2 against the per-pixel loop that it replaced, on the golden monkey frames (run from the folder that the game is run from, the same as main.py, e.g. "python Files/silhouette_benchmark.py")
+
+# The folder holding the golden monkey's animations, and the colour of the golden monkey's silhouettes
+GOLDEN_MONKEY_FOLDER = "graphics/Bosses/GoldenMonkey"
+SILHOUETTE_COLOUR = (0, 0, 0)
+
+# The number of times each frame is turned into a silhouette by each function
+NUMBER_OF_REPEATS = 20
+
+def change_image_colour_per_pixel(current_animation_image, desired_colour):
+
+    # The previous version of change_image_colour_v2, which changes the colour of each pixel one at a time
+
+    # Create a copy of the image (So that you don't overwrite the original)
+    changed_image = current_animation_image.copy().convert_alpha()
+
+    # For each row
+    for i in range(0, changed_image.get_width()):
+        # For each column
+        for j in range(0, changed_image.get_height()):
+
+            # If the pixel is not fully transparent
+            if changed_image.get_at((i, j)).a != 0:
+                # Set the pixel as the desired colour
+                changed_image.set_at((i, j), (desired_colour[0], desired_colour[1], desired_colour[2], 255))
+
+    # Return the changed image
+    return changed_image
+
+def find_mismatched_pixels(silhouette, other_silhouette):
+
+    # Returns the number of pixels that are visible in one silhouette but not the other, or visible in both but with different colours
+    # Note: Fully transparent pixels are not compared by colour (the per-pixel loop keeps the colour of the original pixel, whereas the mask version uses (0, 0, 0, 0))
+
+    mismatched_pixels = 0
+
+    for i in range(0, silhouette.get_width()):
+        for j in range(0, silhouette.get_height()):
+            pixel_colour = silhouette.get_at((i, j))
+            other_pixel_colour = other_silhouette.get_at((i, j))
+
+            if (pixel_colour.a != 0) != (other_pixel_colour.a != 0) or (pixel_colour.a != 0 and pixel_colour != other_pixel_colour):
+                mismatched_pixels += 1
+
+    return mismatched_pixels
+
+def time_silhouettes(change_colour_function, images):
+
+    # Returns the average time (in seconds) taken by the function to create the silhouette of one image
+    start_time = perf_counter()
+    for i in range(0, NUMBER_OF_REPEATS):
+        for image in images:
+            change_colour_function(current_animation_image = image, desired_colour = SILHOUETTE_COLOUR)
+
+    return (perf_counter() - start_time) / (NUMBER_OF_REPEATS * len(images))
+
+if __name__ == "__main__":
+
+    # Converting images needs a display (which is hidden)
+    pygame_init()
+    pygame_display_set_mode((1, 1), pygame_HIDDEN)
+
+    # Imported after the display has been created, as the asset manager converts the images that it loads
+    from Global.asset_manager import asset_manager
+    from Global.functions import change_image_colour_v2
+
+    # Load every frame of the golden monkey's animations
+    images = [
+            asset_manager.get_image(path = path)
+            for folder in sorted(asset_manager.folders_dict.keys()) if folder.startswith(GOLDEN_MONKEY_FOLDER.lower() + "/")
+            for path in asset_manager.find_paths(folder = folder)
+            ]
+
+    # Check that both functions create the same silhouettes
+    mismatched_images = 0
+    for image in images:
+        silhouette = change_image_colour_v2(current_animation_image = image, desired_colour = SILHOUETTE_COLOUR)
+        per_pixel_silhouette = change_image_colour_per_pixel(current_animation_image = image, desired_colour = SILHOUETTE_COLOUR)
+
+        if find_mismatched_pixels(silhouette = silhouette, other_silhouette = per_pixel_silhouette) > 0 or pygame_mask_from_surface(silhouette, 0).count() != pygame_mask_from_surface(image, 0).count():
+            mismatched_images += 1
+
+    if mismatched_images > 0:
+        raise SystemExit(f"{mismatched_images} / {len(images)} silhouette(s) do not match the per-pixel loop")
+
+    # Time both functions
+    per_pixel_time = time_silhouettes(change_colour_function = change_image_colour_per_pixel, images = images)
+    mask_time = time_silhouettes(change_colour_function = change_image_colour_v2, images = images)
+
+    print(f"Compared {len(images)} golden monkey frame(s) ({images[0].get_width()}x{images[0].get_height()}), all silhouettes match")
+    print(f"Per-pixel loop: {per_pixel_time * 1000000:.0f} us per frame")
+    print(f"change_image_colour_v2: {mask_time * 1000000:.0f} us per frame ({per_pixel_time / mask_time:.1f}x faster)")